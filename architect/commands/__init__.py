@@ -20,7 +20,7 @@ from ..exceptions import (
 commands = {}
 
 for _, name, __ in pkgutil.iter_modules([os.path.dirname(__file__)]):
-    commands[name] = {'module': __import__(name, globals(), level=1)}
+    commands[name.replace('_', '-')] = {'module': __import__(name, globals(), level=1)}
 
 sys.path.append(os.getcwd())
 
@@ -84,7 +84,7 @@ def main():
     # Starting from Python 3.3 the check for empty arguments was removed
     # from argparse for some strange reason, so we have to emulate it here
     try:
-        command = args.func.__module__.split('.')[-1]
+        command = args.func.__module__.split('.')[-1].replace('_', '-')
     except AttributeError:
         parser.error('too few arguments')
     else:
@@ -0,0 +1,201 @@
+"""
+Migrate data command implementation.
+"""
+
+import os
+import json
+import multiprocessing
+
+from .. import orms
+from ..compat import text_type, Empty
+from ..exceptions import ImportProblemError
+
+arguments = [
+    {('-m', '--module'): {
+        'dest': 'module',
+        'required': True,
+        'help': 'path to the module with partitioned models'
+    }},
+    {('-b', '--batch-size'): {
+        'dest': 'batch_size',
+        'type': int,
+        'default': 10000,
+        'help': 'number of rows moved by a single statement, 10000 by default'
+    }},
+    {('-d', '--delay'): {
+        'dest': 'delay',
+        'type': float,
+        'default': 0,
+        'help': 'number of seconds to wait between batches, 0 by default'
+    }},
+    {('-c', '--checkpoint'): {
+        'dest': 'checkpoint',
+        'help': 'path to the file where progress is saved, so that interrupted migration can be resumed'
+    }},
+    {('-w', '--workers'): {
+        'dest': 'workers',
+        'type': int,
+        'default': 1,
+        'help': 'number of worker processes which move primary key ranges in parallel, 1 by default'
+    }}
+]
+
+
+def run(args):
+    """
+    Moves rows which were saved before partitioning was set up into partitions for partitioned
+    models from specified module.
+
+    :param dictionary args: (required). Dictionary of command arguments.
+    """
+    names = []
+    module = args['module'][:-3] if args['module'].endswith('.py') else args['module']
+    checkpoint = Checkpoint(args['checkpoint'])
+
+    try:
+        module_clss = filter(lambda obj: isinstance(obj, type), __import__(module, fromlist=module).__dict__.values())
+    except ImportError as e:
+        raise ImportProblemError(str(e))
+
+    for cls in module_clss:
+        if hasattr(cls, 'architect') and hasattr(cls.architect, 'partition'):
+            ranges = checkpoint.get(cls.__name__) or cls.architect.partition.get_partition().migrate_ranges(
+                args['workers'])
+            checkpoint.update(cls.__name__, ranges)
+
+            if len(ranges) == 1:
+                count = migrate(module, cls.__name__, 0, ranges[0], args['batch_size'], args['delay'], checkpoint)
+            else:
+                count = migrate_parallel(module, cls.__name__, ranges, args['batch_size'], args['delay'], checkpoint)
+
+            checkpoint.update(cls.__name__, None)
+            names.append('{0} ({1})'.format(cls.__name__, count))
+
+    if not names:
+        return 'unable to find any partitionable models in a module: {0}'.format(module)
+    else:
+        return 'successfully moved rows into partitions for the following models: {0}'.format(', '.join(names))
+
+
+def migrate(module, name, index, bounds, batch_size, delay, progress):
+    """
+    Moves rows of the given primary key range for the given model, reports progress after every batch.
+
+    :param string module: (required). Path to the module with the model.
+    :param string name: (required). Name of the model.
+    :param integer index: (required). Number of the primary key range.
+    :param list bounds: (required). Primary key range, see migrate_ranges partition method.
+    :param integer batch_size: (required). Number of rows moved by a single statement.
+    :param float delay: (required). Number of seconds to wait between batches.
+    :param object progress: (required). Checkpoint or queue to report progress to.
+    """
+    cls = getattr(__import__(module, fromlist=module), name)
+    return cls.architect.partition.get_partition().migrate(
+        batch_size=batch_size,
+        after=bounds[0],
+        until=bounds[1],
+        delay=delay,
+        callback=lambda after: progress.put((name, index, after)))
+
+
+def migrate_worker(*args):
+    """
+    Runs migrate function in a worker process, which has to initialize ORMs by itself.
+    """
+    orms.init()
+    return migrate(*args)
+
+
+def migrate_parallel(module, name, ranges, batch_size, delay, checkpoint):
+    """
+    Moves rows of every primary key range for the given model in a separate worker process. Workers are
+    started from scratch, so that they don't share database connections with this process, and report
+    their progress via queue, so that checkpoint is saved only by this process.
+
+    :param string module: (required). Path to the module with the model.
+    :param string name: (required). Name of the model.
+    :param list ranges: (required). Primary key ranges, see migrate_ranges partition method.
+    :param integer batch_size: (required). Number of rows moved by a single statement.
+    :param float delay: (required). Number of seconds to wait between batches.
+    :param object checkpoint: (required). Checkpoint to save progress to.
+    """
+    context = multiprocessing.get_context('spawn') if hasattr(multiprocessing, 'get_context') else multiprocessing
+    manager = context.Manager()
+    queue = manager.Queue()
+    pool = context.Pool(len(ranges))
+
+    try:
+        results = [pool.apply_async(migrate_worker, (module, name, index, bounds, batch_size, delay, queue))
+                   for index, bounds in enumerate(ranges)]
+
+        while not all(result.ready() for result in results) or not queue.empty():
+            try:
+                checkpoint.put(queue.get(timeout=1))
+            except Empty:
+                pass
+
+        return sum(result.get() for result in results)
+    finally:
+        pool.terminate()
+        manager.shutdown()
+
+
+class Checkpoint(object):
+    """
+    Keeps primary key ranges which are left to move for every model in a JSON file, so that interrupted
+    migration can be resumed. Progress is only kept in memory if the file is not set.
+    """
+    def __init__(self, path):
+        """
+        :param string path: (optional). Path to the checkpoint file.
+        """
+        self.path = path
+        self.ranges = {}
+
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                self.ranges = json.load(f)
+
+    def get(self, name):
+        """
+        Returns primary key ranges which are left to move for the given model.
+
+        :param string name: (required). Name of the model.
+        """
+        return self.ranges.get(name)
+
+    def put(self, progress):
+        """
+        Saves progress reported after a batch of rows was moved.
+
+        :param tuple progress: (required). Name of the model, number of the range and the last moved primary key.
+        """
+        name, index, after = progress
+        self.ranges[name][index][0] = after
+        self.save()
+
+    def update(self, name, ranges):
+        """
+        Replaces primary key ranges for the given model, None removes the model from the checkpoint.
+
+        :param string name: (required). Name of the model.
+        :param list ranges: (required). Primary key ranges.
+        """
+        if ranges is None:
+            self.ranges.pop(name, None)
+        else:
+            self.ranges[name] = ranges
+
+        self.save()
+
+    def save(self):
+        """
+        Atomically writes checkpoint file.
+        """
+        if self.path is None:
+            return
+
+        with open('{0}.tmp'.format(self.path), 'w') as f:
+            json.dump(self.ranges, f, default=text_type)
+
+        os.rename('{0}.tmp'.format(self.path), self.path)
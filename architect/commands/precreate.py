@@ -0,0 +1,84 @@
+"""
+Precreate command implementation.
+"""
+
+import re
+import argparse
+import datetime
+
+from ..exceptions import ImportProblemError, PartitionRangeSubtypeError
+
+
+def ahead(value):
+    """
+    Converts lookahead window into precreate arguments, either number of periods, e.g. 3,
+    or duration in hours, days or weeks, e.g. 12h, 7d, 2w.
+
+    :param string value: (required). Lookahead window.
+    """
+    match = re.match(r'^(\d+)([hdw]?)$', value)
+
+    if match is None:
+        raise argparse.ArgumentTypeError('invalid lookahead window: {0}, examples are: 3, 12h, 7d, 2w'.format(value))
+
+    number, unit = int(match.group(1)), match.group(2)
+
+    if not unit:
+        return {'periods': number}
+
+    units = {'h': 'hours', 'd': 'days', 'w': 'weeks'}
+    return {'until': datetime.datetime.now() + datetime.timedelta(**{units[unit]: number})}
+
+
+arguments = [
+    {('-m', '--module'): {
+        'dest': 'module',
+        'required': True,
+        'help': 'path to the module with partitioned models'
+    }},
+    {('-a', '--ahead'): {
+        'dest': 'ahead',
+        'type': ahead,
+        'default': '1',
+        'help': 'number of periods or duration (e.g. 7d) to create partitions for, 1 period by default'
+    }}
+]
+
+
+def run(args):
+    """
+    Creates partitions in advance for partitioned models from specified module. Models which can't
+    create partitions for the requested lookahead window are skipped.
+
+    :param dictionary args: (required). Dictionary of command arguments.
+    """
+    names = []
+    skipped = []
+    module = args['module'][:-3] if args['module'].endswith('.py') else args['module']
+
+    try:
+        module_clss = filter(lambda obj: isinstance(obj, type), __import__(module, fromlist=module).__dict__.values())
+    except ImportError as e:
+        raise ImportProblemError(str(e))
+
+    for cls in module_clss:
+        if hasattr(cls, 'architect') and hasattr(cls.architect, 'partition'):
+            try:
+                partitions = cls.architect.partition.precreate(**args['ahead'])
+            except PartitionRangeSubtypeError as e:
+                skipped.append('{0} ({1})'.format(cls.__name__, e))
+                continue
+
+            names.append('{0} ({1})'.format(cls.__name__, len(partitions)))
+
+    if not names and not skipped:
+        return 'unable to find any partitionable models in a module: {0}'.format(module)
+
+    messages = []
+
+    if names:
+        messages.append('successfully created partitions for the following models: {0}'.format(', '.join(names)))
+    if skipped:
+        messages.append('skipped the following models: {0}'.format(', '.join(skipped)))
+
+    return '; '.join(messages)
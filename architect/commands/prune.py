@@ -0,0 +1,49 @@
+"""
+Prune command implementation.
+"""
+
+from ..exceptions import ImportProblemError
+
+arguments = [
+    {('-m', '--module'): {
+        'dest': 'module',
+        'required': True,
+        'help': 'path to the module with partitioned models'
+    }},
+    {('-n', '--dry-run'): {
+        'dest': 'dry_run',
+        'action': 'store_true',
+        'help': 'only show partitions which would be removed'
+    }}
+]
+
+
+def run(args):
+    """
+    Removes expired partitions for partitioned models from specified module.
+
+    :param dictionary args: (required). Dictionary of command arguments.
+    """
+    names = []
+    module = args['module'][:-3] if args['module'].endswith('.py') else args['module']
+
+    try:
+        module_clss = filter(lambda obj: isinstance(obj, type), __import__(module, fromlist=module).__dict__.values())
+    except ImportError as e:
+        raise ImportProblemError(str(e))
+
+    for cls in module_clss:
+        if hasattr(cls, 'architect') and hasattr(cls.architect, 'partition'):
+            if args['dry_run']:
+                partitions = cls.architect.partition.get_partition().expired()
+            else:
+                partitions = cls.architect.partition.prune()
+
+            names.append('{0} ({1})'.format(cls.__name__, ', '.join(partitions) or 'none'))
+
+    if not names:
+        return 'unable to find any partitionable models in a module: {0}'.format(module)
+    elif args['dry_run']:
+        return 'the following partitions would be removed: {0}'.format(', '.join(names))
+    else:
+        return 'successfully removed partitions for the following models: {0}'.format(', '.join(names))
@@ -8,9 +8,11 @@ py2 = sys.version_info[0] == 2
 py3 = sys.version_info[0] == 3
 
 if py2:
-    pass
+    text_type = unicode  # noqa
+    from Queue import Empty  # noqa
 elif py3:
-    pass
+    text_type = str
+    from queue import Empty  # noqa
 
 
 def with_metaclass(meta, *bases):
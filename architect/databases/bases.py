@@ -2,6 +2,10 @@
 Defines base classes used in databases module.
 """
 
+import copy
+
+from .utilities import PartitionCache
+
 
 class BasePartition(object):
     """
@@ -19,6 +23,9 @@ class BasePartition(object):
         self.column_value = meta['column_value']
         self.column_name = meta['column']
         self.pks = meta['pk'] if isinstance(meta['pk'], list) else [meta['pk']]
+        self.cache = meta.get('cache') or PartitionCache(ttl=0)
+        self.retention = meta.get('retention')
+        self.retention_action = meta.get('retention_action', 'drop')
 
     def prepare(self):
         """
@@ -37,3 +44,188 @@ class BasePartition(object):
         Creates new partition.
         """
         raise NotImplementedError('Method "create" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def precreate(self, until=None, periods=1):
+        """
+        Creates partitions in advance, starting from the one for the current value and either up to the
+        one for the given value or for the given number of periods. Returns names of the created partitions.
+
+        :param object until: (optional). Value which should be covered by the partitions.
+        :param integer periods: (optional). Number of partitions that follow the current one.
+        """
+        return self.create_missing(self._get_upcoming_values(until, periods))
+
+    def create_missing(self, values):
+        """
+        Creates partitions for the given column values, e.g. for a batch of rows, if they don't exist.
+        Returns names of the created partitions.
+
+        :param iterable values: (required). Column values to create partitions for.
+        """
+        names = []
+
+        for value in values:
+            partition = copy.copy(self)
+            partition.column_value = value
+
+            if partition._get_name() not in names and partition._ensure():
+                names.append(partition._get_name())
+
+        return names
+
+    def names(self):
+        """
+        Returns names of all existing partitions using a single catalog query.
+        """
+        raise NotImplementedError('Method "names" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def expired(self):
+        """
+        Returns names of the partitions which hold only values that are older than the retention
+        option allows, ordered from the oldest one.
+        """
+        if self.retention is None:
+            return []
+
+        partition = copy.copy(self)
+        partition.column_value = None
+        cutoff = self._get_value_order(self._get_retention_value())
+
+        return [name for name in self._get_ordered_names()
+                if name != partition._get_name() and self._get_order(name) < cutoff]
+
+    def children(self, start=None, end=None):
+        """
+        Returns names of the existing partitions which may hold column values from start to end inclusively,
+        ordered by their values. Names are computed from the partition naming scheme, so that queries can target
+        only these partitions. Rows which are stored outside of them, e.g. in the default partition, aren't covered.
+
+        :param object start: (optional). The lowest column value, no limit by default.
+        :param object end: (optional). The highest column value, no limit by default.
+        """
+        lowest, highest = [None if value is None else self._get_value_order(value) for value in (start, end)]
+
+        return [name for name in self._get_ordered_names()
+                if (lowest is None or self._get_order(name) >= lowest)
+                and (highest is None or self._get_order(name) <= highest)]
+
+    def children_query(self, start=None, end=None, columns='*'):
+        """
+        Returns query which selects rows with column values from start to end inclusively only from the
+        partitions which may hold them, so that the database doesn't have to consider all partitions.
+
+        :param object start: (optional). The lowest column value, no limit by default.
+        :param object end: (optional). The highest column value, no limit by default.
+        :param string columns: (optional). Columns to select, all columns by default.
+        """
+        raise NotImplementedError('Method "children_query" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def prune(self):
+        """
+        Removes expired partitions depending on the retention action. Returns names of the removed partitions.
+        """
+        raise NotImplementedError('Method "prune" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def migrate(self, batch_size=10000, after=None, until=None, delay=0, callback=None):
+        """
+        Moves rows which were saved before partitioning was set up into partitions in batches paginated
+        by the primary key. Returns number of moved rows.
+
+        :param integer batch_size: (optional). Number of rows moved by a single statement.
+        :param list after: (optional). Primary key values of the row to continue after.
+        :param list until: (optional). Primary key values of the last row to move.
+        :param float delay: (optional). Number of seconds to wait between batches to throttle the load.
+        :param function callback: (optional). Called with primary key values of the last moved row after every batch.
+        """
+        raise NotImplementedError('Method "migrate" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def migrate_ranges(self, count):
+        """
+        Splits rows which have to be moved into the given number of primary key ranges, which can be moved in parallel.
+
+        :param integer count: (required). Number of ranges.
+        """
+        raise NotImplementedError('Method "migrate_ranges" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def copy(self, columns, rows):
+        """
+        Copies rows straight into partitions using the fastest bulk loading mechanism available.
+
+        :param list columns: (required). Names of the columns to copy.
+        :param list rows: (required). Dictionaries which map column names to values.
+        """
+        raise NotImplementedError('Method "copy" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def _exists_cached(self, key, lookup):
+        """
+        Checks partition existence via cache, which is filled with all existing partitions on first check,
+        database is asked only if partition isn't cached, e.g. when a new period starts.
+
+        :param object key: (required). Key of the partition in the cache.
+        :param callable lookup: (required). Function which checks partition existence in the database.
+        """
+        if self.cache.ttl > 0 and not self.cache.loaded:
+            self.cache.load(self.names())
+
+        if key in self.cache:
+            return True
+
+        exists = bool(lookup())
+
+        if exists:
+            self.cache.add(key)
+
+        return exists
+
+    def _ensure(self):
+        """
+        Creates partition for the current column value if it doesn't exist. Returns whether it was created.
+        """
+        if self.exists():
+            return False
+
+        self.create()
+        return True
+
+    def _get_retention_value(self):
+        """
+        Returns the oldest column value which has to be kept according to the retention option.
+        """
+        raise NotImplementedError(
+            'Method "_get_retention_value" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def _get_ordered_names(self):
+        """
+        Returns names of the existing partitions which hold ranges of values ordered by their values,
+        partitions for NULL values, default and catch-all partitions are excluded.
+        """
+        return sorted([name for name in self.names() if name.strip('"').rsplit('_', 1)[1] not in (
+            'null', 'default', 'max')], key=self._get_order)
+
+    def _get_value_order(self, value):
+        """
+        Returns sort key of the partition for the given column value.
+
+        :param object value: (required). Column value.
+        """
+        partition = copy.copy(self)
+        partition.column_value = value
+        return self._get_order(partition._get_name())
+
+    def _get_order(self, name):
+        """
+        Returns sort key of the given partition name, partitions are ordered the same way as their values are.
+
+        :param string name: (required). Name of the partition.
+        """
+        raise NotImplementedError('Method "_get_order" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def _get_upcoming_values(self, until, periods):
+        """
+        Returns column values for the current partition and the following ones.
+
+        :param object until: (optional). Value which should be covered by the partitions.
+        :param integer periods: (optional). Number of partitions that follow the current one.
+        """
+        raise NotImplementedError(
+            'Method "_get_upcoming_values" not implemented in: {0}'.format(self.__class__.__name__))
@@ -6,20 +6,34 @@ is to calculate everything at the python level, then to create needed sql
 statements based on calculations and issue that statement into the database.
 """
 
+import re
+import copy
+import numbers
+import datetime
+
 from ..bases import BasePartition
 from ..utilities import DateTime
+from ...compat import text_type
 from ...exceptions import (
     PartitionRangeSubtypeError,
     PartitionConstraintError,
-    PartitionFunctionError
+    PartitionFunctionError,
+    PartitionModeError,
+    OptionValueError
 )
 
 
 class Partition(BasePartition):
+    def __init__(self, model, **meta):
+        super(Partition, self).__init__(model, **meta)
+        self.mode = meta.get('mode', 'add')
+
     def prepare(self):
         """
         Prepares table for partitioning by reconstructing table's primary key.
         """
+        self.cache.invalidate()
+
         if self.column_name not in self.pks:
             return self.database.execute("""
                 ALTER TABLE {parent_table} DROP PRIMARY KEY, ADD PRIMARY KEY ({pk}, {column});
@@ -29,11 +43,125 @@ class Partition(BasePartition):
         """
         Checks if partition exists.
         """
-        return self.database.select_one("""
+        return self._exists_cached(self._get_name(), lambda: self.database.select_one("""
             SELECT EXISTS(
                 SELECT 1 FROM information_schema.partitions
                 WHERE table_name='{parent_table}' AND partition_name='{name}');
-        """.format(parent_table=self.table, name=self._get_name()))
+        """.format(parent_table=self.table, name=self._get_name())))
+
+    def names(self):
+        """
+        Returns names of all existing partitions.
+        """
+        return [row[0] for row in self.database.select_all("""
+            SELECT partition_name
+            FROM information_schema.partitions
+            WHERE table_name = '{parent_table}' AND partition_name IS NOT NULL;
+        """.format(parent_table=self.table))]
+
+    def prune(self):
+        """
+        Removes expired partitions depending on the retention action with a single statement, either drops
+        or truncates them. Returns names of the removed partitions.
+        """
+        actions = {'drop': 'DROP', 'truncate': 'TRUNCATE'}
+
+        if self.retention_action not in actions:
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.retention_action,
+                option='retention_action',
+                cause='allowed values are {0}'.format(', '.join(sorted(actions.keys()))))
+
+        names = self.expired()
+
+        if names:
+            self.database.execute('ALTER TABLE {0} {1} PARTITION {2};'.format(
+                self.table, actions[self.retention_action], ', '.join(names)))
+            self.cache.invalidate()
+
+        return names
+
+    def children(self, start=None, end=None):
+        """
+        Returns names of the existing partitions which may hold column values from start to end inclusively.
+        Every partition holds all values below its bound, so values from the gaps between partitions, e.g.
+        backfilled ones, are stored in the next existing partition, which is returned as well.
+        """
+        lowest, highest = [None if value is None else self._get_value_order(value) for value in (start, end)]
+        names = self._get_ordered_names()
+        following = next((name for name in names if highest is not None and self._get_order(name) >= highest), None)
+
+        return [name for name in names
+                if (lowest is None or self._get_order(name) >= lowest)
+                and (highest is None or self._get_order(name) <= highest or name == following)]
+
+    def children_query(self, start=None, end=None, columns='*'):
+        """
+        Returns query which selects rows with column values from start to end inclusively only from the
+        partitions which may hold them via partition selection. In maxvalue mode the catch-all partition
+        is selected as well.
+        """
+        conditions = ['{0} {1} {2}'.format(self.column_name, operator, self._quote_literal(value))
+                      for operator, value in (('>=', start), ('<=', end)) if value is not None]
+        names = self.children(start, end) + (['{0}_max'.format(self.table)] if self.mode == 'maxvalue' else [])
+
+        if not names:
+            conditions.append('FALSE')
+
+        return 'SELECT {0} FROM {1}{2}{3}'.format(
+            columns,
+            self.table,
+            ' PARTITION ({0})'.format(', '.join(names)) if names else '',
+            ' WHERE {0}'.format(' AND '.join(conditions)) if conditions else ''
+        )
+
+    def migrate(self, batch_size=10000, after=None, until=None, delay=0, callback=None):
+        """
+        MySQL moves existing rows into partitions by itself when the table is partitioned, so there is nothing to move.
+        """
+        return 0
+
+    def migrate_ranges(self, count):
+        return [[None, None]]
+
+    def _get_mode_method(self, name):
+        """
+        Returns implementation of the requested method for the chosen partition mode.
+
+        :param string name: (required). Name of the method without mode.
+        """
+        try:
+            return getattr(self, '_{0}_{1}'.format(name, self.mode))
+        except AttributeError:
+            expression = r'^_{0}_(\w+)$'.format(name)
+            raise PartitionModeError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.mode,
+                allowed=[re.match(expression, c).group(1) for c in dir(self) if re.match(expression, c) is not None])
+
+    def _get_column_type(self):
+        """
+        Returns real database column type.
+        """
+        return self.database.select_one("""
+            SELECT data_type
+            FROM information_schema.columns
+            WHERE table_name = '{parent_table}' AND column_name = '{column}';
+        """.format(parent_table=self.table, column=self.column_name))
+
+    @staticmethod
+    def _quote_literal(value):
+        """
+        Quotes value to be used as a literal in SQL statement, numbers are left as is.
+
+        :param object value: (required). Value to quote.
+        """
+        if isinstance(value, numbers.Number) and not isinstance(value, bool):
+            return text_type(value)
+
+        return "'{0}'".format(text_type(value).replace('\\', '\\\\').replace("'", "''"))
 
 
 class RangePartition(Partition):
@@ -44,56 +172,265 @@ class RangePartition(Partition):
         super(RangePartition, self).__init__(model, **meta)
         self.constraint = meta['constraint']
         self.subtype = meta['subtype']
-        self.datetime = DateTime(self.column_value)
+        self.range_columns = meta.get('range_columns', False)
+
+    @property
+    def datetime(self):
+        return DateTime(self.column_value)
 
     def prepare(self):
+        """
+        Prepares table for partitioning depending on the partition mode.
+        """
+        super(RangePartition, self).prepare()
+        return self._get_mode_method('prepare')()
+
+    def exists(self):
+        """
+        Checks if partition exists. In maxvalue mode always returns True because every row fits
+        into the catch-all partition.
+        """
+        return self._get_mode_method('exists')()
+
+    def create(self):
+        """
+        Creates new partition. In maxvalue mode does nothing because every row fits into the catch-all partition.
+        """
+        return self._get_mode_method('create')()
+
+    def precreate(self, until=None, periods=1):
+        """
+        Creates partitions in advance. In maxvalue mode the catch-all partition is split into the new
+        partitions with a single statement.
+        """
+        return self._get_mode_method('precreate')(until, periods)
+
+    def create_missing(self, values):
+        """
+        Creates partitions for the given values which don't exist yet with a single statement. In
+        maxvalue mode the rows go into the catch-all partition, which is split only by precreate.
+        """
+        return self._get_mode_method('create_missing')(values)
+
+    def _prepare_add(self):
         """
         Prepares table for partitioning by creating zero partition to speed up things due to
         the partitioning implementation in the early versions of MySQL database (see bug #49754)
         """
-        super(RangePartition, self).prepare()
+        expression, bound = self._get_subtype_method('expression')()
+
         return self.database.execute("""
-            ALTER TABLE {parent_table} PARTITION BY RANGE ({function}({column}))(
-                PARTITION {pattern} VALUES LESS THAN (0)
+            ALTER TABLE {parent_table} PARTITION BY {expression}(
+                PARTITION {pattern} VALUES LESS THAN ({bound})
             );
         """.format(
             parent_table=self.table,
-            column=self.column_name,
+            expression=expression,
             pattern=self._get_name(),
-            function=self._get_function()
+            bound=bound
         ))
 
-    def create(self):
+    def _exists_add(self):
+        return super(RangePartition, self).exists()
+
+    def _create_add(self):
         """
         Creates new partition.
         """
-        return self.database.execute("""
+        result = self.database.execute("""
             ALTER TABLE {parent_table} ADD PARTITION (
-                PARTITION {child_table} VALUES LESS THAN ({function}('{period_end}') + {addition})
+                {partition}
+            );
+        """.format(parent_table=self.table, partition=self._get_definitions({self._get_name(): self})[0]))
+
+        self.cache.add(self._get_name())
+        return result
+
+    def _create_missing_add(self, values):
+        """
+        Adds all missing partitions with a single statement.
+        """
+        partitions = self._get_missing(values)
+
+        if partitions:
+            self.database.execute("""
+                ALTER TABLE {parent_table} ADD PARTITION (
+                    {partitions}
+                );
+            """.format(parent_table=self.table, partitions=',\n                    '.join(
+                self._get_definitions(partitions))))
+
+            for name in partitions:
+                self.cache.add(name)
+
+        return self._get_ordered(partitions)
+
+    def _precreate_add(self, until, periods):
+        return self.create_missing(self._get_upcoming_values(until, periods))
+
+    def _prepare_maxvalue(self):
+        """
+        Prepares table for partitioning by creating zero partition and the catch-all partition, which
+        holds all rows that don't fit into other partitions, so that inserts never have to wait for
+        partition creation, even for out of order values.
+        """
+        expression, bound = self._get_subtype_method('expression')()
+
+        return self.database.execute("""
+            ALTER TABLE {parent_table} PARTITION BY {expression}(
+                PARTITION {pattern} VALUES LESS THAN ({bound}),
+                PARTITION {parent_table}_max VALUES LESS THAN MAXVALUE
             );
         """.format(
-            child_table=self._get_name(),
             parent_table=self.table,
-            function=self._get_function(),
-            period_end=self.datetime.get_period(self.constraint)[1],
-            addition='86400' if self._get_column_type() == 'timestamp' else '1'
+            expression=expression,
+            pattern=self._get_name(),
+            bound=bound
         ))
 
+    def _exists_maxvalue(self):
+        return True
+
+    def _create_maxvalue(self):
+        pass
+
+    def _create_missing_maxvalue(self, values):
+        return []
+
+    def _split_maxvalue(self, values):
+        """
+        Splits all missing partitions off the catch-all partition with a single statement, which
+        rebuilds the catch-all partition, so it is done only in advance and never during inserts.
+        """
+        partitions = self._get_missing(values)
+
+        if partitions:
+            self.database.execute("""
+                ALTER TABLE {parent_table} REORGANIZE PARTITION {parent_table}_max INTO (
+                    {partitions},
+                    PARTITION {parent_table}_max VALUES LESS THAN MAXVALUE
+                );
+            """.format(parent_table=self.table, partitions=',\n                    '.join(
+                self._get_definitions(partitions))))
+
+            self.cache.invalidate()
+
+        return self._get_ordered(partitions)
+
+    def _precreate_maxvalue(self, until, periods):
+        """
+        Splits the catch-all partition into the upcoming partitions as well as partitions for the rows
+        which already got into it.
+        """
+        values = self._get_upcoming_values(until, periods)
+        lowest, highest = self.database.select_all("""
+            SELECT MIN({column}), MAX({column}) FROM {parent_table} PARTITION ({parent_table}_max);
+        """.format(parent_table=self.table, column=self.column_name))[0]
+
+        if lowest is not None:
+            values.extend(self._get_subtype_method('between')(lowest, highest))
+
+        return self._split_maxvalue(values)
+
+    def _get_missing(self, values):
+        """
+        Returns partitions for the given values which don't exist yet and can be created. MySQL allows
+        to create only partitions above the highest existing one, rows for the lower values are stored
+        in the existing partitions anyway. Partitions which are known to exist are skipped via cache, so
+        the database is asked only if some partition may be missing.
+
+        :param iterable values: (required). Column values to return partitions for.
+        """
+        partitions = {}
+
+        for value in values:
+            partition = copy.copy(self)
+            partition.column_value = value
+            name = partition._get_name()
+
+            if name not in partitions and not self._exists_cached(name, lambda: False):
+                partitions[name] = partition
+
+        if not partitions:
+            return partitions
+
+        order = self._get_order
+        names = [name for name in self.names() if name != '{0}_max'.format(self.table)]
+        highest = max(order(name) for name in names) if names else None
+
+        return dict((name, partition) for name, partition in partitions.items()
+                    if highest is None or order(name) > highest)
+
+    def _get_ordered(self, partitions):
+        """
+        Returns names of the given partitions ordered by their bounds.
+
+        :param iterable partitions: (required). Names of the partitions.
+        """
+        return sorted(partitions, key=self._get_order)
+
+    def _get_definitions(self, partitions):
+        """
+        Returns definitions of the given partitions ordered by their bounds.
+
+        :param dict partitions: (required). Partitions to return definitions for.
+        """
+        bounds = self._get_subtype_method('bounds')(partitions)
+
+        return ['PARTITION {0} VALUES LESS THAN ({1})'.format(
+            name, bounds[name]) for name in self._get_ordered(partitions)]
+
+    def _get_upcoming_values(self, until, periods):
+        """
+        Dynamically returns column values for the current partition and the following ones
+        depending on the partition subtype.
+        """
+        return self._get_subtype_method('upcoming')(until, periods)
+
     def _get_name(self):
         """
         Dynamically defines new partition name depending on the partition subtype.
         """
+        return self._get_subtype_method('name')()
+
+    def _get_retention_value(self):
+        """
+        Dynamically returns the oldest column value which has to be kept depending on the partition subtype.
+        """
+        return self._get_subtype_method('retention')()
+
+    def _get_order(self, name):
+        """
+        Dynamically returns sort key of the given partition name depending on the partition subtype.
+        """
+        return self._get_subtype_method('order')(name)
+
+    def _get_subtype_method(self, name):
+        """
+        Returns implementation of the requested method for the chosen partition subtype.
+
+        :param string name: (required). Name of the method without subtype.
+        """
         try:
-            return getattr(self, '_get_{0}_name'.format(self.subtype))()
+            return getattr(self, '_get_{0}_{1}'.format(self.subtype, name))
         except AttributeError:
-            import re
-            expression = '_get_(\w+)_name'
+            expression = r'_get_(\w+)_{0}$'.format(name)
             raise PartitionRangeSubtypeError(
                 model=self.model.__name__,
                 dialect=self.dialect,
                 current=self.subtype,
                 allowed=[re.match(expression, c).group(1) for c in dir(self) if re.match(expression, c) is not None])
 
+    def _get_date_expression(self):
+        """
+        Returns partitioning expression and upper bound of the zero partition for date partition subtype.
+        With range columns the column is compared directly instead of being wrapped into a function.
+        """
+        if self.range_columns:
+            return 'RANGE COLUMNS ({0})'.format(self.column_name), "'1000-01-01'"
+
+        return 'RANGE ({0}({1}))'.format(self._get_function(), self.column_name), '0'
+
     def _get_date_name(self):
         """
         Defines name for a new partition for date partition subtype.
@@ -119,6 +456,170 @@ class RangePartition(Partition):
 
         return '{0}_{1}'.format(self.table, pattern)
 
+    @staticmethod
+    def _get_date_order(name):
+        """
+        Returns sort key of the given partition for date partition subtype, which is the
+        part of the name after the table name, it is ordered the same way as the dates are.
+        """
+        return name.rsplit('_', 1)[1]
+
+    def _get_date_bounds(self, partitions):
+        """
+        Returns upper bounds of the given partitions for date partition subtype. With range columns
+        the bound is the beginning of the next period, so the column type doesn't have to be looked up.
+        """
+        if self.range_columns:
+            return dict((name, "'{0}'".format(partition.datetime.get_boundaries(self.constraint)[1].strftime(
+                '%Y-%m-%d'))) for name, partition in partitions.items())
+
+        function = self._get_function()
+        addition = '86400' if self._get_column_type() == 'timestamp' else '1'
+
+        return dict((name, "{0}('{1}') + {2}".format(
+            function, partition.datetime.get_period(self.constraint)[1], addition
+        )) for name, partition in partitions.items())
+
+    def _get_date_upcoming(self, until, periods):
+        """
+        Returns column values for the current partition and the following ones for date partition subtype,
+        current partition is the one for the current date.
+        """
+        if self.constraint not in ('day', 'week', 'month', 'year'):
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['day', 'week', 'month', 'year'])
+
+        return DateTime(datetime.datetime.now()).upcoming(self.constraint, until, periods)
+
+    def _get_date_retention(self):
+        """
+        Returns the oldest column value which has to be kept for date partition subtype.
+        """
+        try:
+            return DateTime(datetime.datetime.now()).ago(self.retention)
+        except ValueError:
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.retention,
+                option='retention',
+                cause='duration is expected, e.g. 90 days, 12 weeks, 6 months or 1 year')
+
+    def _get_date_between(self, lowest, highest):
+        """
+        Returns column values for all partitions between the given values for date partition subtype.
+        """
+        return DateTime(lowest).upcoming(self.constraint, until=highest)
+
+    def _get_integer_expression(self):
+        """
+        Returns partitioning expression and upper bound of the zero partition for integer partition subtype.
+        """
+        return 'RANGE ({0})'.format(self.column_name), '1'
+
+    def _get_integer_name(self):
+        """
+        Defines name for a new partition for integer partition subtype.
+        """
+        start, end = self._get_integer_range()
+
+        if start is None:
+            return '{0}_0'.format(self.table)
+
+        return '{0}_{1}_{2}'.format(self.table, start, end - 1)
+
+    def _get_integer_range(self):
+        """
+        Returns half-open range of values for a new partition for integer partition subtype. MySQL can't
+        add partitions below the lowest one, so zero and negative values belong to the zero partition.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        constraint = int(self.constraint)
+
+        if self.column_value is None or self.column_value < 1:
+            return None, 1
+
+        start = ((self.column_value - 1) // constraint) * constraint + 1
+        return start, start + constraint
+
+    @staticmethod
+    def _get_integer_order(name):
+        """
+        Returns sort key of the given partition for integer partition subtype, which is the
+        highest value the partition holds.
+        """
+        return int(name.rsplit('_', 1)[1])
+
+    def _get_integer_bounds(self, partitions):
+        """
+        Returns upper bounds of the given partitions for integer partition subtype.
+        """
+        return dict((name, partition._get_integer_range()[1]) for name, partition in partitions.items())
+
+    def _get_integer_upcoming(self, until, periods):
+        """
+        Returns column values for the current partition and the following ones for integer partition subtype,
+        current partition is the one for the highest value in the table, until is the highest expected value.
+        """
+        if until is not None and not isinstance(until, numbers.Integral):
+            # Nothing predicts how fast the values grow, so a duration can't be turned into values
+            raise PartitionRangeSubtypeError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.subtype,
+                allowed=['date'])
+
+        highest = self.database.select_one('SELECT MAX({0}) FROM {1};'.format(self.column_name, self.table)) or 0
+
+        if isinstance(until, numbers.Integral):
+            return self._get_integer_between(highest, until)
+
+        values = self._get_integer_between(highest, highest)
+
+        while len(values) <= periods:
+            partition = copy.copy(self)
+            partition.column_value = values[-1]
+            values.append(partition._get_integer_range()[1])
+
+        return values
+
+    def _get_integer_retention(self):
+        """
+        Returns the oldest column value which has to be kept for integer partition subtype, retention
+        is the number of values below the highest value in the table.
+        """
+        if not text_type(self.retention).isdigit():
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.retention,
+                option='retention',
+                cause='number of values to keep is expected, e.g. 1000000')
+
+        return (self.database.select_one(
+            'SELECT MAX({0}) FROM {1};'.format(self.column_name, self.table)) or 0) - int(self.retention)
+
+    def _get_integer_between(self, lowest, highest):
+        """
+        Returns column values for all partitions between the given values for integer partition subtype.
+        """
+        partition = copy.copy(self)
+        partition.column_value = lowest
+        values = []
+
+        while not values or partition.column_value <= highest:
+            values.append(partition.column_value)
+            partition.column_value = partition._get_integer_range()[1]
+
+        return values
+
     def _get_function(self):
         """
         Returns correct partition function depending on the MySQL column type.
@@ -140,12 +641,211 @@ class RangePartition(Partition):
                 current=column_type,
                 allowed=functions.keys())
 
-    def _get_column_type(self):
+
+class HashPartition(Partition):
+    """
+    Hash partition type implementation. Rows are spread evenly among the fixed number of partitions
+    which is set by the constraint option. All partitions are created by the prepare method, so that
+    the insert path never needs to create one.
+    """
+    def __init__(self, model, **meta):
+        super(HashPartition, self).__init__(model, **meta)
+        self.constraint = meta['constraint']
+
+    def prepare(self):
         """
-        Returns real database column type.
+        Prepares table for partitioning and creates all partitions. Integer columns are hashed with
+        HASH function, all other column types with KEY function, which uses MySQL's own hashing.
         """
-        return self.database.select_one("""
-            SELECT data_type
-            FROM information_schema.columns
-            WHERE table_name = '{parent_table}' AND column_name = '{column}';
-        """.format(parent_table=self.table, column=self.column_name))
+        super(HashPartition, self).prepare()
+        integers = ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')
+
+        return self.database.execute("""
+            ALTER TABLE {parent_table} PARTITION BY {function} ({column}) PARTITIONS {modulus};
+        """.format(
+            parent_table=self.table,
+            column=self.column_name,
+            modulus=self._get_modulus(),
+            function='HASH' if self._get_column_type() in integers else 'KEY'
+        ))
+
+    def exists(self):
+        """
+        Partitions always exist.
+        """
+        return True
+
+    def create(self):
+        """
+        There is nothing to create.
+        """
+        pass
+
+    def precreate(self, until=None, periods=1):
+        """
+        There is nothing to create in advance.
+        """
+        return []
+
+    def create_missing(self, values):
+        """
+        There is nothing to create for a batch of values.
+        """
+        return []
+
+    def _get_modulus(self):
+        """
+        Returns number of partitions.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        return int(self.constraint)
+
+
+class ListPartition(Partition):
+    """
+    List partition type implementation. Values option maps names of the partitions to lists of values
+    which go into them. MySQL doesn't support default partition for list partitioning, so it is emulated
+    by the partition which collects all other values, new values are added to it at the python level.
+    Adding values rebuilds the whole default partition, so it should hold only a few rarely used values.
+    """
+    def __init__(self, model, **meta):
+        super(ListPartition, self).__init__(model, **meta)
+        self.values = meta['values']
+
+    def prepare(self):
+        """
+        Prepares table for partitioning and creates all partitions. Values which are already in the table,
+        but aren't mapped to any partition, as well as NULL, go into the default partition.
+        """
+        super(ListPartition, self).prepare()
+        mapped = [value for values in self._get_values().values() for value in values]
+        unmapped = [row[0] for row in self.database.select_all("""
+            SELECT DISTINCT {column} FROM {parent_table} WHERE {column} IS NOT NULL;
+        """.format(parent_table=self.table, column=self.column_name)) if row[0] not in mapped]
+
+        partitions = ['PARTITION {0}_{1} VALUES IN ({2})'.format(
+            self.table, name, ', '.join(self._quote_literal(value) for value in values)
+        ) for name, values in sorted(self._get_values().items())]
+
+        partitions.append('PARTITION {0} VALUES IN ({1})'.format(
+            self._get_name(), ', '.join(['NULL'] + [self._quote_literal(value) for value in unmapped])))
+
+        return self.database.execute("""
+            ALTER TABLE {parent_table} PARTITION BY LIST COLUMNS ({column})(
+                {partitions}
+            );
+        """.format(parent_table=self.table, column=self.column_name, partitions=',\n                '.join(partitions)))
+
+    def exists(self):
+        """
+        Checks if value is mapped to any partition or was already added to the default partition.
+        """
+        if self.column_value is None or any(self.column_value in v for v in self._get_values().values()):
+            return True
+
+        return self._exists_cached((self._get_name(), self.column_value), lambda: self.database.select_one("""
+            SELECT FIND_IN_SET('{value}', partition_description) > 0
+            FROM information_schema.partitions
+            WHERE table_name = '{parent_table}' AND partition_name = '{name}';
+        """.format(
+            parent_table=self.table,
+            name=self._get_name(),
+            value=self._quote_literal(self.column_value).replace('\\', '\\\\').replace("'", "''")
+        )))
+
+    def create(self):
+        """
+        Adds new value to the default partition.
+        """
+        return self._add_values([self.column_value])
+
+    def precreate(self, until=None, periods=1):
+        """
+        There is nothing to create in advance, new values are added to the default partition on save.
+        """
+        return []
+
+    def create_missing(self, values):
+        """
+        Adds new values to the default partition with a single statement. All values share the name of
+        the default partition, so they are checked one by one instead of by the partition name.
+        """
+        missing = []
+
+        for value in values:
+            partition = copy.copy(self)
+            partition.column_value = value
+
+            if value not in missing and not partition.exists():
+                missing.append(value)
+
+        return [self._get_name()] if self._add_values(missing) else []
+
+    def _add_values(self, values):
+        """
+        Adds the given values to the default partition, which is rebuilt by the statement. Partition
+        description is read and changed under a named lock, otherwise concurrent inserts of the new
+        values would overwrite each other's changes. Returns values which weren't added before.
+
+        :param list values: (required). Column values to add.
+        """
+        if not values:
+            return []
+
+        lock = "MD5('{0}.{1}')".format(self.table, self._get_name())
+        self.database.execute('DO GET_LOCK({0}, 3600);'.format(lock))
+
+        try:
+            description = self.database.select_one("""
+                SELECT partition_description
+                FROM information_schema.partitions
+                WHERE table_name = '{parent_table}' AND partition_name = '{name}';
+            """.format(parent_table=self.table, name=self._get_name()))
+
+            existing = description.split(',')
+            added = [value for value in values if self._quote_literal(value) not in existing]
+
+            if added:
+                self.database.execute("""
+                    ALTER TABLE {parent_table} REORGANIZE PARTITION {name} INTO (
+                        PARTITION {name} VALUES IN ({description}, {values})
+                    );
+                """.format(
+                    parent_table=self.table,
+                    name=self._get_name(),
+                    description=description,
+                    values=', '.join(self._quote_literal(value) for value in added)
+                ))
+        finally:
+            self.database.execute('DO RELEASE_LOCK({0});'.format(lock))
+
+        for value in values:
+            self.cache.add((self._get_name(), value))
+
+        return added
+
+    def _get_name(self):
+        """
+        Returns name of the default partition, which is the only one that can be changed.
+        """
+        return '{0}_default'.format(self.table)
+
+    def _get_values(self):
+        """
+        Returns mapping of partition names to the lists of values which go into them.
+        """
+        if not isinstance(self.values, dict) or not self.values or not all(
+                isinstance(values, (list, tuple)) and values for values in self.values.values()):
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.values,
+                option='values',
+                cause='it should be a dictionary which maps partition names to non empty lists of values')
+
+        return self.values
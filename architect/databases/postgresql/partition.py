@@ -3,61 +3,310 @@ PostgreSQL supports table partitioning via inheritance. The whole magic is
 implemented at the database level via triggers and functions which create
 and execute dynamic SQL. That means that after preparing the database for
 partitioning, one can safely work with it via raw SQL statements without
-using any kind of the ORM or anything else.
+using any kind of the ORM or anything else. Starting from PostgreSQL 11
+declarative partitioning can be used instead, in this mode the database
+routes rows by itself and partitions are created at the python level.
 """
 
+import re
+import copy
+import time
+import numbers
+import datetime
+
 from ..bases import BasePartition
+from ..utilities import DateTime
+from ...compat import text_type
 from ...exceptions import (
     PartitionRangeSubtypeError,
-    PartitionConstraintError
+    PartitionConstraintError,
+    PartitionModeError,
+    OptionValueError
 )
 
 
 class Partition(BasePartition):
+    def __init__(self, model, **meta):
+        super(Partition, self).__init__(model, **meta)
+        self.mode = meta.get('mode', 'trigger')
+        self.routing = meta.get('routing', 'dynamic')
+
     def prepare(self):
         """
-        Prepares needed triggers and functions for those triggers.
+        Prepares everything that is needed to initialize partitioning depending on the partition mode.
         """
-        indentation = {'declarations': 5, 'variables': 6}
-        definitions, formatters = self._get_definitions()
+        self.cache.invalidate()
+        return self._get_mode_method('prepare')()
 
-        for definition in indentation:
-            for index, _ in enumerate(definitions.setdefault(definition, [])):
-                if index > 0:
-                    definitions[definition][index] = '    ' * indentation[definition] + definitions[definition][index]
+    def exists(self):
+        """
+        Checks if partition exists. In trigger mode always returns False because everything is done
+        at the database level.
+        """
+        return self._get_mode_method('exists')()
 
-            definitions[definition] = '\n'.join(definitions[definition]).format(**formatters)
+    def create(self):
+        """
+        Creates new partition. In trigger mode does nothing because everything is done at the database level.
+        """
+        return self._get_mode_method('create')()
 
-        return self.database.execute("""
-            -- We need to create a before insert function
-            CREATE OR REPLACE FUNCTION {{parent_table}}_insert_child()
-            RETURNS TRIGGER AS $$
-                DECLARE
-                    match "{{parent_table}}".{{column}}%TYPE;
-                    tablename VARCHAR;
-                    checks TEXT;
-                    {declarations}
-                BEGIN
-                    IF NEW.{{column}} IS NULL THEN
-                        tablename := '{{parent_table}}_null';
-                        checks := '{{column}} IS NULL';
-                    ELSE
-                        {variables}
-                    END IF;
+    def names(self):
+        """
+        Returns names of all existing partitions, quoted the same way as partition names are quoted by Architect.
+        """
+        return [row[0] for row in self.database.select_all("""
+            SELECT QUOTE_IDENT(c.relname)
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = '"{parent_table}"'::regclass;
+        """.format(parent_table=self.table))]
 
-                    BEGIN
-                        EXECUTE 'CREATE TABLE IF NOT EXISTS ' || tablename || ' (
-                            CHECK (' || checks || '),
-                            LIKE "{{parent_table}}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES
-                        ) INHERITS ("{{parent_table}}");';
-                    EXCEPTION WHEN duplicate_table THEN
-                        -- pass
-                    END;
+    def prune(self):
+        """
+        Removes expired partitions depending on the retention action: drops them, truncates them or detaches
+        them from the partitioned table. In native mode partitions can't be detached concurrently, because
+        partitioned table always has a default partition. Returns names of the removed partitions.
+        """
+        if self.mode == 'native':
+            detach = 'ALTER TABLE "{parent_table}" DETACH PARTITION {name};'
+        else:
+            detach = 'ALTER TABLE {name} NO INHERIT "{parent_table}";'
 
-                    EXECUTE 'INSERT INTO ' || tablename || ' VALUES (($1).*);' USING NEW;
-                    RETURN NEW;
-                END;
-            $$ LANGUAGE plpgsql SECURITY DEFINER;
+        actions = {
+            'drop': lambda names: ['DROP TABLE IF EXISTS {0};'.format(', '.join(names))],
+            'truncate': lambda names: ['TRUNCATE TABLE {0};'.format(', '.join(names))],
+            'detach': lambda names: [detach.format(parent_table=self.table, name=name) for name in names],
+        }
+
+        if self.retention_action not in actions:
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.retention_action,
+                option='retention_action',
+                cause='allowed values are {0}'.format(', '.join(sorted(actions.keys()))))
+
+        names = self.expired()
+
+        if names:
+            for statement in actions[self.retention_action](names):
+                self.database.execute(statement)
+
+            # Insert function with static routing mustn't refer to the removed partitions
+            if self.mode != 'native' and self.routing == 'static' and self.retention_action != 'truncate':
+                self.database.execute('SELECT {0}_build_insert_child();'.format(self.table))
+
+            self.cache.invalidate()
+
+        return names
+
+    def children_query(self, start=None, end=None, columns='*'):
+        """
+        Returns UNION ALL query over the partitions which may hold column values from start to end inclusively.
+        Rows which are stored outside of the partitions, i.e. in the default partition in native mode and rows
+        which weren't migrated yet in the table itself in other modes, are selected as well.
+        """
+        conditions = ['"{0}" {1} {2}'.format(self.column_name, operator, self._quote_literal(value))
+                      for operator, value in (('>=', start), ('<=', end)) if value is not None]
+        sources = self.children(start, end)
+        sources.append('"{0}{1}"'.format(self.table, '_default' if self.mode == 'native' else ''))
+
+        return '\nUNION ALL\n'.join('SELECT {0} FROM ONLY {1}{2}'.format(
+            columns, source, ' WHERE {0}'.format(' AND '.join(conditions)) if conditions else ''
+        ) for source in sources)
+
+    def migrate(self, batch_size=10000, after=None, until=None, delay=0, callback=None):
+        """
+        Moves rows which were saved into the table before partitioning was set up into partitions. Rows are
+        paginated by the primary key and every batch is reinserted by a separate statement, so that it is
+        routed by the insert trigger without a long running transaction. In native mode rows are moved out
+        of the default partition, which is the original table, by partitions instead, because PostgreSQL
+        doesn't allow to attach a partition while the default one holds its rows, so all rows of the partition
+        are moved and it is attached by a single statement. Returns number of moved rows.
+
+        :param integer batch_size: (optional). Number of rows moved by a single statement.
+        :param list after: (optional). Primary key values of the row to continue after.
+        :param list until: (optional). Primary key values of the last row to move.
+        :param float delay: (optional). Number of seconds to wait between batches to throttle the load.
+        :param function callback: (optional). Called with primary key values of the last moved row after every batch.
+        """
+        count = 0
+
+        if self.mode == 'native':
+            self._attach_detached()
+
+        while True:
+            keys = self.database.select_all("""
+                SELECT {pk}{column} FROM ONLY {source} {conditions} ORDER BY {pk} LIMIT {limit};
+            """.format(
+                pk=', '.join(self.pks),
+                column=', "{0}"'.format(self.column_name) if self.mode == 'native' else '',
+                source=self._get_migrate_source(),
+                conditions=self._get_keyset_conditions(after, until),
+                limit=batch_size
+            ))
+
+            if not keys:
+                break
+
+            last = list(keys[-1][:len(self.pks)])
+
+            if self.mode == 'native':
+                count += self._migrate_native(keys)
+            else:
+                self.database.execute("""
+                    WITH moved AS (
+                        DELETE FROM ONLY "{parent_table}" {conditions} RETURNING *
+                    )
+                    INSERT INTO "{parent_table}" SELECT * FROM moved;
+                """.format(parent_table=self.table, conditions=self._get_keyset_conditions(after, last)))
+                count += len(keys)
+
+            after = last
+
+            if callback is not None:
+                callback(after)
+
+            if len(keys) < batch_size:
+                break
+
+            time.sleep(delay)
+
+        return count
+
+    def _migrate_native(self, keys):
+        """
+        Moves all rows of the partitions for the column values of a batch out of the default partition, every
+        partition is filled and attached in a single transaction, so that rows never disappear from the table.
+        Rows with NULL value stay in the default partition. Returns number of moved rows.
+
+        :param list keys: (required). Primary key and column values of the rows of the batch.
+        """
+        count = 0
+        names = set()
+
+        for row in keys:
+            partition = copy.copy(self)
+            partition.column_value = row[-1]
+
+            if row[-1] is None or partition._get_name() in names:
+                continue
+
+            names.add(partition._get_name())
+            count += self.database.select_one('SELECT COUNT(*) FROM ONLY "{0}_default" WHERE {1};'.format(
+                self.table, partition._get_checks()))
+            partition._create_native()
+
+        return count
+
+    def _attach_detached(self):
+        """
+        Attaches partitions which were left detached with rows in them, e.g. by an interrupted migration of
+        an earlier version. Tables are recognized by the partition name of their rows, expired partitions
+        which were detached by the prune method stay detached. Returns names of the attached partitions.
+        """
+        cutoff = self._get_value_order(self._get_retention_value()) if self.retention is not None else None
+        names = []
+
+        for (name,) in self.database.select_all("""
+            SELECT QUOTE_IDENT(c.relname)
+            FROM pg_class c
+            WHERE c.relkind = 'r'
+            AND c.relnamespace = (SELECT relnamespace FROM pg_class WHERE oid = '"{parent_table}_default"'::regclass)
+            AND STRPOS(c.relname, '{parent_table}_') = 1
+            AND c.oid <> '"{parent_table}_default"'::regclass
+            AND NOT EXISTS(SELECT 1 FROM pg_inherits WHERE inhrelid = c.oid)
+            AND EXISTS(
+                SELECT 1
+                FROM pg_attribute a JOIN pg_attribute d ON d.atttypid = a.atttypid AND d.attname = a.attname
+                WHERE a.attrelid = c.oid AND d.attrelid = '"{parent_table}_default"'::regclass
+                AND a.attname = '{column}' AND NOT a.attisdropped
+            );
+        """.format(parent_table=self.table, column=self.column_name)):
+            partition = copy.copy(self)
+            partition.column_value = self.database.select_one(
+                'SELECT "{0}" FROM ONLY {1} WHERE "{0}" IS NOT NULL LIMIT 1;'.format(self.column_name, name))
+
+            if partition.column_value is None or partition._get_name() != name:
+                continue
+
+            if cutoff is not None and self.retention_action == 'detach' and self._get_order(name) < cutoff:
+                continue
+
+            partition._create_native()
+            names.append(name)
+
+        return names
+
+    def _get_migrate_source(self):
+        """
+        Returns table which holds rows that have to be moved into partitions.
+        """
+        return '"{0}{1}"'.format(self.table, '_default' if self.mode == 'native' else '')
+
+    def migrate_ranges(self, count):
+        """
+        Splits rows which have to be moved into the given number of primary key ranges, which can be
+        moved in parallel. Every range is a pair of primary key values, which is passed to the migrate
+        method as after and until arguments. Only tables with a single integer primary key can be split.
+
+        :param integer count: (required). Number of ranges.
+        """
+        if count < 2 or len(self.pks) > 1:
+            return [[None, None]]
+
+        lowest, highest = self.database.select_all('SELECT MIN({0}), MAX({0}) FROM ONLY {1};'.format(
+            self.pks[0], self._get_migrate_source()))[0]
+
+        if not isinstance(lowest, numbers.Integral):
+            return [[None, None]]
+
+        step = (highest - lowest) // count + 1
+        bounds = [[lowest + step * number - 1] for number in range(1, count)]
+        return [list(bound) for bound in zip([None] + bounds, bounds + [None])]
+
+    def _get_keyset_conditions(self, after, until):
+        """
+        Returns where clause which limits rows to the given range of primary key values.
+
+        :param list after: (required). Primary key values of the row before the range or None.
+        :param list until: (required). Primary key values of the last row of the range or None.
+        """
+        conditions = []
+
+        for operator, values in (('>', after), ('<=', until)):
+            if values is not None:
+                conditions.append('({0}) {1} ({2})'.format(
+                    ', '.join(self.pks), operator, ', '.join(self._quote_literal(value) for value in values)))
+
+        return 'WHERE {0}'.format(' AND '.join(conditions)) if conditions else ''
+
+    def _get_mode_method(self, name):
+        """
+        Returns implementation of the requested method for the chosen partition mode.
+
+        :param string name: (required). Name of the method.
+        """
+        try:
+            return getattr(self, '_{0}_{1}'.format(name, self.mode))
+        except AttributeError:
+            expression = r'_prepare_(\w+)'
+            raise PartitionModeError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.mode,
+                allowed=[re.match(expression, c).group(1) for c in dir(self) if re.match(expression, c) is not None])
+
+    def _prepare_trigger(self):
+        """
+        Prepares needed triggers and functions for those triggers.
+        """
+        return self.database.execute("""
+            -- Other modes may have been used before
+            DROP RULE IF EXISTS insert_{{parent_table}}_rule ON "{{parent_table}}";
+            DROP TRIGGER IF EXISTS after_insert_{{parent_table}}_statement_trigger ON "{{parent_table}}";
+
+            -- We need to create a before insert function
+            {function}
 
             -- Then we create a trigger which calls the before insert function
             DO $$
@@ -97,149 +346,1310 @@ class Partition(BasePartition):
                     FOR EACH ROW EXECUTE PROCEDURE {{parent_table}}_delete_master();
             END IF;
             END $$;
-        """.format(**definitions).format(
+        """.format(function=self._get_insert_function().strip()).format(
             pk=' AND '.join('{pk} = NEW.{pk}'.format(pk=pk) for pk in self.pks),
             parent_table=self.table,
             column='"{0}"'.format(self.column_name)
         ))
 
-    def exists(self):
-        """
-        Checks if partition exists. Not used in this backend because everything is done at the database level.
-        """
-        return False
-
-    def create(self):
-        """
-        Creates new partition. Not used in this backend because everything is done at the database level.
-        """
-        pass
-
-    def _get_definitions(self):
+    def _get_insert_function(self):
         """
-        Returns needed definitions for chosen partition type/subtype.
+        Returns SQL which creates the before insert function. With dynamic routing the function inserts
+        rows via dynamic SQL, with static routing the function is compiled by another function which adds
+        a separate branch with a plain insert statement for every existing partition, so that the query
+        plans can be cached. Dynamic SQL is used only for a partition that doesn't have a branch yet, after
+        that the function is compiled again.
         """
-        raise NotImplementedError('Method "_get_definitions" not implemented in: {0}'.format(self.__class__.__name__))
+        definitions = self._get_routing_definitions('NEW.{column}', {'declarations': 5, 'variables': 6})
 
+        routing = {
+            'dynamic': """
+                    -- Catalog cache lookup is cheap, DDL and the lock are needed only for a missing partition
+                    IF TO_REGCLASS(tablename) IS NULL THEN
+                        PERFORM PG_ADVISORY_XACT_LOCK(HASHTEXT(tablename));
+                        EXECUTE 'CREATE TABLE IF NOT EXISTS ' || tablename || ' (
+                            CHECK (' || checks || '),
+                            LIKE "{parent_table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES
+                        ) INHERITS ("{parent_table}");';
+                    END IF;
 
-class RangePartition(Partition):
-    """
-    Range partition type implementation.
-    """
-    def __init__(self, model, **meta):
-        super(RangePartition, self).__init__(model, **meta)
-        self.constraint = meta['constraint']
-        self.subtype = meta['subtype']
+                    EXECUTE 'INSERT INTO ' || tablename || ' VALUES (($1).*);' USING NEW;""",
+            'static': """
+                    -- Unquoted table names are case insensitive, so they have to be normalized
+                    relation := CASE WHEN LEFT(tablename, 1) = '"' THEN tablename ELSE LOWER(tablename) END;
 
-    def _get_definitions(self):
-        """
-        Dynamically returns needed definitions depending on the partition subtype.
-        """
-        try:
-            definitions = getattr(self, '_get_{0}_definitions'.format(self.subtype))()
-            formatters = dict(constraint=self.constraint, subtype=self.subtype, **definitions.pop('formatters', {}))
-            return definitions, formatters
-        except AttributeError:
-            import re
-            expression = '_get_(\w+)_function'
-            raise PartitionRangeSubtypeError(
-                model=self.model.__name__,
-                dialect=self.dialect,
-                current=self.subtype,
-                allowed=[re.match(expression, c).group(1) for c in dir(self) if re.match(expression, c) is not None])
+                    IF relation IS NULL THEN
+                        RAISE EXCEPTION 'Unable to determine partition for value %', NEW.{column};
+                    -- static routing branches
+                    ELSE
+                        IF TO_REGCLASS(tablename) IS NULL THEN
+                            PERFORM PG_ADVISORY_XACT_LOCK(HASHTEXT(tablename));
+                            EXECUTE 'CREATE TABLE IF NOT EXISTS ' || tablename || ' (
+                                CHECK (' || checks || '),
+                                LIKE "{parent_table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES
+                            ) INHERITS ("{parent_table}");';
+                        END IF;
 
-    def _get_date_definitions(self):
-        """
-        Returns definitions for date partition subtype.
-        """
-        patterns = {
-            'day': '"y"YYYY"d"DDD',
-            'week': '"y"IYYY"w"IW',
-            'month': '"y"YYYY"m"MM',
-            'year': '"y"YYYY',
+                        EXECUTE 'INSERT INTO ' || tablename || ' VALUES (($1).*);' USING NEW;
+                        PERFORM {parent_table}_build_insert_child();
+                    END IF;""",
         }
 
         try:
-            pattern = patterns[self.constraint]
+            definitions['routing'] = routing[self.routing]
         except KeyError:
-            raise PartitionConstraintError(
+            raise OptionValueError(
                 model=self.model.__name__,
-                dialect=self.dialect,
-                current=self.constraint,
-                allowed=patterns.keys())
+                current=self.routing,
+                option='routing',
+                cause='allowed values are {0}'.format(', '.join(sorted(routing.keys()))))
 
-        return {
-            'formatters': {'pattern': pattern},
-            'variables': [
-                "match := DATE_TRUNC('{constraint}', NEW.{{column}});",
-                "tablename := '{{parent_table}}_' || TO_CHAR(NEW.{{column}}, '{pattern}');",
-                "checks := '{{column}} >= ''' || match || ''' AND {{column}} < ''' || (match + INTERVAL '1 {constraint}') || '''';"
-            ]
-        }
+        # In single write mode the row mustn't get into the table, but view has to return it
+        if self.mode == 'single_write':
+            definitions['returning'] = "IF TG_WHEN = 'BEFORE' THEN RETURN NULL; END IF;\n{0}RETURN NEW;".format(' ' * 20)
+        else:
+            definitions['returning'] = 'RETURN NEW;'
 
-    def _get_integer_definitions(self):
-        """
-        Returns definitions for integer partition subtype.
-        """
-        if not self.constraint.isdigit() or int(self.constraint) < 1:
-            raise PartitionConstraintError(
-                model=self.model.__name__,
-                dialect=self.dialect,
-                current=self.constraint,
-                allowed=['positive integer'])
+        function = """
+            CREATE OR REPLACE FUNCTION {{parent_table}}_insert_child()
+            RETURNS TRIGGER AS $$
+                DECLARE
+                    match "{{parent_table}}".{{column}}%TYPE;
+                    tablename VARCHAR;
+                    relation VARCHAR;
+                    checks TEXT;
+                    {declarations}
+                BEGIN
+                    IF NEW.{{column}} IS NULL THEN
+                        tablename := '{{parent_table}}_null';
+                        checks := '{{column}} IS NULL';
+                    ELSE
+                        {variables}
+                    END IF;
+                    {routing}
 
-        return {
-            'variables': [
-                "IF NEW.{{column}} = 0 THEN",
-                "    tablename := '{{parent_table}}_0';",
-                "    checks := '{{column}} = 0';",
-                "ELSE",
-                "    IF NEW.{{column}} > 0 THEN",
-                "        match := ((NEW.{{column}} - 1) / {constraint}) * {constraint} + 1;",
-                "        tablename := '{{parent_table}}_' || match || '_' || (match + {constraint}) - 1;",
-                "    ELSE",
-                "        match := FLOOR(NEW.{{column}} :: FLOAT / {constraint} :: FLOAT) * {constraint};",
-                "        tablename := '{{parent_table}}_m' || ABS(match) || '_m' || ABS((match + {constraint}) - 1);",
-                "    END IF;",
-                "    checks := '{{column}} >= ' || match || ' AND {{column}} <= ' || (match + {constraint}) - 1;",
-                "END IF;"
-            ]
-        }
+                    {returning}
+                END;
+            $$ LANGUAGE plpgsql SECURITY DEFINER;
+        """.format(**definitions)
 
-    def _get_string_firstchars_definitions(self):
+        if self.routing == 'dynamic':
+            return function
+
+        return """
+            CREATE OR REPLACE FUNCTION {{parent_table}}_build_insert_child()
+            RETURNS VOID AS $build$
+                DECLARE
+                    child RECORD;
+                    branches TEXT := '';
+                BEGIN
+                    -- Concurrent replacement of the same function isn't allowed
+                    PERFORM PG_ADVISORY_XACT_LOCK(HASHTEXT('{{parent_table}}_insert_child'));
+
+                    -- Most recently created partitions are usually the most used ones, so they go first
+                    FOR child IN
+                        SELECT QUOTE_IDENT(c.relname) AS tablename
+                        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+                        WHERE i.inhparent = '"{{parent_table}}"'::regclass
+                        ORDER BY c.oid DESC
+                    LOOP
+                        branches := branches || 'ELSIF relation = ' || QUOTE_LITERAL(child.tablename) ||
+                            ' THEN INSERT INTO ' || child.tablename || ' VALUES (NEW.*);' || CHR(10);
+                    END LOOP;
+
+                    EXECUTE REPLACE($template${function}$template$, '-- static routing branches', branches);
+                END;
+            $build$ LANGUAGE plpgsql SECURITY DEFINER;
+
+            SELECT {{parent_table}}_build_insert_child();
+        """.format(function=function)
+
+    def _get_routing_definitions(self, value, indentation):
         """
-        Returns definitions for string firstchars partition subtype.
+        Returns definitions for chosen partition type/subtype ready to be used inside of a function.
+
+        :param string value: (required). Expression which holds partition column value.
+        :param dict indentation: (required). Indentation level of every definition inside of a function.
         """
-        if not self.constraint.isdigit() or int(self.constraint) < 1:
-            raise PartitionConstraintError(
-                model=self.model.__name__,
-                dialect=self.dialect,
-                current=self.constraint,
-                allowed=['positive integer'])
+        definitions, formatters = self._get_definitions()
+        formatters['value'] = value
 
-        return {
-            'variables': [
-                "match := LOWER(SUBSTR(NEW.{{column}}, 1, {constraint}));",
-                "tablename := QUOTE_IDENT('{{parent_table}}_' || match);",
-                "checks := 'LOWER(SUBSTR({{column}}, 1, {constraint})) = ''' || match || '''';"
-            ]
-        }
+        for definition in indentation:
+            for index, _ in enumerate(definitions.setdefault(definition, [])):
+                if index > 0:
+                    definitions[definition][index] = '    ' * indentation[definition] + definitions[definition][index]
 
-    def _get_string_lastchars_definitions(self):
+            definitions[definition] = '\n'.join(definitions[definition]).format(**formatters)
+
+        return definitions
+
+    def _exists_trigger(self):
+        return False
+
+    def _create_trigger(self):
+        pass
+
+    def _prepare_single_write(self):
         """
-        Returns definitions for string lastchars partition subtype.
+        Prepares needed triggers, functions, view and rule to write every row only once. Inserts into
+        the table are redirected by the rule into the view which routes rows via its instead of trigger,
+        that allows insert statements to return inserted rows, e.g. primary key, which ORMs rely on. Before
+        insert trigger on the table itself handles statements which ignore rules, e.g. COPY.
         """
-        if not self.constraint.isdigit() or int(self.constraint) < 1:
-            raise PartitionConstraintError(
-                model=self.model.__name__,
-                dialect=self.dialect,
-                current=self.constraint,
-                allowed=['positive integer'])
+        return self.database.execute("""
+            -- Other modes may have been used before
+            DROP TRIGGER IF EXISTS after_insert_{{parent_table}}_trigger ON "{{parent_table}}";
+            DROP TRIGGER IF EXISTS after_insert_{{parent_table}}_statement_trigger ON "{{parent_table}}";
+
+            -- We need to create a before insert function
+            {function}
+
+            -- Then we create a trigger which calls the before insert function
+            DO $$
+            BEGIN
+            IF NOT EXISTS(
+                SELECT 1
+                FROM information_schema.triggers
+                WHERE event_object_table = '{{parent_table}}'
+                AND trigger_name = LOWER('before_insert_{{parent_table}}_trigger')
+            ) THEN
+                CREATE TRIGGER before_insert_{{parent_table}}_trigger
+                    BEFORE INSERT ON "{{parent_table}}"
+                    FOR EACH ROW EXECUTE PROCEDURE {{parent_table}}_insert_child();
+            END IF;
+            END $$;
+
+            -- Then we create a view with the instead of insert trigger which calls the same function
+            CREATE OR REPLACE VIEW "{{parent_table}}_insert_view" AS SELECT * FROM ONLY "{{parent_table}}";
+
+            DO $$
+            BEGIN
+            IF NOT EXISTS(
+                SELECT 1
+                FROM information_schema.triggers
+                WHERE event_object_table = '{{parent_table}}_insert_view'
+                AND trigger_name = LOWER('instead_of_insert_{{parent_table}}_trigger')
+            ) THEN
+                CREATE TRIGGER instead_of_insert_{{parent_table}}_trigger
+                    INSTEAD OF INSERT ON "{{parent_table}}_insert_view"
+                    FOR EACH ROW EXECUTE PROCEDURE {{parent_table}}_insert_child();
+            END IF;
+            END $$;
+
+            -- Lastly we create the rule which redirects inserts into the view
+            CREATE OR REPLACE RULE insert_{{parent_table}}_rule AS
+                ON INSERT TO "{{parent_table}}" DO INSTEAD
+                INSERT INTO "{{parent_table}}_insert_view" VALUES (NEW.*) RETURNING *;
+        """.format(function=self._get_insert_function().strip()).format(
+            parent_table=self.table,
+            column='"{0}"'.format(self.column_name)
+        ))
+
+    _exists_single_write = _exists_trigger
+    _create_single_write = _create_trigger
+
+    def _prepare_statement(self):
+        """
+        Prepares statement level trigger and function for this trigger. Instead of routing every row separately
+        the function groups all inserted rows by partitions and moves every group with a single statement.
+        """
+        definitions = self._get_routing_definitions('value', {'declarations': 5, 'variables': 7})
+
+        return self.database.execute("""
+            -- Other modes may have been used before
+            DROP RULE IF EXISTS insert_{{parent_table}}_rule ON "{{parent_table}}";
+            DROP TRIGGER IF EXISTS before_insert_{{parent_table}}_trigger ON "{{parent_table}}";
+            DROP TRIGGER IF EXISTS after_insert_{{parent_table}}_trigger ON "{{parent_table}}";
+
+            -- We need to create an after insert function
+            CREATE OR REPLACE FUNCTION {{parent_table}}_insert_children()
+            RETURNS TRIGGER AS $$
+                DECLARE
+                    value "{{parent_table}}".{{column}}%TYPE;
+                    match "{{parent_table}}".{{column}}%TYPE;
+                    tablename VARCHAR;
+                    tablenames VARCHAR[] := '{{{{}}}}';
+                    checks TEXT;
+                    {declarations}
+                BEGIN
+                    FOR value IN SELECT DISTINCT {{column}} FROM new_rows LOOP
+                        IF value IS NULL THEN
+                            tablename := '{{parent_table}}_null';
+                            checks := '{{column}} IS NULL';
+                        ELSE
+                            {variables}
+                        END IF;
+
+                        -- Several values may belong to the same partition
+                        CONTINUE WHEN tablename = ANY(tablenames);
+                        tablenames := tablenames || tablename;
+
+                        IF TO_REGCLASS(tablename) IS NULL THEN
+                            PERFORM PG_ADVISORY_XACT_LOCK(HASHTEXT(tablename));
+                            EXECUTE 'CREATE TABLE IF NOT EXISTS ' || tablename || ' (
+                                CHECK (' || checks || '),
+                                LIKE "{{parent_table}}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES
+                            ) INHERITS ("{{parent_table}}");';
+                        END IF;
+
+                        EXECUTE 'INSERT INTO ' || tablename || ' SELECT * FROM new_rows WHERE ' || checks || ';';
+                    END LOOP;
+
+                    DELETE FROM ONLY "{{parent_table}}" WHERE ({{pk}}) IN (SELECT {{pk}} FROM new_rows);
+                    RETURN NULL;
+                END;
+            $$ LANGUAGE plpgsql SECURITY DEFINER;
+
+            -- Lastly we create the after insert trigger which calls the after insert function
+            DO $$
+            BEGIN
+            IF NOT EXISTS(
+                SELECT 1
+                FROM information_schema.triggers
+                WHERE event_object_table = '{{parent_table}}'
+                AND trigger_name = LOWER('after_insert_{{parent_table}}_statement_trigger')
+            ) THEN
+                CREATE TRIGGER after_insert_{{parent_table}}_statement_trigger
+                    AFTER INSERT ON "{{parent_table}}"
+                    REFERENCING NEW TABLE AS new_rows
+                    FOR EACH STATEMENT EXECUTE PROCEDURE {{parent_table}}_insert_children();
+            END IF;
+            END $$;
+        """.format(**definitions).format(
+            pk=', '.join(self.pks),
+            parent_table=self.table,
+            column='"{0}"'.format(self.column_name)
+        ))
+
+    _exists_statement = _exists_trigger
+    _create_statement = _create_trigger
+
+    def _prepare_native(self):
+        """
+        Converts table into a declaratively partitioned one. Existing table becomes a default partition,
+        so that the data it contains as well as rows which don't fit into any partition remain accessible.
+        """
+        return self.database.execute("""
+            DO $$
+            BEGIN
+            IF NOT EXISTS(
+                SELECT 1
+                FROM pg_partitioned_table
+                WHERE partrelid = '"{parent_table}"'::regclass
+            ) THEN
+                DROP RULE IF EXISTS insert_{parent_table}_rule ON "{parent_table}";
+                DROP TRIGGER IF EXISTS before_insert_{parent_table}_trigger ON "{parent_table}";
+                DROP TRIGGER IF EXISTS after_insert_{parent_table}_trigger ON "{parent_table}";
+                DROP TRIGGER IF EXISTS after_insert_{parent_table}_statement_trigger ON "{parent_table}";
+                ALTER TABLE "{parent_table}" RENAME TO "{parent_table}_default";
+
+                CREATE TABLE "{parent_table}" (
+                    LIKE "{parent_table}_default" INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+                ) PARTITION BY {key};
+
+                ALTER TABLE "{parent_table}" ATTACH PARTITION "{parent_table}_default" DEFAULT;
+            END IF;
+            END $$;
+        """.format(parent_table=self.table, key=self._get_native_key()))
+
+    def _exists_native(self):
+        """
+        Rows with NULL value in partition column always go to the default partition which always exists.
+        """
+        if self.column_value is None:
+            return True
+
+        # Table of the partition may exist detached, e.g. after an interrupted migration
+        return self._exists_cached(self._get_name(), lambda: self.database.select_one(
+            "SELECT EXISTS(SELECT 1 FROM pg_inherits WHERE inhrelid = to_regclass('{0}'));".format(
+                self._get_name().replace("'", "''"))))
+
+    def _create_native(self):
+        """
+        Creates new partition, advisory lock protects from the concurrent creation of the same partition.
+        Rows for the new partition, which were already saved into the default partition, are moved into it
+        before it is attached, otherwise PostgreSQL doesn't allow to attach it. The move is skipped if the
+        default partition holds only rows with NULL value, which is the case once the data was migrated.
+        """
+        result = self.database.execute("""
+            DO $$
+            BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('{child_table_literal}'));
+
+            {create_table}
+
+            IF NOT EXISTS(SELECT 1 FROM pg_inherits WHERE inhrelid = '{child_table_literal}'::regclass) THEN
+                IF EXISTS(SELECT 1 FROM ONLY "{parent_table}_default" WHERE "{column}" IS NOT NULL) THEN
+                    WITH moved AS (
+                        DELETE FROM ONLY "{parent_table}_default" WHERE {checks} RETURNING *
+                    )
+                    INSERT INTO {child_table} SELECT * FROM moved;
+                END IF;
+
+                ALTER TABLE "{parent_table}" ATTACH PARTITION {child_table} FOR VALUES {bounds};
+            END IF;
+            END $$;
+        """.format(
+            parent_table=self.table,
+            child_table=self._get_name(),
+            child_table_literal=self._get_name().replace("'", "''"),
+            column=self.column_name,
+            checks=self._get_checks(),
+            bounds=self._get_native_bounds(),
+            create_table=self._get_native_table_definition()
+        ))
+
+        self.cache.add(self._get_name())
+        return result
+
+    def _get_native_table_definition(self):
+        """
+        Returns statement which creates table for the new partition if it doesn't exist, with the indexes of
+        the default partition, which is the original table. Check constraint lets PostgreSQL skip the
+        validation scan of the table when it is attached.
+        """
+        return """IF to_regclass('{child_table_literal}') IS NULL THEN
+                CREATE TABLE {child_table} (
+                    LIKE "{parent_table}_default" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES,
+                    CHECK ({checks})
+                );
+            END IF;""".format(
+            parent_table=self.table,
+            child_table=self._get_name(),
+            child_table_literal=self._get_name().replace("'", "''"),
+            checks=self._get_checks()
+        )
+
+    def copy(self, columns, rows):
+        """
+        Copies rows straight into partitions via COPY statement, bypassing insert triggers.
+        """
+        partitions = {}
+
+        for row in rows:
+            partition = copy.copy(self)
+            partition.column_value = row[self.column_name]
+            partitions.setdefault(partition._get_name(), (partition, []))[1].append(row)
+
+        # All the needed partitions are created before any data is copied
+        for partition, _ in partitions.values():
+            partition._ensure()
+
+        for name, (partition, partition_rows) in partitions.items():
+            # Rows with NULL value go to the default partition which the database chooses by itself
+            if partition.mode == 'native' and partition.column_value is None:
+                name = '"{0}"'.format(self.table)
+
+            self.database.copy('COPY {0} ({1}) FROM STDIN;'.format(
+                name, ', '.join('"{0}"'.format(column) for column in columns)), CopyStream(columns, partition_rows))
+
+    def _ensure(self):
+        """
+        Creates partition for the current column value if it doesn't exist, regardless of the partition mode.
+        Returns whether it was created.
+        """
+        if self.mode == 'native':
+            if self._exists_native():
+                return False
+
+            self._create_native()
+        # Creation is idempotent, so the database isn't asked whether the partition exists
+        elif self._exists_cached(self._get_name(), lambda: False):
+            return False
+        else:
+            self._create_inherited(self._get_name(), self._get_checks())
+            self.cache.add(self._get_name())
+
+        return True
+
+    def _create_inherited(self, name, checks):
+        """
+        Creates new partition for the modes where partitions are usually created by the insert trigger, that
+        is needed when rows bypass it. Insert function is rebuilt with static routing, so it knows about the
+        new partition.
+
+        :param string name: (required). Name of the partition.
+        :param string checks: (required). Check constraint of the partition.
+        """
+        return self.database.execute("""
+            DO $$
+            BEGIN
+            IF TO_REGCLASS('{child_table}') IS NULL THEN
+                PERFORM PG_ADVISORY_XACT_LOCK(HASHTEXT('{child_table}'));
+
+                CREATE TABLE IF NOT EXISTS {child_table} (
+                    CHECK ({checks}),
+                    LIKE "{parent_table}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES
+                ) INHERITS ("{parent_table}");
+
+                {rebuild}
+            END IF;
+            END $$;
+        """.format(
+            parent_table=self.table,
+            child_table=name.replace("'", "''"),
+            checks=checks,
+            rebuild='PERFORM {0}_build_insert_child();'.format(self.table) if self.routing == 'static' else ''
+        ))
+
+    def _get_checks(self):
+        """
+        Returns check constraint for the partition for the current column value.
+        """
+        raise NotImplementedError('Method "_get_checks" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def _get_name(self):
+        """
+        Returns name of the partition for the current column value.
+        """
+        raise NotImplementedError('Method "_get_name" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def _get_native_key(self):
+        """
+        Returns partition key definition used by the declarative partitioning.
+        """
+        raise NotImplementedError('Method "_get_native_key" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def _get_native_bounds(self):
+        """
+        Returns partition bounds definition for the current column value used by the declarative partitioning.
+        """
+        raise NotImplementedError(
+            'Method "_get_native_bounds" not implemented in: {0}'.format(self.__class__.__name__))
+
+    def _get_definitions(self):
+        """
+        Returns needed definitions for chosen partition type/subtype.
+        """
+        raise NotImplementedError('Method "_get_definitions" not implemented in: {0}'.format(self.__class__.__name__))
+
+    @staticmethod
+    def _quote_ident(name):
+        """
+        Quotes identifier only if it is needed, the same way as PostgreSQL's QUOTE_IDENT function does.
+
+        :param string name: (required). Identifier to quote.
+        """
+        if re.match(r'^[a-z_][a-z0-9_$]*$', name) is not None:
+            return name
+
+        return '"{0}"'.format(name.replace('"', '""'))
+
+    @staticmethod
+    def _quote_literal(value):
+        """
+        Quotes value to be used as a literal in SQL statement, the same way as PostgreSQL's QUOTE_LITERAL
+        function does, numbers are left as is.
+
+        :param object value: (required). Value to quote.
+        """
+        if isinstance(value, numbers.Number) and not isinstance(value, bool):
+            return text_type(value)
+
+        return "'{0}'".format(text_type(value).replace("'", "''"))
+
+
+class RangePartition(Partition):
+    """
+    Range partition type implementation.
+    """
+    def __init__(self, model, **meta):
+        super(RangePartition, self).__init__(model, **meta)
+        self.constraint = meta['constraint']
+        self.subtype = meta['subtype']
+
+    def _get_definitions(self):
+        """
+        Dynamically returns needed definitions depending on the partition subtype.
+        """
+        definitions = self._get_subtype_method('definitions')()
+        formatters = dict(constraint=self.constraint, subtype=self.subtype, **definitions.pop('formatters', {}))
+        return definitions, formatters
+
+    def _get_name(self):
+        """
+        Dynamically defines partition name depending on the partition subtype, the
+        same way as it is done at the database level by the trigger functions.
+        """
+        if self.column_value is None:
+            return '{0}_null'.format(self.table)
+
+        return self._get_subtype_method('name')()
+
+    def _get_checks(self):
+        """
+        Dynamically returns check constraint depending on the partition subtype, the
+        same way as it is done at the database level by the trigger functions.
+        """
+        if self.column_value is None:
+            return '"{0}" IS NULL'.format(self.column_name)
+
+        return self._get_subtype_method('checks')()
+
+    def _get_upcoming_values(self, until, periods):
+        """
+        Dynamically returns column values for the current partition and the following ones
+        depending on the partition subtype.
+        """
+        return self._get_subtype_method('upcoming')(until, periods)
+
+    def _get_retention_value(self):
+        """
+        Dynamically returns the oldest column value which has to be kept depending on the partition subtype.
+        """
+        return self._get_subtype_method('retention')()
+
+    def _get_order(self, name):
+        """
+        Dynamically returns sort key of the given partition name depending on the partition subtype.
+        """
+        return self._get_subtype_method('order')(name)
+
+    def _get_native_key(self):
+        """
+        Returns partition key definition, only subtypes with ranges are supported.
+        """
+        self._get_subtype_method('range')
+        return 'RANGE ("{0}")'.format(self.column_name)
+
+    def _get_native_bounds(self):
+        """
+        Returns partition bounds definition for the current column value.
+        """
+        return "FROM ('{0}') TO ('{1}')".format(*self._get_subtype_method('range')())
+
+    def _get_subtype_method(self, name):
+        """
+        Returns implementation of the requested method for the chosen partition subtype.
+
+        :param string name: (required). Name of the method without subtype.
+        """
+        try:
+            return getattr(self, '_get_{0}_{1}'.format(self.subtype, name))
+        except AttributeError:
+            expression = r'_get_(\w+)_{0}$'.format(name)
+            raise PartitionRangeSubtypeError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.subtype,
+                allowed=[re.match(expression, c).group(1) for c in dir(self) if re.match(expression, c) is not None])
+
+    def _get_date_definitions(self):
+        """
+        Returns definitions for date partition subtype.
+        """
+        patterns = {
+            'day': '"y"YYYY"d"DDD',
+            'week': '"y"IYYY"w"IW',
+            'month': '"y"YYYY"m"MM',
+            'year': '"y"YYYY',
+        }
+
+        try:
+            pattern = patterns[self.constraint]
+        except KeyError:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=patterns.keys())
+
+        return {
+            'formatters': {'pattern': pattern},
+            'variables': [
+                "match := DATE_TRUNC('{constraint}', {value});",
+                "tablename := '{{parent_table}}_' || TO_CHAR({value}, '{pattern}');",
+                "checks := '{{column}} >= ''' || match || ''' AND {{column}} < ''' || (match + INTERVAL '1 {constraint}') || '''';"
+            ]
+        }
+
+    def _get_date_name(self):
+        """
+        Defines name for a new partition for date partition subtype.
+        """
+        patterns = {
+            'day': 'y%Yd%j',
+            'week': 'y{0:04d}w{1:02d}'.format(*self.column_value.isocalendar()[:2]),
+            'month': 'y%Ym%m',
+            'year': 'y%Y',
+        }
+
+        try:
+            pattern = patterns[self.constraint]
+        except KeyError:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=patterns.keys())
+
+        return '{0}_{1}'.format(self.table, self.column_value.strftime(pattern))
+
+    def _get_date_range(self):
+        """
+        Returns half-open range of values for a new partition for date partition subtype.
+        """
+        self._get_date_name()  # validates constraint
+        return DateTime(self.column_value).get_boundaries(self.constraint)
+
+    def _get_date_upcoming(self, until, periods):
+        """
+        Returns column values for the current partition and the following ones for date partition subtype,
+        current partition is the one for the current date.
+        """
+        if self.constraint not in ('day', 'week', 'month', 'year'):
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['day', 'week', 'month', 'year'])
+
+        return DateTime(datetime.datetime.now()).upcoming(self.constraint, until, periods)
+
+    def _get_date_retention(self):
+        """
+        Returns the oldest column value which has to be kept for date partition subtype.
+        """
+        try:
+            return DateTime(datetime.datetime.now()).ago(self.retention)
+        except ValueError:
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.retention,
+                option='retention',
+                cause='duration is expected, e.g. 90 days, 12 weeks, 6 months or 1 year')
+
+    @staticmethod
+    def _get_date_order(name):
+        """
+        Returns sort key of the given partition name for date partition subtype, which is the
+        part of the name after the table name, it is ordered the same way as the dates are.
+        """
+        return name.strip('"').rsplit('_', 1)[1]
+
+    def _get_date_checks(self):
+        """
+        Returns check constraint for a new partition for date partition subtype.
+        """
+        return "\"{0}\" >= '{1}' AND \"{0}\" < '{2}'".format(self.column_name, *self._get_date_range())
+
+    def _get_integer_definitions(self):
+        """
+        Returns definitions for integer partition subtype.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        return {
+            'variables': [
+                "IF {value} = 0 THEN",
+                "    tablename := '{{parent_table}}_0';",
+                "    checks := '{{column}} = 0';",
+                "ELSE",
+                "    IF {value} > 0 THEN",
+                "        match := (({value} - 1) / {constraint}) * {constraint} + 1;",
+                "        tablename := '{{parent_table}}_' || match || '_' || (match + {constraint}) - 1;",
+                "    ELSE",
+                "        match := FLOOR({value} :: FLOAT / {constraint} :: FLOAT) * {constraint};",
+                "        tablename := '{{parent_table}}_m' || ABS(match) || '_m' || ABS((match + {constraint}) - 1);",
+                "    END IF;",
+                "    checks := '{{column}} >= ' || match || ' AND {{column}} <= ' || (match + {constraint}) - 1;",
+                "END IF;"
+            ]
+        }
+
+    def _get_integer_name(self):
+        """
+        Defines name for a new partition for integer partition subtype.
+        """
+        start, end = self._get_integer_range()
+
+        if start == 0:
+            return '{0}_0'.format(self.table)
+        elif start > 0:
+            return '{0}_{1}_{2}'.format(self.table, start, end - 1)
+        else:
+            return '{0}_m{1}_m{2}'.format(self.table, abs(start), abs(end - 1))
+
+    def _get_integer_range(self):
+        """
+        Returns half-open range of values for a new partition for integer partition subtype.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        constraint = int(self.constraint)
+
+        if self.column_value == 0:
+            return 0, 1
+        elif self.column_value > 0:
+            start = ((self.column_value - 1) // constraint) * constraint + 1
+        else:
+            start = (self.column_value // constraint) * constraint
+
+        return start, start + constraint
+
+    def _get_integer_upcoming(self, until, periods):
+        """
+        Returns column values for the current partition and the following ones for integer partition subtype,
+        current partition is the one for the highest value in the table, until is the highest expected value.
+        """
+        if until is not None and not isinstance(until, numbers.Integral):
+            # Nothing predicts how fast the values grow, so a duration can't be turned into values
+            raise PartitionRangeSubtypeError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.subtype,
+                allowed=['date'])
+
+        partition = copy.copy(self)
+        partition.column_value = self.database.select_one(
+            'SELECT MAX("{0}") FROM "{1}";'.format(self.column_name, self.table)) or 0
+        values = []
+
+        while (partition.column_value <= until) if isinstance(until, numbers.Integral) else (len(values) <= periods):
+            values.append(partition.column_value)
+            partition.column_value = partition._get_integer_range()[1]
+
+        return values
+
+    def _get_integer_retention(self):
+        """
+        Returns the oldest column value which has to be kept for integer partition subtype, retention
+        is the number of values below the highest value in the table.
+        """
+        if not text_type(self.retention).isdigit():
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.retention,
+                option='retention',
+                cause='number of values to keep is expected, e.g. 1000000')
+
+        return (self.database.select_one(
+            'SELECT MAX("{0}") FROM "{1}";'.format(self.column_name, self.table)) or 0) - int(self.retention)
+
+    @staticmethod
+    def _get_integer_order(name):
+        """
+        Returns sort key of the given partition name for integer partition subtype, which is the
+        highest value the partition holds.
+        """
+        value = name.strip('"').rsplit('_', 1)[1]
+        return -int(value[1:]) if value.startswith('m') else int(value)
+
+    def _get_integer_checks(self):
+        """
+        Returns check constraint for a new partition for integer partition subtype.
+        """
+        start, end = self._get_integer_range()
+
+        if start == 0:
+            return '"{0}" = 0'.format(self.column_name)
+
+        return '"{0}" >= {1} AND "{0}" <= {2}'.format(self.column_name, start, end - 1)
+
+    def _get_string_firstchars_definitions(self):
+        """
+        Returns definitions for string firstchars partition subtype.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        return {
+            'variables': [
+                "match := LOWER(SUBSTR({value}, 1, {constraint}));",
+                "tablename := QUOTE_IDENT('{{parent_table}}_' || match);",
+                "checks := 'LOWER(SUBSTR({{column}}, 1, {constraint})) = ''' || match || '''';"
+            ]
+        }
+
+    def _get_string_firstchars_name(self):
+        """
+        Defines name for a new partition for string firstchars partition subtype.
+        """
+        return self._quote_ident('{0}_{1}'.format(self.table, self._get_string_firstchars_match()))
+
+    def _get_string_firstchars_checks(self):
+        """
+        Returns check constraint for a new partition for string firstchars partition subtype.
+        """
+        return "LOWER(SUBSTR(\"{0}\", 1, {1})) = '{2}'".format(
+            self.column_name, self.constraint, self._get_string_firstchars_match().replace("'", "''"))
+
+    def _get_string_firstchars_match(self):
+        """
+        Returns partition column value part which determines partition for string firstchars partition subtype.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        return self.column_value[:int(self.constraint)].lower()
+
+    def _get_string_lastchars_definitions(self):
+        """
+        Returns definitions for string lastchars partition subtype.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
 
         return {
             'variables': [
-                "match := LOWER(SUBSTRING(NEW.{{column}} FROM '.{{{{{constraint}}}}}$'));",
+                "match := LOWER(SUBSTRING({value} FROM '.{{{{{constraint}}}}}$'));",
                 "tablename := QUOTE_IDENT('{{parent_table}}_' || match);",
                 "checks := 'LOWER(SUBSTRING({{column}} FROM ''.{{{{{constraint}}}}}$'')) = ''' || match || '''';"
             ]
         }
+
+    def _get_string_lastchars_name(self):
+        """
+        Defines name for a new partition for string lastchars partition subtype.
+        """
+        return self._quote_ident('{0}_{1}'.format(self.table, self._get_string_lastchars_match()))
+
+    def _get_string_lastchars_checks(self):
+        """
+        Returns check constraint for a new partition for string lastchars partition subtype.
+        """
+        return "LOWER(SUBSTRING(\"{0}\" FROM '.{{{1}}}$')) = '{2}'".format(
+            self.column_name, self.constraint, self._get_string_lastchars_match().replace("'", "''"))
+
+    def _get_string_lastchars_match(self):
+        """
+        Returns partition column value part which determines partition for string lastchars partition subtype.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        return self.column_value[-int(self.constraint):].lower()
+
+
+class HashPartition(Partition):
+    """
+    Hash partition type implementation. Rows are spread evenly among the fixed number of partitions
+    which is set by the constraint option. All partitions are created by the prepare method, so that
+    the insert path never needs to create one.
+    """
+    def __init__(self, model, **meta):
+        super(HashPartition, self).__init__(model, **meta)
+        self.constraint = meta['constraint']
+
+    def prepare(self):
+        """
+        Prepares everything that is needed to initialize partitioning depending on the partition
+        mode and creates all partitions.
+        """
+        result = super(HashPartition, self).prepare()
+
+        if self.mode != 'native':
+            for remainder in range(self._get_modulus()):
+                self._create_inherited(
+                    '{0}_{1}'.format(self.table, remainder),
+                    'MOD(ABS(HASHTEXT("{0}"::TEXT)::BIGINT), {1}) = {2}'.format(
+                        self.column_name, self._get_modulus(), remainder))
+
+        return result
+
+    def exists(self):
+        """
+        Partitions always exist.
+        """
+        return True
+
+    def create(self):
+        """
+        There is nothing to create.
+        """
+        pass
+
+    def precreate(self, until=None, periods=1):
+        """
+        There is nothing to create in advance.
+        """
+        return []
+
+    def migrate(self, batch_size=10000, after=None, until=None, delay=0, callback=None):
+        """
+        In native mode the existing rows were moved into partitions by the prepare method.
+        """
+        if self.mode == 'native':
+            return 0
+
+        return super(HashPartition, self).migrate(
+            batch_size=batch_size, after=after, until=until, delay=delay, callback=callback)
+
+    def migrate_ranges(self, count):
+        """
+        In native mode there are no rows to split into ranges.
+        """
+        if self.mode == 'native':
+            return [[None, None]]
+
+        return super(HashPartition, self).migrate_ranges(count)
+
+    def create_missing(self, values):
+        """
+        There is nothing to create for a batch of values.
+        """
+        return []
+
+    def copy(self, columns, rows):
+        """
+        All partitions already exist, so rows are copied into the partitioned table and routed by the database.
+        """
+        self.database.copy('COPY "{0}" ({1}) FROM STDIN;'.format(
+            self.table, ', '.join('"{0}"'.format(column) for column in columns)), CopyStream(columns, rows))
+
+    def _prepare_native(self):
+        """
+        Converts table into a declaratively hash partitioned one. Hash partitioned tables can't have a default
+        partition, so the existing data is moved into the new partitions, which get all the indexes of the old
+        table, and the old table is dropped after the ownership of its sequences is transferred to the new table.
+        """
+        return self.database.execute("""
+            DO $$
+            DECLARE
+                owned RECORD;
+            BEGIN
+            IF NOT EXISTS(
+                SELECT 1
+                FROM pg_partitioned_table
+                WHERE partrelid = '"{parent_table}"'::regclass
+            ) THEN
+                DROP RULE IF EXISTS insert_{parent_table}_rule ON "{parent_table}";
+                DROP TRIGGER IF EXISTS before_insert_{parent_table}_trigger ON "{parent_table}";
+                DROP TRIGGER IF EXISTS after_insert_{parent_table}_trigger ON "{parent_table}";
+                DROP TRIGGER IF EXISTS after_insert_{parent_table}_statement_trigger ON "{parent_table}";
+                ALTER TABLE "{parent_table}" RENAME TO "{parent_table}_unpartitioned";
+
+                CREATE TABLE "{parent_table}" (
+                    LIKE "{parent_table}_unpartitioned" INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+                ) PARTITION BY HASH ("{column}");
+
+                FOR remainder IN 0..{modulus} - 1 LOOP
+                    EXECUTE FORMAT(
+                        'CREATE TABLE %I (LIKE "{parent_table}_unpartitioned" INCLUDING DEFAULTS INCLUDING CONSTRAINTS '
+                        'INCLUDING INDEXES);',
+                        '{parent_table}_' || remainder
+                    );
+                    EXECUTE FORMAT(
+                        'ALTER TABLE "{parent_table}" ATTACH PARTITION %I FOR VALUES WITH (MODULUS {modulus}, REMAINDER %s);',
+                        '{parent_table}_' || remainder,
+                        remainder
+                    );
+                END LOOP;
+
+                INSERT INTO "{parent_table}" SELECT * FROM "{parent_table}_unpartitioned";
+
+                FOR owned IN
+                    SELECT d.objid::regclass AS sequence, a.attname
+                    FROM pg_depend d JOIN pg_attribute a ON a.attrelid = d.refobjid AND a.attnum = d.refobjsubid
+                    WHERE d.refobjid = '"{parent_table}_unpartitioned"'::regclass
+                    AND d.classid = 'pg_class'::regclass AND d.deptype = 'a'
+                LOOP
+                    EXECUTE FORMAT('ALTER SEQUENCE %s OWNED BY "{parent_table}".%I;', owned.sequence, owned.attname);
+                END LOOP;
+
+                DROP TABLE "{parent_table}_unpartitioned";
+            END IF;
+            END $$;
+        """.format(
+            parent_table=self.table,
+            column=self.column_name,
+            modulus=self._get_modulus()
+        ))
+
+    def _get_definitions(self):
+        """
+        Returns definitions for hash partition type, the value is hashed the same way in partition's check constraint.
+        """
+        return {
+            'declarations': ['remainder INTEGER;'],
+            'variables': [
+                "remainder := MOD(ABS(HASHTEXT({value}::TEXT)::BIGINT), {modulus});",
+                "tablename := '{{parent_table}}_' || remainder;",
+                "checks := 'MOD(ABS(HASHTEXT({{column}}::TEXT)::BIGINT), {modulus}) = ' || remainder;"
+            ]
+        }, {'modulus': self._get_modulus()}
+
+    def _get_modulus(self):
+        """
+        Returns number of partitions.
+        """
+        if not self.constraint.isdigit() or int(self.constraint) < 1:
+            raise PartitionConstraintError(
+                model=self.model.__name__,
+                dialect=self.dialect,
+                current=self.constraint,
+                allowed=['positive integer'])
+
+        return int(self.constraint)
+
+
+class ListPartition(Partition):
+    """
+    List partition type implementation. Values option maps names of the partitions to lists of values which
+    go into them, rows with all other values go into the default partition. All partitions are created by
+    the prepare method, so that the insert path never needs to create one.
+    """
+    def __init__(self, model, **meta):
+        super(ListPartition, self).__init__(model, **meta)
+        self.values = meta['values']
+
+    def prepare(self):
+        """
+        Prepares everything that is needed to initialize partitioning depending on the partition
+        mode and creates all partitions, including the default one.
+        """
+        result = super(ListPartition, self).prepare()
+
+        for name, values in sorted(self._get_values().items()):
+            name = self._quote_ident('{0}_{1}'.format(self.table, name))
+
+            if self.mode == 'native':
+                self._attach_native(name, values)
+            else:
+                self._create_inherited(name, self._get_list_checks(values))
+
+        # Native mode already has the default partition
+        if self.mode != 'native':
+            self._create_inherited(self._get_default_name(), self._get_list_checks())
+
+        return result
+
+    def exists(self):
+        """
+        Partitions always exist.
+        """
+        return True
+
+    def create(self):
+        """
+        There is nothing to create.
+        """
+        pass
+
+    def precreate(self, until=None, periods=1):
+        """
+        There is nothing to create in advance.
+        """
+        return []
+
+    def migrate(self, batch_size=10000, after=None, until=None, delay=0, callback=None):
+        """
+        In native mode the existing rows were moved into partitions by the prepare method, rows with
+        all other values belong to the default partition.
+        """
+        if self.mode == 'native':
+            return 0
+
+        return super(ListPartition, self).migrate(
+            batch_size=batch_size, after=after, until=until, delay=delay, callback=callback)
+
+    def migrate_ranges(self, count):
+        """
+        In native mode there are no rows to split into ranges.
+        """
+        if self.mode == 'native':
+            return [[None, None]]
+
+        return super(ListPartition, self).migrate_ranges(count)
+
+    def _attach_native(self, name, values):
+        """
+        Creates new partition for the given values with the indexes of the default partition, which is the
+        original table. Rows with these values, which were already saved into the default partition, are moved
+        into the new partition before it is attached, otherwise PostgreSQL doesn't allow to attach it.
+
+        :param string name: (required). Name of the partition.
+        :param list values: (required). Values which go into the partition.
+        """
+        return self.database.execute("""
+            DO $$
+            BEGIN
+            IF TO_REGCLASS('{child_table_literal}') IS NULL THEN
+                CREATE TABLE {child_table} (
+                    LIKE "{parent_table}_default" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES
+                );
+
+                WITH moved AS (
+                    DELETE FROM "{parent_table}_default" WHERE "{column}" IN ({values}) RETURNING *
+                )
+                INSERT INTO {child_table} SELECT * FROM moved;
+
+                ALTER TABLE "{parent_table}" ATTACH PARTITION {child_table} FOR VALUES IN ({values});
+            END IF;
+            END $$;
+        """.format(
+            parent_table=self.table,
+            child_table=name,
+            child_table_literal=name.replace("'", "''"),
+            column=self.column_name,
+            values=', '.join(self._quote_literal(value) for value in values)
+        ))
+
+    def _get_name(self):
+        """
+        Returns name of the partition for the current column value, the same way as it is
+        done at the database level by the trigger functions.
+        """
+        if self.column_value is None:
+            return '{0}_null'.format(self.table)
+
+        for name, values in sorted(self._get_values().items()):
+            if self.column_value in values:
+                return self._quote_ident('{0}_{1}'.format(self.table, name))
+
+        return self._get_default_name()
+
+    def _get_checks(self):
+        """
+        Returns check constraint for the partition for the current column value.
+        """
+        if self.column_value is None:
+            return '"{0}" IS NULL'.format(self.column_name)
+
+        for name, values in sorted(self._get_values().items()):
+            if self.column_value in values:
+                return self._get_list_checks(values)
+
+        return self._get_list_checks()
+
+    def _get_default_name(self):
+        """
+        Returns name of the default partition.
+        """
+        return self._quote_ident('{0}_default'.format(self.table))
+
+    def _get_list_checks(self, values=None):
+        """
+        Returns check constraint for the partition with the given values or for the default partition
+        if values aren't given.
+
+        :param list values: (optional). Values which go into the partition.
+        """
+        if values is not None:
+            return '"{0}" IN ({1})'.format(self.column_name, ', '.join(self._quote_literal(v) for v in values))
+
+        return '"{0}" NOT IN ({1})'.format(self.column_name, ', '.join(
+            self._quote_literal(v) for _, values in sorted(self._get_values().items()) for v in values))
+
+    def _get_native_key(self):
+        """
+        Returns partition key definition.
+        """
+        return 'LIST ("{0}")'.format(self.column_name)
+
+    def _get_definitions(self):
+        """
+        Returns definitions for list partition type, value is matched against the values of every partition.
+        """
+        def escape(string):
+            # Definitions are formatted twice before they get into the database
+            return string.replace('{', '{{{{').replace('}', '}}}}')
+
+        variables = ['CASE']
+
+        for name, values in sorted(self._get_values().items()):
+            variables.extend([
+                '    WHEN {{value}} IN ({0}) THEN'.format(escape(', '.join(self._quote_literal(v) for v in values))),
+                '        tablename := {0};'.format(escape(self._quote_literal(
+                    self._quote_ident('{0}_{1}'.format(self.table, name))))),
+                '        checks := {0};'.format(escape(self._quote_literal(self._get_list_checks(values)))),
+            ])
+
+        variables.extend([
+            '    ELSE',
+            '        tablename := {0};'.format(escape(self._quote_literal(self._get_default_name()))),
+            '        checks := {0};'.format(escape(self._quote_literal(self._get_list_checks()))),
+            'END CASE;',
+        ])
+
+        return {'variables': variables}, {}
+
+    def _get_values(self):
+        """
+        Returns mapping of partition names to the lists of values which go into them.
+        """
+        if not isinstance(self.values, dict) or not self.values or not all(
+                isinstance(values, (list, tuple)) and values for values in self.values.values()):
+            raise OptionValueError(
+                model=self.model.__name__,
+                current=self.values,
+                option='values',
+                cause='it should be a dictionary which maps partition names to non empty lists of values')
+
+        return self.values
+
+
+class CopyStream(object):
+    """
+    File-like object which lazily encodes rows into PostgreSQL's COPY text format.
+    """
+    escapes = (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r'))
+
+    def __init__(self, columns, rows):
+        """
+        :param list columns: (required). Names of the columns to encode.
+        :param iterable rows: (required). Dictionaries which map column names to values.
+        """
+        self.lines = ('\t'.join(self.encode(row.get(column)) for column in columns) + '\n' for row in rows)
+        self.buffer = ''
+
+    def read(self, size=-1):
+        """
+        Returns at most size characters of encoded data or all of the data if size is negative.
+
+        :param integer size: (optional). Number of characters to return.
+        """
+        while size < 0 or len(self.buffer) < size:
+            try:
+                self.buffer += next(self.lines)
+            except StopIteration:
+                break
+
+        size = len(self.buffer) if size < 0 else size
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    @classmethod
+    def encode(cls, value):
+        """
+        Encodes single value into PostgreSQL's COPY text format.
+
+        :param object value: (required). Value to encode.
+        """
+        if value is None:
+            return '\\N'
+        elif isinstance(value, bool):
+            return 't' if value else 'f'
+
+        value = text_type(value)
+
+        for char, escape in cls.escapes:
+            value = value.replace(char, escape)
+
+        return value
@@ -4,7 +4,10 @@ database during tests, that is the main reason why this dummy partitioning
 implementation exists.
 """
 
+import numbers
+
 from ..bases import BasePartition
+from ...compat import text_type
 
 
 class Partition(BasePartition):
@@ -17,6 +20,43 @@ class Partition(BasePartition):
     def create(self):
         pass
 
+    def names(self):
+        return []
+
+    def precreate(self, until=None, periods=1):
+        return []
+
+    def create_missing(self, values):
+        return []
+
+    def expired(self):
+        return []
+
+    def prune(self):
+        return []
+
+    def children(self, start=None, end=None):
+        return []
+
+    def children_query(self, start=None, end=None, columns='*'):
+        conditions = ['{0} {1} {2}'.format(self.column_name, operator, self._quote_literal(value))
+                      for operator, value in (('>=', start), ('<=', end)) if value is not None]
+        return 'SELECT {0} FROM {1}{2}'.format(
+            columns, self.table, ' WHERE {0}'.format(' AND '.join(conditions)) if conditions else '')
+
+    def migrate(self, batch_size=10000, after=None, until=None, delay=0, callback=None):
+        return 0
+
+    def migrate_ranges(self, count):
+        return [[None, None]]
+
+    @staticmethod
+    def _quote_literal(value):
+        if isinstance(value, numbers.Number) and not isinstance(value, bool):
+            return text_type(value)
+
+        return "'{0}'".format(text_type(value).replace("'", "''"))
+
 
 class RangePartition(Partition):
     pass
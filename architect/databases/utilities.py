@@ -3,8 +3,12 @@ Defines database related utilities.
 """
 
 import os
+import re
+import time
+import calendar
 import pkgutil
 import datetime
+import threading
 
 from ..exceptions import DatabaseError
 
@@ -100,3 +104,156 @@ class DateTime(object):
         end = datetime.datetime(self.now.year + 1, 1, 1, 23, 59, 59, 999999) - datetime.timedelta(1)
 
         return start.strftime(self.template), end.strftime(self.template)
+
+    def get_boundaries(self, period):
+        """
+        Returns beginning of the given period and beginning of the next period as datetime
+        objects, i.e. half-open range which is needed by databases with exclusive upper bounds.
+
+        :param string period: (required). Name of the period.
+        """
+        start = self.truncate(period)
+        return start, self.shift(start, period)
+
+    def truncate(self, period):
+        """
+        Returns beginning of the given period as a datetime object, works the same way
+        as PostgreSQL's DATE_TRUNC function, i.e. weeks start on Monday.
+
+        :param string period: (required). Name of the period.
+        """
+        start = self.now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        if period == 'week':
+            start -= datetime.timedelta(start.weekday())
+        elif period == 'month':
+            start = start.replace(day=1)
+        elif period == 'year':
+            start = start.replace(month=1, day=1)
+
+        return start
+
+    @staticmethod
+    def shift(start, period, count=1):
+        """
+        Returns beginning of the period which is located count periods away from the given one.
+
+        :param object start: (required). Datetime object representing beginning of the period.
+        :param string period: (required). Name of the period.
+        :param integer count: (optional). Number of periods to shift by, can be negative.
+        """
+        if period == 'day':
+            return start + datetime.timedelta(count)
+        elif period == 'week':
+            return start + datetime.timedelta(count * 7)
+
+        years, month = divmod(start.month - 1 + count * (12 if period == 'year' else 1), 12)
+        return start.replace(year=start.year + years, month=month + 1)
+
+    def ago(self, duration):
+        """
+        Returns datetime which is located the given duration before the current one, day of the month
+        is clamped to the last day of the resulting month if needed.
+
+        :param string duration: (required). Number of periods and name of the period, e.g. 90 days, 6 months.
+        """
+        match = re.match(r'^(\d+)\s*(day|week|month|year)s?$', duration.strip())
+
+        if match is None:
+            raise ValueError('invalid duration: {0}'.format(duration))
+
+        count, period = int(match.group(1)), match.group(2)
+
+        if period in ('day', 'week'):
+            return self.now - datetime.timedelta(count * (7 if period == 'week' else 1))
+
+        years, month = divmod(self.now.month - 1 - count * (12 if period == 'year' else 1), 12)
+        day = min(self.now.day, calendar.monthrange(self.now.year + years, month + 1)[1])
+        return self.now.replace(year=self.now.year + years, month=month + 1, day=day)
+
+    def upcoming(self, period, until=None, periods=1):
+        """
+        Returns list with beginnings of the current period and the following ones, either up
+        to the period which contains the given datetime or the given number of periods.
+
+        :param string period: (required). Name of the period.
+        :param object until: (optional). Date/Datetime object which should be covered by the periods.
+        :param integer periods: (optional). Number of periods that follow the current one.
+        """
+        start = self.truncate(period)
+
+        if until is None:
+            return [self.shift(start, period, count) for count in range(periods + 1)]
+
+        starts = [start]
+        until = DateTime(until).truncate(period)
+
+        while starts[-1] < until:
+            starts.append(self.shift(starts[-1], period))
+
+        return starts
+
+
+class PartitionCache(object):
+    """
+    Thread safe in-process cache of known partitions, which allows to check partition existence
+    without asking the database every time. Every entry is valid for the given number of seconds,
+    the whole cache is loaded again once this time passes since the last load.
+    """
+    def __init__(self, ttl=300):
+        """
+        :param integer ttl: (optional). Number of seconds an entry is valid for, 0 disables caching.
+        """
+        self.ttl = ttl
+        self.reload_at = 0
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self.reload_at > time.time()
+
+    def __contains__(self, key):
+        with self.lock:
+            expires = self.entries.get(key)
+
+            if expires is not None and expires <= time.time():
+                del self.entries[key]
+                expires = None
+
+            return expires is not None
+
+    def load(self, keys):
+        """
+        Replaces all entries with the given ones, usually fetched by a single catalog query.
+
+        :param iterable keys: (required). Keys of the known partitions.
+        """
+        with self.lock:
+            expires = time.time() + self.ttl
+            self.entries = dict((key, expires) for key in keys)
+            self.reload_at = expires
+
+    def add(self, key):
+        """
+        Adds a known partition.
+
+        :param object key: (required). Key of the partition.
+        """
+        if self.ttl > 0:
+            with self.lock:
+                self.entries[key] = time.time() + self.ttl
+
+    def invalidate(self, key=None):
+        """
+        Removes the given partition or all partitions if key isn't given, in the latter
+        case the cache will be loaded again from the database on next check.
+
+        :param object key: (optional). Key of the partition.
+        """
+        with self.lock:
+            if key is None:
+                self.entries = {}
+                self.reload_at = 0
+            else:
+                self.entries.pop(key, None)
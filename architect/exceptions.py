@@ -166,3 +166,13 @@ class PartitionFunctionError(BaseDatabaseError):
         super(PartitionFunctionError, self).__init__(
             'Unsupported partition function for column type "{{current}}" in "{model}" '
             'model, supported column types for "{dialect}" backend are: {{allowed}}', **kw)
+
+
+class PartitionModeError(BaseDatabaseError):
+    """
+    Unsupported partition mode.
+    """
+    def __init__(self, **kw):
+        super(PartitionModeError, self).__init__(
+            'Unsupported partition mode "{{current}}" in "{model}" model, '
+            'supported partition modes for "{dialect}" database are: {{allowed}}', **kw)
@@ -2,9 +2,12 @@
 Defines base classes used in orms module.
 """
 
+import copy
+import itertools
+
 from .registry import Registrar
 from ..compat import with_metaclass
-from ..databases.utilities import get_database
+from ..databases.utilities import get_database, PartitionCache
 from ..exceptions import (
     PartitionTypeError,
     OptionNotSetError,
@@ -21,6 +24,7 @@ class BaseFeature(with_metaclass(Registrar)):
     name = None        #: name that will be used to access this feature
     decorate = ()      #: model methods that should be decorated by feature decorators
     dependencies = ()  #: features that this feature depends on
+    is_bound = False   #: whether this feature is bound to a model instance
 
     def __init__(self, model_obj, model_cls, **options):
         """
@@ -32,6 +36,31 @@ class BaseFeature(with_metaclass(Registrar)):
         self.model_cls = model_cls
         self.options = options
 
+    def bind(self, model_obj):
+        """
+        Returns feature object bound to the given model instance. Feature object is shared by all instances
+        of the model class, so the instance can't be stored on it, as concurrent threads or asyncio tasks
+        would overwrite each other's instance. Instead, bound feature keeps the instance in a slot and shares
+        all other attributes with this feature object, which makes it cheap to create.
+
+        :param object model_obj: (required). Model instance object to work with.
+        """
+        cls = self.__class__
+        bound_cls = cls.__dict__.get('bound_cls')
+
+        if bound_cls is None:
+            bound_cls = type(cls)(cls.__name__, (cls,), {
+                '__module__': cls.__module__,
+                '__slots__': ('model_obj',),
+                'is_bound': True
+            })
+            type.__setattr__(cls, 'bound_cls', bound_cls)
+
+        feature = bound_cls.__new__(bound_cls)
+        feature.__dict__ = self.__dict__
+        feature.model_obj = model_obj
+        return feature
+
 
 class BaseOperationFeature(BaseFeature):
     """
@@ -50,6 +79,15 @@ class BaseOperationFeature(BaseFeature):
         """
         raise NotImplementedError('Method "execute" not implemented in: {0}'.format(self.__class__.__name__))
 
+    def copy(self, sql, stream):
+        """
+        Executes raw COPY ... FROM STDIN SQL statement.
+
+        :param string sql: (required). SQL statement to execute.
+        :param object stream: (required). File-like object to read data from.
+        """
+        raise NotImplementedError('Method "copy" not implemented in: {0}'.format(self.__class__.__name__))
+
     def select_one(self, sql):
         """
         Executes raw SQL for read operations and returns a single result.
@@ -84,25 +122,128 @@ class BasePartitionFeature(BaseFeature):
     name = 'partition'
     dependencies = ('operation',)
 
+    def __init__(self, *args, **kwargs):
+        super(BasePartitionFeature, self).__init__(*args, **kwargs)
+        self.cache = PartitionCache(ttl=self.options.get('cache_ttl', 300))
+        self._partition = None
+        self._partition_options = None
+
     def get_partition(self):
         """
-        Returns partition type object to work with depending on the given partition options.
+        Returns partition type object to work with depending on the given partition options. Database
+        package, partition type and model meta are resolved only once, unless options were changed, after
+        that only the column value of the current model instance is updated.
         """
-        database = get_database(self.model_meta['dialect'])
+        partition = self._partition
 
-        try:
-            cls_name = '{0}Partition'.format(self.options['type'].capitalize())
-            return getattr(database.partition, cls_name)(self.model_cls, **dict(self.options, **self.model_meta))
-        except KeyError as key:
-            raise OptionNotSetError(model=self.model_cls.__name__, current=key)
-        except AttributeError:
-            import re
-            raise PartitionTypeError(
-                model=self.model_cls.__name__,
-                dialect=self.model_meta['dialect'],
-                current=self.options['type'],
-                allowed=[cls.replace('Partition', '').lower() for cls in dir(
-                    database.partition) if re.match('\w+Partition', cls) is not None and 'Base' not in cls])
+        # Partition object is shared by all threads, so it is replaced only once it is completely built
+        if partition is None or self._partition_options != self.options:
+            model_meta = self.model_meta
+            database = get_database(model_meta['dialect'])
+            options = dict(self.options)
+
+            try:
+                cls_name = '{0}Partition'.format(options['type'].capitalize())
+                partition = getattr(database.partition, cls_name)(
+                    self.model_cls, cache=self.cache, **dict(options, **model_meta))
+            except KeyError as key:
+                raise OptionNotSetError(model=self.model_cls.__name__, current=key)
+            except AttributeError:
+                import re
+                raise PartitionTypeError(
+                    model=self.model_cls.__name__,
+                    dialect=model_meta['dialect'],
+                    current=self.options['type'],
+                    allowed=[cls.replace('Partition', '').lower() for cls in dir(
+                        database.partition) if re.match('\w+Partition', cls) is not None and 'Base' not in cls])
+
+            self._partition, self._partition_options = partition, options
+
+        partition = copy.copy(partition)
+        partition.column_value = self.column_value
+        return partition
+
+    def precreate(self, until=None, periods=1):
+        """
+        Creates partitions in advance, so that inserts don't have to wait for partition creation when a new
+        period starts. Partitions are created starting from the current one, which is the one for the current
+        date for date subtype and the one for the highest existing value for integer subtype, either up to
+        the one for the given value or for the given number of periods. Returns names of the partitions.
+
+        :param object until: (optional). Datetime for date subtype or the highest expected value for integer subtype.
+        :param integer periods: (optional). Number of partitions that follow the current one.
+        """
+        return self.get_partition().precreate(until=until, periods=periods)
+
+    def create_missing(self, values):
+        """
+        Creates partitions for the given column values if they don't exist, so that a batch of rows pays
+        partition overhead once instead of once per row. Returns names of the created partitions.
+
+        :param iterable values: (required). Column values of the batch, duplicates are skipped.
+        """
+        return self.get_partition().create_missing(set(values))
+
+    def prune(self):
+        """
+        Removes partitions which hold only values that are older than the retention option allows, by dropping,
+        truncating or detaching them depending on the retention action. This is a catalog operation, unlike
+        deleting the old rows. Returns names of the removed partitions.
+        """
+        return self.get_partition().prune()
+
+    def children(self, start=None, end=None):
+        """
+        Returns names of the existing partitions which may hold column values from start to end inclusively,
+        which are computed from the partition naming scheme, so that queries can target only these partitions
+        instead of making the database consider all of them.
+
+        :param object start: (optional). The lowest column value, no limit by default.
+        :param object end: (optional). The highest column value, no limit by default.
+        """
+        return self.get_partition().children(start=start, end=end)
+
+    def children_query(self, start=None, end=None, columns='*'):
+        """
+        Returns query which selects rows with column values from start to end inclusively only from the
+        partitions which may hold them, e.g. UNION ALL query over these partitions for PostgreSQL.
+
+        :param object start: (optional). The lowest column value, no limit by default.
+        :param object end: (optional). The highest column value, no limit by default.
+        :param string columns: (optional). Columns to select, all columns by default.
+        """
+        return self.get_partition().children_query(start=start, end=end, columns=columns)
+
+    def migrate(self, batch_size=10000, delay=0):
+        """
+        Moves rows which were saved before partitioning was set up into partitions in batches paginated by
+        the primary key, every batch is moved in a separate transaction. Returns number of moved rows.
+
+        :param integer batch_size: (optional). Number of rows moved by a single statement.
+        :param float delay: (optional). Number of seconds to wait between batches to throttle the load.
+        """
+        return self.get_partition().migrate(batch_size=batch_size, delay=delay)
+
+    def copy_from(self, rows, columns=None, chunk_size=10000):
+        """
+        Loads rows straight into partitions, bypassing the ORM and insert triggers, using the fastest bulk
+        loading mechanism available. Missing partitions are created beforehand. Rows are read in chunks
+        of the given size. Returns number of loaded rows.
+
+        :param iterable rows: (required). Dictionaries which map column names to values, e.g. a generator.
+        :param list columns: (optional). Names of the columns to load, keys of the first row by default.
+        :param integer chunk_size: (optional). Number of rows to read at once.
+        """
+        rows = iter(rows)
+        partition = self.get_partition()
+        count = 0
+
+        for chunk in iter(lambda: list(itertools.islice(rows, chunk_size)), []):
+            columns = columns or list(chunk[0].keys())
+            partition.copy(columns, chunk)
+            count += len(chunk)
+
+        return count
 
     @property
     def model_meta(self):
@@ -111,6 +252,13 @@ class BasePartitionFeature(BaseFeature):
         """
         raise NotImplementedError('Property "model_meta" not implemented in: {0}'.format(self.__class__.__name__))
 
+    @property
+    def column_value(self):
+        """
+        Returns value of the partition column for the current model instance.
+        """
+        raise NotImplementedError('Property "column_value" not implemented in: {0}'.format(self.__class__.__name__))
+
     def _column_value(self, allowed_columns):
         """
         Returns current value for the specified partition column.
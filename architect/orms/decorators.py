@@ -15,6 +15,25 @@ from ..exceptions import (
 )
 
 
+class BoundArchitect(object):
+    """
+    Architect namespace of a model instance, which returns features bound to this instance.
+    """
+    __slots__ = ('architect', 'model_obj')
+
+    def __init__(self, architect, model_obj):
+        """
+        :param class architect: (required). Architect namespace of the model class.
+        :param object model_obj: (required). Model instance object.
+        """
+        self.architect = architect
+        self.model_obj = model_obj
+
+    def __getattr__(self, name):
+        feature = getattr(self.architect, name)
+        return feature.bind(self.model_obj) if isinstance(feature, BaseFeature) else feature
+
+
 class install(object):
     """
     Install decorator installs the requested feature for a model. All features are
@@ -27,7 +46,8 @@ class install(object):
         """
         self.features = {}
         self.feature = feature
-        self.options = {'feature': options, 'global': dict((k, v) for k, v in options.items() if k in ('db',))}
+        self.options = {'feature': options, 'global': dict(
+            (k, v) for k, v in options.items() if k in ('db', 'pool_size', 'pool_recycle'))}
 
     def __call__(self, model):
         """
@@ -82,16 +102,15 @@ class install(object):
 
                     for feature, options in self.features.items():
                         self.map[model_cls]['features'][feature] = options['class'](
-                            model_obj, model_cls, **options['options'])
+                            None, model_cls, **options['options'])
 
                     self.map[model_cls]['architect'] = type('Architect', (object,), dict(
                         self.map[model_cls]['features'], **{'__module__': 'architect'}))
 
-                # We have to notify each feature object if a model object wants
-                # to get access to it, otherwise it won't have an idea about it
+                # Feature objects are shared by all model objects, so if a model object
+                # wants to get access to them, it gets features bound to this object
                 if model_obj is not None:
-                    for feature in self.map[model_cls]['features']:
-                        self.map[model_cls]['features'][feature].model_obj = model_obj
+                    return BoundArchitect(self.map[model_cls]['architect'], model_obj)
 
                 return self.map[model_cls]['architect']
 
@@ -2,11 +2,12 @@
 Defines features for the Django ORM.
 """
 
+import threading
+
 import django
 from django.conf import settings
 from django.db import router, connections, transaction
 from django.db.utils import ConnectionDoesNotExist
-from django.utils.functional import cached_property
 
 from ..bases import BasePartitionFeature, BaseOperationFeature
 from ...exceptions import PartitionColumnError, OptionNotSetError, OptionValueError
@@ -19,21 +20,33 @@ else:
 
 class ConnectionMixin(object):
     """
-    Provides support for multiple database connections.
+    Provides support for multiple database connections. Cursor is kept per thread, because feature
+    object is shared by all threads, while Django connections aren't.
     """
+    def __init__(self, *args, **kwargs):
+        super(ConnectionMixin, self).__init__(*args, **kwargs)
+        self.local = threading.local()
+
     @property
     def database(self):
         return self.options.get('db', router.db_for_write(self.model_cls))
 
-    @cached_property
+    @property
     def connection(self):
         db = self.database
 
         try:
-            return connections[db].cursor()
+            wrapper = connections[db]
         except ConnectionDoesNotExist as e:
             raise OptionValueError(model=self.model_cls.__name__, current=db, option='db', cause=e)
 
+        # Cursor is created again if Django has reconnected, e.g. after the connection was closed
+        if getattr(self.local, 'cursor', None) is None or self.local.connection is not wrapper.connection:
+            self.local.cursor = wrapper.cursor()
+            self.local.connection = wrapper.connection
+
+        return self.local.cursor
+
 
 class OperationFeature(ConnectionMixin, BaseOperationFeature):
     def execute(self, sql, autocommit=True):
@@ -52,6 +65,10 @@ class OperationFeature(ConnectionMixin, BaseOperationFeature):
         with autocommit(using=self.database):
             return self.connection.execute(sql)
 
+    def copy(self, sql, stream):
+        with transaction.atomic(using=self.database):
+            return self.connection.copy_expert(sql, stream)
+
     def select_one(self, sql):
         self.execute(sql)
         result = self.connection.fetchone()
@@ -75,12 +92,23 @@ class PartitionFeature(ConnectionMixin, BasePartitionFeature):
     def model_meta(self):
         meta = self.model_cls._meta
 
+        return {
+            'table': meta.db_table,
+            'pk': meta.pk.column,
+            'dialect': self.connection.db.vendor,
+            'column_value': self.column_value,
+        }
+
+    @property
+    def column_value(self):
+        meta = self.model_cls._meta
+
         try:
             if self.model_obj is None:
-                column_value = None
-            else:
-                field = meta.get_field(self.options['column'])
-                column_value = field.pre_save(self.model_obj, self.model_obj.pk is None)
+                return None
+
+            field = meta.get_field(self.options['column'])
+            return field.pre_save(self.model_obj, self.model_obj.pk is None)
         except KeyError as key:
             raise OptionNotSetError(model=self.model_cls.__name__, current=key)
         except FieldDoesNotExist:
@@ -89,13 +117,6 @@ class PartitionFeature(ConnectionMixin, BasePartitionFeature):
                 current=self.options['column'],
                 allowed=[f.name for f in meta.fields])
 
-        return {
-            'table': meta.db_table,
-            'pk': meta.pk.column,
-            'dialect': self.connection.db.vendor,
-            'column_value': column_value,
-        }
-
     @staticmethod
     def _decorate_save(method):
         """
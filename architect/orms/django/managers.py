@@ -0,0 +1,168 @@
+"""
+Defines partition aware query set and manager for the Django ORM.
+"""
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models, connections
+from django.db.models.sql.datastructures import BaseTable
+
+
+class PartitionTable(BaseTable):
+    """
+    Replaces the table of the query with a subquery which selects rows only from the partitions
+    which may hold the requested values, the subquery gets the table name as an alias, so that
+    the rest of the query stays the same.
+    """
+    def __init__(self, table_name, alias, start, end, query):
+        super(PartitionTable, self).__init__(table_name, alias)
+        self.start = start
+        self.end = end
+        self.query = query
+
+    def as_sql(self, compiler, connection):
+        return '({0}) {1}'.format(self.query.replace('%', '%%'), connection.ops.quote_name(self.table_alias)), []
+
+    def relabeled_clone(self, change_map):
+        return self.__class__(
+            self.table_name, change_map.get(self.table_alias, self.table_alias), self.start, self.end, self.query)
+
+
+class PartitionQuerySet(models.QuerySet):
+    """
+    Query set which queries only the partitions that may hold the requested rows when a filter pins
+    the partition column, e.g. with exact, gt, gte, lt, lte or range lookups, so that the database
+    doesn't have to consider the whole partition hierarchy. Supported only by range partition type
+    with date and integer subtypes, other queries are left as is.
+    """
+    def filter(self, *args, **kwargs):
+        return self._target_partitions(super(PartitionQuerySet, self).filter(*args, **kwargs), kwargs)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Creates all the partitions which are missing for the given objects at once before inserting them
+        with a single multi-row insert. If direct_insert option is set, PostgreSQL gets the rows straight
+        into the partitions with COPY statement, bypassing the insert trigger, primary keys of the objects
+        aren't set in this case.
+        """
+        objs = list(objs)
+        queryset = self._using_feature_db()
+        feature = self.model.architect.partition
+
+        if feature.options.get('direct_insert') and connections[queryset.db].vendor == 'postgresql':
+            queryset._copy(objs)
+            return objs
+
+        queryset._create_partitions(objs)
+        return super(PartitionQuerySet, queryset).bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        """
+        Creates all the partitions which are missing for the new values of the partition column of the
+        given objects at once before updating them.
+        """
+        objs = list(objs)
+        queryset = self._using_feature_db()
+
+        if self.model.architect.partition.options.get('column') in fields:
+            queryset._create_partitions(objs)
+
+        return super(PartitionQuerySet, queryset).bulk_update(objs, fields, *args, **kwargs)
+
+    def _using_feature_db(self):
+        """
+        Returns query set which uses the database set by the db option, unless other database was requested.
+        """
+        database = self.model.architect.partition.options.get('db')
+        return self.using(database) if database is not None and self._db is None else self
+
+    def _create_partitions(self, objs):
+        """
+        Creates partitions for the distinct partition column values of the given objects if they don't exist.
+
+        :param list objs: (required). Model instances to create partitions for.
+        """
+        values = set(obj.architect.partition.column_value for obj in objs)
+        return self.model.architect.partition.get_partition().create_missing(values)
+
+    def _copy(self, objs):
+        """
+        Copies the given objects straight into partitions, objects without primary key and with primary
+        key are copied separately, so that database generates the missing primary keys.
+
+        :param list objs: (required). Model instances to copy.
+        """
+        connection = connections[self.db]
+        partition = self.model.architect.partition.get_partition()
+        fields = self.model._meta.concrete_fields
+
+        for batch in ([obj for obj in objs if obj.pk is None], [obj for obj in objs if obj.pk is not None]):
+            if not batch:
+                continue
+
+            columns = [field for field in fields if batch[0].pk is not None or not field.primary_key]
+            partition.copy([field.column for field in columns], [dict(
+                (field.column, field.get_db_prep_save(field.pre_save(obj, True), connection))
+                for field in columns) for obj in batch])
+
+    def _target_partitions(self, queryset, lookups):
+        """
+        Narrows the range of the partition column values by the given lookups and makes the query
+        select rows only from the partitions for these values. Values are converted by the partition
+        field, e.g. from strings, the query is left as is if any of them can't be converted.
+
+        :param object queryset: (required). Query set to change.
+        :param dict lookups: (required). Lookups which were used to filter the query set.
+        """
+        feature = self.model.architect.partition
+
+        if feature.options.get('type') != 'range' or feature.options.get('subtype') not in ('date', 'integer'):
+            return queryset
+
+        try:
+            field = self.model._meta.get_field(feature.options['column'])
+        except FieldDoesNotExist:
+            return queryset
+
+        alias = queryset.query.get_initial_alias()
+        table = queryset.query.alias_map[alias]
+        start, end = (table.start, table.end) if isinstance(table, PartitionTable) else (None, None)
+
+        for lookup, value in lookups.items():
+            column, _, operator = lookup.partition('__')
+
+            # Expressions, e.g. F objects, can't be evaluated before the query is executed
+            if column != feature.options['column'] or value is None or hasattr(value, 'resolve_expression'):
+                continue
+
+            if operator in ('', 'exact'):
+                lowest, highest = value, value
+            elif operator == 'range':
+                lowest, highest = value
+            elif operator in ('gt', 'gte'):
+                lowest, highest = value, None
+            elif operator in ('lt', 'lte'):
+                lowest, highest = None, value
+            else:
+                continue
+
+            try:
+                lowest, highest = [None if v is None else field.to_python(v) for v in (lowest, highest)]
+
+                if lowest is not None:
+                    start = lowest if start is None else max(start, lowest)
+                if highest is not None:
+                    end = highest if end is None else min(end, highest)
+            except (ValidationError, TypeError):
+                # Values which can't be converted or compared, e.g. naive and aware datetimes,
+                # are left for the database to deal with
+                return queryset
+
+        if start is None and end is None:
+            return queryset
+
+        queryset.query.alias_map[alias] = PartitionTable(
+            table.table_name, alias, start, end, feature.children_query(start=start, end=end))
+        return queryset
+
+
+PartitionManager = models.Manager.from_queryset(PartitionQuerySet)
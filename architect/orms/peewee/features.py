@@ -2,20 +2,28 @@
 Defines features for the Peewee ORM.
 """
 
+import itertools
+
 from peewee import __version__, CompositeKey
 
 from ..bases import BasePartitionFeature, BaseOperationFeature
 
 if __version__.startswith('2'):
-    names = {'meta_table': 'db_table', 'commit_param': 'require_commit'}
+    names = {'meta_table': 'db_table', 'commit_param': 'require_commit', 'cursor': 'get_cursor', 'selection': '_select'}
 else:
-    names = {'meta_table': 'table_name', 'commit_param': 'commit'}
+    names = {'meta_table': 'table_name', 'commit_param': 'commit', 'cursor': 'cursor', 'selection': '_returning'}
 
 
 class OperationFeature(BaseOperationFeature):
     def execute(self, sql, autocommit=True):
         return self.model_cls._meta.database.execute_sql(sql.replace('%', '%%'), **{names['commit_param']: autocommit})
 
+    def copy(self, sql, stream):
+        database = self.model_cls._meta.database
+
+        with database.atomic():
+            return getattr(database, names['cursor'])().copy_expert(sql, stream)
+
 
 class PartitionFeature(BasePartitionFeature):
     decorate = ('save',)
@@ -29,9 +37,86 @@ class PartitionFeature(BasePartitionFeature):
             'table': getattr(meta, names['meta_table']),
             'pk': list(pk.field_names) if isinstance(pk, CompositeKey) else pk.name,
             'dialect': meta.database.__class__.__name__.lower().replace('database', ''),
-            'column_value': self._column_value([field for field in meta.fields.keys()]),
+            'column_value': self.column_value,
         }
 
+    @property
+    def column_value(self):
+        return self._column_value([field for field in self.model_cls._meta.fields.keys()])
+
+    def insert_many(self, rows, fields=None, chunk_size=1000):
+        """
+        Inserts rows with multi-row inserts of the given size, missing partitions for every chunk are created
+        in one pass before it is inserted. Returns number of inserted rows.
+
+        :param iterable rows: (required). Dictionaries or, if fields are given, tuples of values, e.g. a generator.
+        :param list fields: (optional). Fields or names of the fields for the tuples of values.
+        :param integer chunk_size: (optional). Number of rows inserted by a single statement.
+        """
+        rows = iter(rows)
+        value = self._get_value_getter(fields)
+        count = 0
+
+        for chunk in iter(lambda: list(itertools.islice(rows, chunk_size)), []):
+            self.create_missing(value(row) for row in chunk)
+
+            # Peewee 2 accepts only dictionaries, its second argument is a validation flag
+            if fields and __version__.startswith('2'):
+                self.model_cls.insert_many([dict(zip(fields, row)) for row in chunk]).execute()
+            elif fields:
+                self.model_cls.insert_many(chunk, fields).execute()
+            else:
+                self.model_cls.insert_many(chunk).execute()
+
+            count += len(chunk)
+
+        return count
+
+    def insert_from(self, query, fields):
+        """
+        Inserts rows selected by the given query, missing partitions are created in one pass beforehand, that
+        requires the query to be run one more time as a subquery to find out distinct partition column values
+        of the selected rows, so that only these values are sent from the database.
+
+        :param object query: (required). Select query which returns rows to insert.
+        :param list fields: (required). Fields or names of the fields for the selected columns.
+        """
+        column = self.options['column']
+        field_names = [getattr(field, 'name', field) for field in fields]
+
+        if column in field_names:
+            # Selected columns are aliased by position, because expressions don't have names
+            source = query.select(*[node.alias('c{0}'.format(index))
+                                    for index, node in enumerate(getattr(query, names['selection']))])
+            sql, params = source.sql()
+            self.create_missing(row[0] for row in self.model_cls._meta.database.execute_sql(
+                'SELECT DISTINCT c{0} FROM ({1}) AS source'.format(field_names.index(column), sql), params))
+        else:
+            self.create_missing([None])
+
+        if __version__.startswith('2'):
+            return self.model_cls.insert_from(fields, query).execute()
+
+        return self.model_cls.insert_from(query, fields).execute()
+
+    def _get_value_getter(self, fields):
+        """
+        Returns function which returns partition column value of a row, which is either a dictionary
+        with fields or names of the fields as keys or a tuple of values for the given fields.
+
+        :param list fields: (optional). Fields or names of the fields for the tuples of values.
+        """
+        column = self.options['column']
+        field_names = [getattr(field, 'name', field) for field in fields or []]
+        index = field_names.index(column) if column in field_names else None
+
+        def getter(row):
+            if isinstance(row, dict):
+                return next((value for key, value in row.items() if getattr(key, 'name', key) == column), None)
+
+            return row[index] if index is not None else None
+        return getter
+
     @staticmethod
     def _decorate_save(method):
         """
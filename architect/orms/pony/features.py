@@ -2,40 +2,92 @@
 Defines features for the Pony ORM.
 """
 
-from pony.orm.core import db_session
+import threading
+
+from pony.orm.core import db_session, flush, local
 
 from ..bases import BasePartitionFeature, BaseOperationFeature
 
 
+def in_db_session(func, *args):
+    """
+    Calls function inside of the caller's db_session, a new one is opened only if there is none.
+
+    :param callable func: (required). Function to call.
+    :param list args: (optional). Function arguments.
+    """
+    if getattr(local, 'db_session', None) is not None:
+        return func(*args)
+
+    with db_session:
+        return func(*args)
+
+
 class OperationFeature(BaseOperationFeature):
     def execute(self, sql, autocommit=True):
-        with db_session:
-            return self.model_cls._database_._exec_sql(sql)
+        return in_db_session(self.model_cls._database_._exec_sql, sql)
+
+    def copy(self, sql, stream):
+        return in_db_session(lambda: self.model_cls._database_.get_connection().cursor().copy_expert(sql, stream))
 
 
 class PartitionFeature(BasePartitionFeature):
     decorate = ('_save_',)
 
+    def __init__(self, *args, **kwargs):
+        super(PartitionFeature, self).__init__(*args, **kwargs)
+        self.local = threading.local()
+
     @property
     def model_meta(self):
         return {
             'table': self.model_cls._table_,
             'pk': self.model_cls._pk_columns_,
             'dialect': self.model_cls._database_.provider.dialect.lower(),
-            'column_value': self._column_value(self.model_cls._columns_),
+            'column_value': self.column_value,
         }
 
+    @property
+    def column_value(self):
+        return self._column_value(self.model_cls._columns_)
+
+    def create_many(self, rows):
+        """
+        Creates model instances from the given keyword arguments inside of the caller's db_session. Missing
+        partitions for all of them are created in one pass, after that instances are flushed without checking
+        partition existence for every instance. Returns created instances.
+
+        :param iterable rows: (required). Dictionaries of keyword arguments for the model constructor.
+        """
+        def create():
+            instances = [self.model_cls(**row) for row in rows]
+            self.create_missing(instance.architect.partition.column_value for instance in instances)
+            self.local.prepared = set(id(instance) for instance in instances)
+
+            try:
+                flush()
+            finally:
+                self.local.prepared = set()
+
+            return instances
+        return in_db_session(create)
+
     @staticmethod
     def _decorate__save_(method):
         """
-        Checks if partition exists and creates it if needed before saving model instance.
+        Checks if partition exists and creates it if needed before saving model instance, unless partitions
+        were already created for a batch of instances.
         """
-        @db_session
         def wrapper(instance, *args, **kwargs):
-            partition = instance.architect.partition.get_partition()
+            feature = instance.architect.partition
+
+            if id(instance) not in getattr(feature.local, 'prepared', ()):
+                def ensure():
+                    partition = feature.get_partition()
 
-            if not partition.exists():
-                partition.create()
+                    if not partition.exists():
+                        partition.create()
+                in_db_session(ensure)
 
             method(instance, *args, **kwargs)
         return wrapper
@@ -16,11 +16,15 @@ class Registrar(type):
     """
     A feature that implements this metaclass, e.g. all features that inherit from BaseFeature,
     will be added to feature registry if it defines name and orm attributes, otherwise it will
-    be treated as a base (abstract) feature and won't be registered.
+    be treated as a base (abstract) feature and won't be registered. Bound features, which are
+    created for model instances, are never registered.
     """
     orms = []  # list of ORMs for which a built-in features module was loaded
 
     def __new__(mcs, name, bases, attrs):
+        if attrs.get('is_bound', False):
+            return super(Registrar, mcs).__new__(mcs, name, bases, attrs)
+
         # It is possible to automatically determine ORM for built-in Architect features
         orm = re.match('architect.orms.(\w+).features', attrs.get('__module__', ''))
 
@@ -2,17 +2,24 @@
 Defines features for the SQLAlchemy ORM.
 """
 
+import threading
+
 from sqlalchemy import create_engine, event
 from sqlalchemy.exc import ArgumentError
+from sqlalchemy.orm import Session, object_session
 
 from ..bases import BasePartitionFeature, BaseOperationFeature
 from ...exceptions import OptionNotSetError, OptionValueError
 
+engines = {}
+engines_lock = threading.Lock()
+
 
 class ConnectionMixin(object):
     """
     Because SQLAlchemy doesn't provide a way to get a database connection from
     a model we have to ask for the DSN and instantiate a connection ourselves.
+    Engines are created once per DSN and pool settings and are shared by all models.
     """
     @property
     def connection(self):
@@ -20,7 +27,16 @@ class ConnectionMixin(object):
             return self.model_cls.metadata.bind
 
         try:
-            return create_engine(self.options['db'])
+            db = self.options['db']
+            dsn = db.render_as_string(hide_password=False) if hasattr(db, 'render_as_string') else str(db)
+            pool = dict((k, self.options[k]) for k in ('pool_size', 'pool_recycle') if k in self.options)
+            key = (dsn, tuple(sorted(pool.items())))
+
+            with engines_lock:
+                if key not in engines:
+                    engines[key] = create_engine(self.options['db'], **pool)
+
+                return engines[key]
         except KeyError as key:
             raise OptionNotSetError(model=self.model_cls.__name__, current=key)
         except ArgumentError as e:
@@ -28,9 +44,26 @@ class ConnectionMixin(object):
 
 
 class OperationFeature(ConnectionMixin, BaseOperationFeature):
+    def __init__(self, *args, **kwargs):
+        super(OperationFeature, self).__init__(*args, **kwargs)
+        self.local = threading.local()
+
+    @property
+    def connection(self):
+        return getattr(self.local, 'connection', None) or super(OperationFeature, self).connection
+
     def execute(self, sql, autocommit=True):
         return self.connection.execution_options(autocommit=autocommit).execute(sql.replace('%', '%%'))
 
+    def copy(self, sql, stream):
+        connection = self.connection.raw_connection()
+
+        try:
+            connection.cursor().copy_expert(sql, stream)
+            connection.commit()
+        finally:
+            connection.close()
+
 
 class PartitionFeature(ConnectionMixin, BasePartitionFeature):
     @property
@@ -39,9 +72,35 @@ class PartitionFeature(ConnectionMixin, BasePartitionFeature):
             'table': self.model_cls.__table__.name,
             'pk': self.model_cls.__table__.primary_key.columns.keys(),
             'dialect': self.connection.dialect.name,
-            'column_value': self._column_value(self.model_cls.__table__.columns.keys()),
+            'column_value': self.column_value,
         }
 
+    @property
+    def column_value(self):
+        return self._column_value(self.model_cls.__table__.columns.keys())
+
+    def insert(self, rows):
+        """
+        Creates partitions for the given rows if they don't exist and returns Core insert statement for them.
+
+        :param list rows: (required). Dictionaries which map column names to values.
+        """
+        self.create_missing(row.get(self.options['column']) for row in rows)
+        return self.model_cls.__table__.insert().values(rows)
+
+    def bulk_insert_mappings(self, session, mappings, **kwargs):
+        """
+        Creates partitions for the given mappings if they don't exist and inserts them via session's
+        bulk_insert_mappings, which doesn't emit any flush events.
+
+        :param object session: (required). Session to insert mappings with.
+        :param list mappings: (required). Dictionaries which map attribute names to values.
+        :param dictionary kwargs: (optional). Arguments of session's bulk_insert_mappings.
+        """
+        mappings = list(mappings)
+        self.create_missing(mapping.get(self.options['column']) for mapping in mappings)
+        return session.bulk_insert_mappings(self.model_cls, mappings, **kwargs)
+
     @staticmethod
     def register_hooks(model):
         """
@@ -49,10 +108,58 @@ class PartitionFeature(ConnectionMixin, BasePartitionFeature):
 
         :param class model: (required). A model to work with.
         """
+        if not event.contains(Session, 'before_flush', before_flush):
+            event.listen(Session, 'before_flush', before_flush)
+
         def before_insert(*args):
-            partition = args[2].architect.partition.get_partition()
+            feature = args[2].architect.partition
+            operation = args[2].architect.operation
+            session = object_session(args[2])
+
+            # Partitions for the whole flush were already created by the before_flush hook
+            if session is not None and id(args[2]) in session.info.get('architect_prepared', ()):
+                return
 
-            if not partition.exists():
-                partition.create()
+            # Session's connection is used in the current thread, so no extra connection is opened
+            if feature.options.get('reuse_connection'):
+                operation.local.connection = args[1]
+
+            try:
+                partition = feature.get_partition()
+
+                if not partition.exists():
+                    partition.create()
+            finally:
+                operation.local.connection = None
 
         event.listen(model, 'before_insert', before_insert)
+
+
+def before_flush(session, flush_context, instances):
+    """
+    Creates partitions for all pending instances of the partitioned models at once, so that flush doesn't
+    have to check partition existence for every instance.
+    """
+    pending = {}
+    session.info['architect_prepared'] = set()
+
+    for instance in session.new:
+        model = type(instance)
+
+        if hasattr(model, 'architect') and hasattr(model.architect, 'partition'):
+            pending.setdefault(model, []).append(instance)
+
+    for model, instances in pending.items():
+        feature = model.architect.partition
+        operation = model.architect.operation
+
+        # Session's connection is used in the current thread, so no extra connection is opened
+        if feature.options.get('reuse_connection'):
+            operation.local.connection = session.connection()
+
+        try:
+            feature.create_missing(instance.architect.partition.column_value for instance in instances)
+        finally:
+            operation.local.connection = None
+
+        session.info['architect_prepared'].update(id(instance) for instance in instances)
@@ -2,9 +2,10 @@
 Defines features for the SQLObject ORM.
 """
 
-from sqlobject.main import instanceName
+import threading
 
 from ..bases import BasePartitionFeature, BaseOperationFeature
+from ...exceptions import OptionNotSetError, PartitionColumnError
 
 
 class OperationFeature(BaseOperationFeature):
@@ -16,6 +17,15 @@ class OperationFeature(BaseOperationFeature):
         self.connection.autoCommit = autocommit
         return self.connection.query(sql)
 
+    def copy(self, sql, stream):
+        connection = self.connection.getConnection()
+
+        try:
+            connection.cursor().copy_expert(sql, stream)
+            connection.commit()
+        finally:
+            self.connection.releaseConnection(connection)
+
     def select_one(self, sql):
         result = self.connection.queryOne(sql)
         return result[0] if result is not None else result
@@ -32,31 +42,75 @@ class OperationFeature(BaseOperationFeature):
 class PartitionFeature(BasePartitionFeature):
     decorate = ('_create',)
 
+    def __init__(self, *args, **kwargs):
+        super(PartitionFeature, self).__init__(*args, **kwargs)
+        self.local = threading.local()
+
     @property
     def model_meta(self):
         return {
             'table': self.model_cls.sqlmeta.table,
             'pk': self.model_cls.sqlmeta.idName,
             'dialect': self.model_cls._connection.dbName,
-            'column_value': self._column_value(self.model_cls.sqlmeta.columns.keys()),
+            'column_value': self.column_value,
         }
 
+    @property
+    def column_value(self):
+        return self._column_value(self.model_cls.sqlmeta.columns.keys())
+
+    def create_many(self, rows):
+        """
+        Creates model instances from the given keyword arguments, which may also hold the caller's connection
+        or transaction as usual. Missing partitions for all of them are created in one pass, partition column
+        values are read straight from the keyword arguments. Returns created instances.
+
+        :param iterable rows: (required). Dictionaries of keyword arguments for the model constructor.
+        """
+        rows = list(rows)
+        self.create_missing(self.kwargs_value(row) for row in rows)
+        self.local.prepared = True
+
+        try:
+            return [self.model_cls(**row) for row in rows]
+        finally:
+            self.local.prepared = False
+
+    def kwargs_value(self, kwargs):
+        """
+        Returns partition column value from the keyword arguments of the model constructor, the default value
+        of the column is used if it isn't passed.
+
+        :param dictionary kwargs: (required). Keyword arguments of the model constructor.
+        """
+        columns = self.model_cls.sqlmeta.columns
+
+        try:
+            column = self.options['column']
+        except KeyError as key:
+            raise OptionNotSetError(model=self.model_cls.__name__, current=key)
+
+        if column not in columns:
+            raise PartitionColumnError(model=self.model_cls.__name__, current=column, allowed=columns.keys())
+
+        return kwargs[column] if column in kwargs else columns[column].default
+
     @staticmethod
     def _decorate__create(method):
         """
-        Checks if partition exists and creates it if needed before saving model instance.
+        Checks if partition exists and creates it if needed before saving model instance, unless partitions
+        were already created for a batch of instances. Column value is read from the keyword arguments, as
+        instance doesn't have any values yet.
         """
         def wrapper(instance, *args, **kwargs):
-            for col, val in instance.sqlmeta.columns.items():
-                setattr(instance, instanceName(col), kwargs.get(col, val.default))
-
-            partition = instance.architect.partition.get_partition()
+            feature = type(instance).architect.partition
 
-            if not partition.exists():
-                partition.create()
+            if not getattr(feature.local, 'prepared', False):
+                partition = feature.get_partition()
+                partition.column_value = feature.kwargs_value(kwargs)
 
-            for col in instance.sqlmeta.columns:
-                delattr(instance, instanceName(col))
+                if not partition.exists():
+                    partition.create()
 
             method(instance, *args, **kwargs)
         return wrapper
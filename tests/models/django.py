@@ -45,6 +45,7 @@ except AttributeError:
 from django.db import models
 from django.core import management
 from architect import install
+from architect.orms.django.managers import PartitionManager
 
 for database in test_databases:
     dbname = database.capitalize()
@@ -62,6 +63,7 @@ for database in test_databases:
             '__module__': 'test.models',
             'name': models.CharField(max_length=255),
             'created': models.DateTimeField(null=True),
+            'objects': PartitionManager(),
             'Meta': Meta,
             'db': database,
         }))
@@ -84,6 +86,23 @@ for database in test_databases:
                 'db': database,
             }))
 
+        # Generation of entity for native date range partitioning
+        class Meta(object):
+            app_label = 'test'
+            db_table = 'TEST_rangedatenative'
+
+        name = '{0}RangeDateNative'.format(dbname)
+        partition = install('partition', type='range', subtype='date', constraint='month', column='created',
+                            mode='native', retention='1 year', retention_action='detach')
+
+        locals()[name] = partition(type(name, (models.Model,), {
+            '__module__': 'test.models',
+            'name': models.CharField(max_length=255),
+            'created': models.DateTimeField(null=True),
+            'Meta': Meta,
+            'db': database,
+        }))
+
         # Generation of entities for string range partitioning
         for subtype in ('string_firstchars', 'string_lastchars'):
             for item in ('2', '5'):
@@ -102,4 +121,22 @@ for database in test_databases:
                     'db': database,
                 }))
 
+    if database == 'mysql':
+        # Generation of entity for hash partitioning
+        class Meta(object):
+            app_label = 'test'
+            db_table = 'TEST_hash'
+
+        name = '{0}Hash'.format(dbname)
+        partition = install('partition', type='hash', constraint='4', column='num')
+
+        locals()[name] = partition(type(name, (models.Model,), {
+            '__module__': 'test.models',
+            'name': models.CharField(max_length=255),
+            'num': models.IntegerField(),
+            'objects': PartitionManager(),
+            'Meta': Meta,
+            'db': database,
+        }))
+
     management.call_command(command, database=database, run_syncdb=True, verbosity=0, interactive=False)
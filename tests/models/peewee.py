@@ -70,3 +70,20 @@ for database in test_databases:
                 }))
 
                 locals()[name].create_table(True)
+
+    if database == 'mysql':
+        # Generation of entity for hash partitioning
+        class Meta(object):
+            database = db
+        setattr(Meta, names['meta_table'], 'TEST_hash')
+
+        name = '{0}Hash'.format(dbname)
+        partition = install('partition', type='hash', constraint='4', column='num')
+
+        locals()[name] = partition(type(name, (Model,), {
+            'name': CharField(),
+            'num': IntegerField(),
+            'Meta': Meta,
+        }))
+
+        locals()[name].create_table(True)
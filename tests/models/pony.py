@@ -53,4 +53,15 @@ for database in test_databases:
                     'title': Optional(unicode, nullable=True),
                 }))
 
+    if database == 'mysql':
+        # Generation of entity for hash partitioning
+        name = '{0}Hash'.format(dbname)
+        partition = install('partition', type='hash', constraint='4', column='num')
+
+        locals()[name] = partition(type(name, (db.Entity,), {
+            '_table_': 'TEST_hash',
+            'name': Required(unicode),
+            'num': Required(int),
+        }))
+
     db.generate_mapping(create_tables=True)
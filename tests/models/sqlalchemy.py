@@ -61,4 +61,16 @@ for database in test_databases:
                     'title': Column(String(length=255), nullable=True)
                 }))
 
+    if database == 'mysql':
+        # Generation of entity for hash partitioning
+        name = '{0}Hash'.format(dbname)
+        partition = install('partition', type='hash', constraint='4', column='num', db=engine.url)
+
+        locals()[name] = partition(type(name, (Base,), {
+            '__tablename__': 'TEST_hash',
+            'id': Column(Integer, primary_key=True),
+            'name': Column(String(length=255)),
+            'num': Column(Integer)
+        }))
+
     Base.metadata.create_all(engine)
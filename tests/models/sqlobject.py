@@ -72,3 +72,20 @@ for database in test_databases:
                 }))
 
                 locals()[name].createTable(True)
+
+    if database == 'mysql':
+        # Generation of entity for hash partitioning
+        class sqlmeta(object):
+            table = 'test_hash'
+
+        name = '{0}Hash'.format(dbname)
+        partition = install('partition', type='hash', constraint='4', column='num')
+
+        locals()[name] = partition(type(name, (SQLObject,), {
+            'name': StringCol(),
+            'num': IntCol(),
+            'sqlmeta': sqlmeta,
+            '_connection': connection
+        }))
+
+        locals()[name].createTable(True)
@@ -22,6 +22,9 @@ class BasePartitionTestCase(unittest.TestCase):
     def test_create_not_implemented(self):
         self.assertRaises(NotImplementedError, lambda: self.Partition.create())
 
+    def test_copy_not_implemented(self):
+        self.assertRaises(NotImplementedError, lambda: self.Partition.copy([], []))
+
 
 class BaseOperationFeatureTestCase(unittest.TestCase):
     def setUp(self):
@@ -30,6 +33,9 @@ class BaseOperationFeatureTestCase(unittest.TestCase):
     def test_execute_not_implemented(self):
         self.assertRaises(NotImplementedError, lambda: self.OperationFeature.execute(''))
 
+    def test_copy_not_implemented(self):
+        self.assertRaises(NotImplementedError, lambda: self.OperationFeature.copy('', None))
+
 
 class BasePartitionFeatureTestCase(unittest.TestCase):
     def setUp(self):
@@ -52,9 +58,43 @@ class BasePartitionFeatureTestCase(unittest.TestCase):
         self.PartitionFeature.options = {'type': 'foo'}
         self.assertRaises(PartitionTypeError, lambda: self.PartitionFeature.get_partition())
 
+    def test_get_partition_resolves_partition_once(self):
+        model_meta = mock.Mock(return_value={'dialect': 'sqlite', 'table': 'foo', 'pk': 'id', 'column_value': None})
+        self.PartitionFeatureCls.model_meta = property(lambda obj: model_meta())
+        self.PartitionFeatureCls.column_value = property(lambda obj: obj.model_obj.bar)
+        self.PartitionFeature.options = {'type': 'range', 'column': 'bar'}
+
+        for value in (1, 2):
+            self.PartitionFeature.model_obj = mock.Mock(bar=value)
+            self.assertEqual(self.PartitionFeature.get_partition().column_value, value)
+
+        self.assertEqual(model_meta.call_count, 1)
+
+        self.PartitionFeature.options['column'] = 'baz'
+        self.assertEqual(self.PartitionFeature.get_partition().column_name, 'baz')
+        self.assertEqual(model_meta.call_count, 2)
+
+    def test_get_partition_keeps_partition_while_rebuilding(self):
+        shared = []
+        model_meta = {'dialect': 'sqlite', 'table': 'foo', 'pk': 'id', 'column_value': None}
+        self.PartitionFeatureCls.model_meta = property(lambda obj: shared.append(obj._partition) or model_meta)
+        self.PartitionFeatureCls.column_value = property(lambda obj: None)
+        self.PartitionFeature.options = {'type': 'range', 'column': 'bar'}
+        self.PartitionFeature.get_partition()
+        self.PartitionFeature.options['column'] = 'baz'
+        self.PartitionFeature.get_partition()
+
+        # Other threads must never see the shared partition reset while it is rebuilt
+        self.assertIsNone(shared[0])
+        self.assertEqual(shared[1].column_name, 'bar')
+        self.assertEqual(self.PartitionFeature._partition.column_name, 'baz')
+
     def test_model_meta_not_implemented(self):
         self.assertRaises(NotImplementedError, lambda: self.PartitionFeature.model_meta)
 
+    def test_column_value_not_implemented(self):
+        self.assertRaises(NotImplementedError, lambda: self.PartitionFeature.column_value)
+
     def test_column_value_raises_option_not_set_error(self):
         from architect.exceptions import OptionNotSetError
         self.assertRaises(OptionNotSetError, lambda: self.PartitionFeature._column_value([]))
@@ -2,16 +2,21 @@
 Tests commands from commands subpackage.
 """
 
+import os
 import sys
+import types
+import tempfile
 
-from . import unittest, capture
+from . import unittest, mock, capture
 
 from architect.commands import commands
+from architect.commands.migrate_data import Checkpoint
 from architect.exceptions import (
     ImportProblemError,
     CommandError,
     CommandNotProvidedError,
-    CommandArgumentError
+    CommandArgumentError,
+    PartitionRangeSubtypeError
 )
 
 
@@ -57,3 +62,77 @@ class PartitionCommandTestCase(BaseCommandTestCase, unittest.TestCase):
         sys.argv.extend(['-m', 'contextlib'])
         with capture() as (out, _):
             self.assertIn('unable to find any partitionable models in a module', out)
+
+
+class PrecreateCommandTestCase(BaseCommandTestCase, unittest.TestCase):
+    def setUp(self):
+        BaseCommandTestCase.setUp(self)
+        sys.argv.extend(['precreate'])
+
+    def test_required_arguments_error(self):
+        with capture() as (_, err):
+            self.assertIn('-m/--module', err)
+
+    def test_invalid_ahead_error(self):
+        sys.argv.extend(['-m', 'contextlib', '--ahead', '7x'])
+        with capture() as (_, err):
+            self.assertIn('invalid lookahead window: 7x', err)
+
+    def test_no_models_in_module_error(self):
+        sys.argv.extend(['-m', 'contextlib', '--ahead', '7d'])
+        with capture() as (out, _):
+            self.assertIn('unable to find any partitionable models in a module', out)
+
+    def test_unsupported_models_are_skipped(self):
+        module = types.ModuleType('precreate_models')
+        module.Foo = type('Foo', (object,), {'architect': mock.Mock()})
+        module.Bar = type('Bar', (object,), {'architect': mock.Mock()})
+        module.Foo.architect.partition.precreate.side_effect = PartitionRangeSubtypeError(
+            model='Foo', dialect='postgresql', current='string_firstchars', allowed=['date'])
+        module.Bar.architect.partition.precreate.return_value = ['bar_y2014m01']
+        sys.argv.extend(['-m', 'precreate_models', '--ahead', '7d'])
+
+        with mock.patch.dict(sys.modules, {'precreate_models': module}):
+            with capture() as (out, _):
+                self.assertIn('successfully created partitions for the following models: Bar (1)', out)
+                self.assertIn('skipped the following models: Foo (Unsupported partition range subtype', out)
+
+
+class PruneCommandTestCase(BaseCommandTestCase, unittest.TestCase):
+    def setUp(self):
+        BaseCommandTestCase.setUp(self)
+        sys.argv.extend(['prune'])
+
+    def test_required_arguments_error(self):
+        with capture() as (_, err):
+            self.assertIn('-m/--module', err)
+
+    def test_no_models_in_module_error(self):
+        sys.argv.extend(['-m', 'contextlib', '--dry-run'])
+        with capture() as (out, _):
+            self.assertIn('unable to find any partitionable models in a module', out)
+
+
+class MigrateDataCommandTestCase(BaseCommandTestCase, unittest.TestCase):
+    def setUp(self):
+        BaseCommandTestCase.setUp(self)
+        sys.argv.extend(['migrate-data'])
+
+    def test_required_arguments_error(self):
+        with capture() as (_, err):
+            self.assertIn('-m/--module', err)
+
+    def test_no_models_in_module_error(self):
+        sys.argv.extend(['-m', 'contextlib', '--workers', '2'])
+        with capture() as (out, _):
+            self.assertIn('unable to find any partitionable models in a module', out)
+
+    def test_checkpoint_is_resumed(self):
+        path = os.path.join(tempfile.mkdtemp(), 'checkpoint.json')
+        checkpoint = Checkpoint(path)
+        checkpoint.update('Foo', [[None, [100]], [[100], None]])
+        checkpoint.put(('Foo', 1, [150]))
+
+        self.assertEqual(Checkpoint(path).get('Foo'), [[None, [100]], [[150], None]])
+        checkpoint.update('Foo', None)
+        self.assertIsNone(Checkpoint(path).get('Foo'))
@@ -3,16 +3,88 @@ Tests database specific behaviour which is independent from ORM being used.
 """
 
 import os
+import time
+import datetime
 
 from . import unittest, mock
 
-from architect.databases.postgresql.partition import Partition, RangePartition
+from architect.databases.postgresql.partition import (
+    Partition,
+    RangePartition,
+    HashPartition,
+    ListPartition,
+    CopyStream
+)
+from architect.databases.mysql.partition import (
+    RangePartition as MysqlRangePartition,
+    HashPartition as MysqlHashPartition,
+    ListPartition as MysqlListPartition
+)
+from architect.databases.utilities import DateTime, PartitionCache
 from architect.exceptions import (
     PartitionConstraintError,
-    PartitionRangeSubtypeError
+    PartitionRangeSubtypeError,
+    PartitionModeError,
+    OptionValueError
 )
 
 
+class PartitionCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = PartitionCache(ttl=60)
+
+    def test_load_replaces_entries(self):
+        self.cache.add('foo')
+        self.cache.load(['bar'])
+        self.assertTrue(self.cache.loaded)
+        self.assertNotIn('foo', self.cache)
+        self.assertIn('bar', self.cache)
+
+    def test_entry_expires(self):
+        self.cache.add('foo')
+
+        with mock.patch('architect.databases.utilities.time.time', return_value=time.time() + 61):
+            self.assertNotIn('foo', self.cache)
+
+    def test_load_expires(self):
+        self.cache.load(['foo'])
+
+        with mock.patch('architect.databases.utilities.time.time', return_value=time.time() + 61):
+            self.assertFalse(self.cache.loaded)
+
+    def test_invalidate(self):
+        self.cache.load(['foo', 'bar'])
+        self.cache.invalidate('foo')
+        self.assertNotIn('foo', self.cache)
+        self.assertIn('bar', self.cache)
+        self.cache.invalidate()
+        self.assertFalse(self.cache.loaded)
+        self.assertNotIn('bar', self.cache)
+
+    def test_zero_ttl_disables_caching(self):
+        cache = PartitionCache(ttl=0)
+        cache.add('foo')
+        self.assertNotIn('foo', cache)
+
+
+class DateTimeTestCase(unittest.TestCase):
+    def test_upcoming(self):
+        date = DateTime(datetime.datetime(2014, 11, 15, 18, 44, 23))
+        self.assertEqual(date.upcoming('month', periods=2), [
+            datetime.datetime(2014, 11, 1), datetime.datetime(2014, 12, 1), datetime.datetime(2015, 1, 1)])
+        self.assertEqual(date.upcoming('week', until=datetime.datetime(2014, 11, 24)), [
+            datetime.datetime(2014, 11, 10), datetime.datetime(2014, 11, 17), datetime.datetime(2014, 11, 24)])
+        self.assertEqual(date.upcoming('day', until=datetime.date(2014, 11, 1)), [datetime.datetime(2014, 11, 15)])
+
+    def test_ago(self):
+        date = DateTime(datetime.datetime(2015, 3, 31, 10))
+        self.assertEqual(date.ago('90 days'), datetime.datetime(2014, 12, 31, 10))
+        self.assertEqual(date.ago('2 weeks'), datetime.datetime(2015, 3, 17, 10))
+        self.assertEqual(date.ago('1 month'), datetime.datetime(2015, 2, 28, 10))
+        self.assertEqual(date.ago('1 year'), datetime.datetime(2014, 3, 31, 10))
+        self.assertRaises(ValueError, lambda: date.ago('90 foo'))
+
+
 class BasePartitionTestCase(object):
     def setUp(self):
         model = mock.Mock(__name__='Foo')
@@ -50,7 +122,724 @@ class PostgresqlPartitionTestCase(BasePartitionTestCase, unittest.TestCase):
         self.range_partition.subtype = 'string_lastchars'
         self.assertRaises(PartitionConstraintError, lambda: self.range_partition._get_definitions())
 
+    def test_prepare_trigger_creates_partition_only_if_missing(self):
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'day'
+        self.range_partition.prepare()
+        sql = self.range_partition.database.execute.call_args[0][0]
+
+        self.assertIn('IF TO_REGCLASS(tablename) IS NULL THEN', sql)
+        self.assertNotIn('EXCEPTION WHEN duplicate_table', sql)
+
+    def test_prepare_trigger_with_static_routing(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'day'
+        self.range_partition.routing = 'static'
+        self.range_partition.prepare()
+        sql = self.range_partition.database.execute.call_args[0][0]
+
+        self.assertIn('CREATE OR REPLACE FUNCTION foo_build_insert_child()', sql)
+        self.assertIn('SELECT foo_build_insert_child();', sql)
+        self.assertIn('PERFORM foo_build_insert_child();', sql)
+
+    def test_prepare_single_write(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'day'
+        self.range_partition.mode = 'single_write'
+        self.range_partition.prepare()
+        sql = self.range_partition.database.execute.call_args[0][0]
+
+        self.assertIn("IF TG_WHEN = 'BEFORE' THEN RETURN NULL; END IF;", sql)
+        self.assertIn('DROP TRIGGER IF EXISTS after_insert_foo_trigger ON "foo";', sql)
+        self.assertIn('INSERT INTO "foo_insert_view" VALUES (NEW.*) RETURNING *;', sql)
+        self.assertFalse(self.range_partition.exists())
+
+    def test_prepare_statement(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '5'
+        self.range_partition.mode = 'statement'
+        self.range_partition.pks = ['id']
+        self.range_partition.prepare()
+        sql = self.range_partition.database.execute.call_args[0][0]
+
+        self.assertIn('REFERENCING NEW TABLE AS new_rows', sql)
+        self.assertIn("EXECUTE 'INSERT INTO ' || tablename || ' SELECT * FROM new_rows WHERE ' || checks || ';';", sql)
+        self.assertIn('DROP TRIGGER IF EXISTS before_insert_foo_trigger ON "foo";', sql)
+        self.assertNotIn('NEW.', sql)
+
+    def test_prepare_trigger_raises_option_value_error(self):
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'day'
+        self.range_partition.routing = 'foo'
+        self.assertRaises(OptionValueError, lambda: self.range_partition.prepare())
+
+    def test_prepare_raises_partition_mode_error(self):
+        self.range_partition.mode = 'foo'
+        self.assertRaises(PartitionModeError, lambda: self.range_partition.prepare())
+
+    def test__get_native_key_raises_partition_range_subtype_error(self):
+        self.range_partition.subtype = 'string_firstchars'
+        self.assertRaises(PartitionRangeSubtypeError, lambda: self.range_partition._get_native_key())
+
+    def test__get_date_name(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'date'
+        self.range_partition.column_value = datetime.datetime(2014, 12, 29, 18, 44, 23)
+
+        for constraint, name in (('day', 'y2014d363'), ('week', 'y2015w01'), ('month', 'y2014m12'), ('year', 'y2014')):
+            self.range_partition.constraint = constraint
+            self.assertEqual(self.range_partition._get_name(), 'foo_{0}'.format(name))
+
+    def test__get_integer_name(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '5'
+
+        for value, name in ((3, '1_5'), (5, '1_5'), (6, '6_10'), (0, '0'), (-3, 'm5_m1'), (-6, 'm10_m6'), (None, 'null')):
+            self.range_partition.column_value = value
+            self.assertEqual(self.range_partition._get_name(), 'foo_{0}'.format(name))
+
+    def test__get_native_bounds(self):
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'week'
+        self.range_partition.column_value = datetime.datetime(2014, 4, 15, 18, 44, 23)
+        self.assertEqual(
+            self.range_partition._get_native_bounds(), "FROM ('2014-04-14 00:00:00') TO ('2014-04-21 00:00:00')")
+
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '2'
+        self.range_partition.column_value = -3
+        self.assertEqual(self.range_partition._get_native_bounds(), "FROM ('-4') TO ('-2')")
+
+    def test_exists_native_with_null_value(self):
+        self.range_partition.mode = 'native'
+        self.assertTrue(self.range_partition.exists())
+
+    def test_create_native_moves_rows_from_default_partition(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '100'
+        self.range_partition.column_value = 150
+        self.range_partition.mode = 'native'
+        self.range_partition.database = mock.Mock()
+        self.range_partition.create()
+        statement = self.range_partition.database.execute.call_args[0][0]
+
+        self.assertIn('LIKE "foo_default" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES', statement)
+        self.assertIn('CHECK ("bar" >= 101 AND "bar" <= 200)', statement)
+        self.assertIn('IF EXISTS(SELECT 1 FROM ONLY "foo_default" WHERE "bar" IS NOT NULL) THEN', statement)
+        self.assertIn('DELETE FROM ONLY "foo_default" WHERE "bar" >= 101 AND "bar" <= 200 RETURNING *', statement)
+        self.assertIn('ATTACH PARTITION foo_101_200 FOR VALUES FROM (\'101\') TO (\'201\')', statement)
+        self.assertLess(statement.index('DELETE FROM'), statement.index('ATTACH PARTITION'))
+
+    def test__get_checks(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.column_name = 'bar'
+        self.range_partition.constraint = '2'
+        values = (
+            ('date', 'month', datetime.datetime(2014, 12, 29), 'foo_y2014m12',
+             '"bar" >= \'2014-12-01 00:00:00\' AND "bar" < \'2015-01-01 00:00:00\''),
+            ('integer', '2', -3, 'foo_m4_m3', '"bar" >= -4 AND "bar" <= -3'),
+            ('string_firstchars', '2', 'Abc', 'foo_ab', 'LOWER(SUBSTR("bar", 1, 2)) = \'ab\''),
+            ('string_lastchars', '2', "ab'C", '"foo_\'c"', 'LOWER(SUBSTRING("bar" FROM \'.{2}$\')) = \'\'\'c\''),
+            ('integer', '2', None, 'foo_null', '"bar" IS NULL'),
+        )
+
+        for subtype, constraint, value, name, checks in values:
+            self.range_partition.subtype = subtype
+            self.range_partition.constraint = constraint
+            self.range_partition.column_value = value
+            self.assertEqual(self.range_partition._get_name(), name)
+            self.assertEqual(self.range_partition._get_checks(), checks)
+
+    def test_copy_groups_rows_by_partition(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '10'
+        self.range_partition.database = mock.Mock()
+        self.range_partition.copy(['bar'], [{'bar': 1}, {'bar': 11}, {'bar': 2}])
+        self.assertEqual(self.range_partition.database.execute.call_count, 2)
+        copies = dict((c[0][0], c[0][1].read()) for c in self.range_partition.database.copy.call_args_list)
+        self.assertEqual(copies, {
+            'COPY foo_1_10 ("bar") FROM STDIN;': '1\n2\n',
+            'COPY foo_11_20 ("bar") FROM STDIN;': '11\n',
+        })
+
+    def test_copy_stream_encodes_rows(self):
+        stream = CopyStream(['a', 'b'], iter([{'a': None, 'b': True}, {'a': 'x\ty\\', 'b': 1}]))
+        self.assertEqual(stream.read(3), '\\N\t')
+        self.assertEqual(stream.read(), 't\nx\\ty\\\\\t1\n')
+        self.assertEqual(stream.read(), '')
+
+    def test_precreate_date(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'month'
+        self.range_partition.database = mock.Mock()
+
+        with mock.patch('architect.databases.postgresql.partition.datetime') as dt:
+            dt.datetime.now.return_value = datetime.datetime(2014, 12, 29)
+            names = self.range_partition.precreate(periods=2)
+
+        self.assertEqual(names, ['foo_y2014m12', 'foo_y2015m01', 'foo_y2015m02'])
+        self.assertEqual(self.range_partition.database.execute.call_count, 3)
+
+    def test_prune_date(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'month'
+        self.range_partition.routing = 'static'
+        self.range_partition.retention = '2 months'
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.return_value = [
+            ('foo_null',), ('foo_y2014m09',), ('foo_y2014m11',), ('foo_y2014m10',), ('foo_y2014m12',)]
+
+        with mock.patch('architect.databases.postgresql.partition.datetime') as dt:
+            dt.datetime.now.return_value = datetime.datetime(2014, 12, 29)
+            self.assertEqual(self.range_partition.prune(), ['foo_y2014m09'])
+
+        statements = [call[0][0] for call in self.range_partition.database.execute.call_args_list]
+        self.assertEqual(statements, [
+            'DROP TABLE IF EXISTS foo_y2014m09;', 'SELECT foo_build_insert_child();'])
+
+    def test_prune_integer_detach(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '100'
+        self.range_partition.mode = 'native'
+        self.range_partition.retention = '150'
+        self.range_partition.retention_action = 'detach'
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_one.return_value = 350
+        self.range_partition.database.select_all.return_value = [
+            ('foo_m100_m1',), ('foo_0',), ('foo_1_100',), ('foo_101_200',), ('foo_201_300',), ('foo_301_400',)]
+
+        self.assertEqual(self.range_partition.prune(), ['foo_m100_m1', 'foo_0', 'foo_1_100'])
+        self.assertEqual(self.range_partition.database.execute.call_count, 3)
+        self.assertEqual(self.range_partition.database.execute.call_args[0][0],
+                         'ALTER TABLE "foo" DETACH PARTITION foo_1_100;')
+
+    def test_children(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'date'
+        self.range_partition.constraint = 'day'
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.return_value = [
+            ('foo_null',), ('foo_y2014d002',), ('foo_y2014d001',), ('foo_y2014d004',), ('foo_y2014d005',)]
+
+        self.assertEqual(self.range_partition.children(
+            start=datetime.datetime(2014, 1, 2), end=datetime.datetime(2014, 1, 4, 12)),
+            ['foo_y2014d002', 'foo_y2014d004'])
+        self.assertEqual(self.range_partition.children(end=datetime.datetime(2014, 1, 1)), ['foo_y2014d001'])
+        self.assertEqual(self.range_partition.children_query(start=datetime.datetime(2014, 1, 5), columns='id'), (
+            "SELECT id FROM ONLY foo_y2014d005 WHERE \"bar\" >= '2014-01-05 00:00:00'\nUNION ALL\n"
+            "SELECT id FROM ONLY \"foo\" WHERE \"bar\" >= '2014-01-05 00:00:00'"))
+
+    def test_children_not_cached(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '100'
+        self.range_partition.cache = PartitionCache(ttl=60)
+        self.range_partition.cache.load(['foo_1_100'])
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.return_value = [('foo_101_200',), ('foo_201_300',)]
+
+        # Partitions created or removed by the database or other processes aren't in the cache
+        self.assertEqual(self.range_partition.children(start=50), ['foo_101_200', 'foo_201_300'])
+
+    def test_children_query_integer(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '100'
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.return_value = [
+            ('foo_m100_m1',), ('foo_0',), ('foo_1_100',), ('foo_101_200',), ('foo_201_300',)]
+
+        self.range_partition.mode = 'native'
+        self.assertEqual(self.range_partition.children_query(start=50, end=150).split('\n'), [
+            'SELECT * FROM ONLY foo_1_100 WHERE "bar" >= 50 AND "bar" <= 150',
+            'UNION ALL',
+            'SELECT * FROM ONLY foo_101_200 WHERE "bar" >= 50 AND "bar" <= 150',
+            'UNION ALL',
+            'SELECT * FROM ONLY "foo_default" WHERE "bar" >= 50 AND "bar" <= 150'])
+
+    def test_migrate(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.pks = ['id']
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.side_effect = [[(3,), (4,)], [(7,)]]
+        callback = mock.Mock()
+
+        self.assertEqual(self.range_partition.migrate(batch_size=2, after=[2], callback=callback), 3)
+        selects = [call[0][0] for call in self.range_partition.database.select_all.call_args_list]
+        moves = [call[0][0] for call in self.range_partition.database.execute.call_args_list]
+        self.assertIn('WHERE (id) > (2) ORDER BY id LIMIT 2', selects[0])
+        self.assertIn('WHERE (id) > (4) ORDER BY id LIMIT 2', selects[1])
+        self.assertIn('DELETE FROM ONLY "foo" WHERE (id) > (2) AND (id) <= (4) RETURNING *', moves[0])
+        self.assertIn('DELETE FROM ONLY "foo" WHERE (id) > (4) AND (id) <= (7) RETURNING *', moves[1])
+        self.assertEqual([call[0][0] for call in callback.call_args_list], [[4], [7]])
+
+    def test_migrate_native(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.pks = ['id']
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '100'
+        self.range_partition.mode = 'native'
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.side_effect = [[], [(3, 150), (4, None), (5, 250)], []]
+        self.range_partition.database.select_one.side_effect = [2, 1]
+
+        self.assertEqual(self.range_partition.migrate(batch_size=3), 3)
+        selects = [call[0][0] for call in self.range_partition.database.select_all.call_args_list]
+        counts = [call[0][0] for call in self.range_partition.database.select_one.call_args_list]
+        statements = [call[0][0] for call in self.range_partition.database.execute.call_args_list]
+        self.assertIn('NOT EXISTS(SELECT 1 FROM pg_inherits WHERE inhrelid = c.oid)', selects[0])
+        self.assertIn('SELECT id, "bar" FROM ONLY "foo_default"  ORDER BY id LIMIT 3', selects[1])
+        self.assertIn('SELECT COUNT(*) FROM ONLY "foo_default" WHERE "bar" >= 101 AND "bar" <= 200', counts[0])
+        self.assertEqual(len(statements), 2)
+
+        # Every partition is filled and attached by a single statement, so rows never disappear
+        for name, statement in zip(('foo_101_200', 'foo_201_300'), statements):
+            self.assertIn('CREATE TABLE {0}'.format(name), statement)
+            self.assertIn('INSERT INTO {0} SELECT * FROM moved'.format(name), statement)
+            self.assertIn('ATTACH PARTITION {0}'.format(name), statement)
+
+    def test_migrate_native_attaches_partitions_left_detached(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.pks = ['id']
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '100'
+        self.range_partition.mode = 'native'
+        self.range_partition.retention = None
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.side_effect = [[('foo_101_200',), ('foo_bar',), ('foo_empty',)], []]
+        self.range_partition.database.select_one.side_effect = [150, 350, None]
+
+        self.assertEqual(self.range_partition.migrate(after=[4]), 0)
+        statements = [call[0][0] for call in self.range_partition.database.execute.call_args_list]
+        self.assertEqual(len(statements), 1)
+        self.assertIn('ATTACH PARTITION foo_101_200', statements[0])
+
+    def test_migrate_ranges(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.pks = ['id']
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_all.return_value = [(1, 300)]
+
+        self.assertEqual(self.range_partition.migrate_ranges(1), [[None, None]])
+        self.assertEqual(self.range_partition.migrate_ranges(3), [[None, [100]], [[100], [200]], [[200], None]])
+        self.range_partition.pks = ['id', 'bar']
+        self.assertEqual(self.range_partition.migrate_ranges(3), [[None, None]])
+
+    def test_prune_raises_option_value_error(self):
+        self.range_partition.subtype = 'date'
+        self.range_partition.retention = '2 months'
+        self.range_partition.retention_action = 'foo'
+        self.assertRaises(OptionValueError, lambda: self.range_partition.prune())
+        self.range_partition.retention = 'foo'
+        self.range_partition.retention_action = 'drop'
+        self.range_partition.database = mock.Mock()
+        self.assertRaises(OptionValueError, lambda: self.range_partition.prune())
+
+    def test_precreate_integer(self):
+        self.range_partition.table = 'foo'
+        self.range_partition.column_name = 'bar'
+        self.range_partition.subtype = 'integer'
+        self.range_partition.constraint = '10'
+        self.range_partition.mode = 'native'
+        self.range_partition.pks = ['id']
+        self.range_partition.database = mock.Mock()
+        self.range_partition.database.select_one.side_effect = [15, False, False, False]
+        self.assertEqual(self.range_partition.precreate(until=35), ['foo_11_20', 'foo_21_30', 'foo_31_40'])
+        self.assertEqual(self.range_partition.database.execute.call_count, 3)
+
+    def test_precreate_raises_partition_range_subtype_error(self):
+        self.range_partition.subtype = 'string_firstchars'
+        self.assertRaises(PartitionRangeSubtypeError, lambda: self.range_partition.precreate())
+        self.range_partition.subtype = 'integer'
+        self.assertRaises(PartitionRangeSubtypeError, lambda: self.range_partition.precreate(
+            until=datetime.datetime(2014, 1, 1)))
+
+    def test_prepare_hash_creates_all_partitions(self):
+        partition = HashPartition(mock.Mock(__name__='Foo'), table='foo', column_value=1, column='bar', pk='id',
+                                  constraint='4')
+        partition.database = mock.Mock()
+        partition.prepare()
+        statements = [c[0][0] for c in partition.database.execute.call_args_list]
+        self.assertEqual(len(statements), 5)
+        self.assertIn("remainder := MOD(ABS(HASHTEXT(NEW.\"bar\"::TEXT)::BIGINT), 4);", statements[0])
+        self.assertIn('MOD(ABS(HASHTEXT("bar"::TEXT)::BIGINT), 4) = 3', statements[4])
+        self.assertTrue(partition.exists())
+
+    def test_create_missing_hash(self):
+        partition = HashPartition(mock.Mock(__name__='Foo'), table='foo', column_value=1, column='bar', pk='id',
+                                  constraint='4')
+        partition.database = mock.Mock()
+        self.assertEqual(partition.create_missing([1, 2, 3]), [])
+        self.assertFalse(partition.database.execute.called)
+
+    def test_prepare_list(self):
+        partition = MysqlListPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar',
+                                       pk='id', values={'eu': ['de', 'fr'], 'asia': ['cn']})
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [('de',), ('us',)]
+        partition.prepare()
+        statement = partition.database.execute.call_args[0][0]
+        self.assertIn('PARTITION BY LIST COLUMNS (bar)', statement)
+        self.assertIn("PARTITION foo_asia VALUES IN ('cn')", statement)
+        self.assertIn("PARTITION foo_eu VALUES IN ('de', 'fr')", statement)
+        self.assertIn("PARTITION foo_default VALUES IN (NULL, 'us')", statement)
+
+    def test_create_list_adds_value_to_default_partition(self):
+        partition = MysqlListPartition(mock.Mock(__name__='Foo'), table='foo', column_value='us', column='bar',
+                                       pk='id', values={'eu': ['de', 'fr']})
+        partition.database = mock.Mock()
+        partition.database.select_one.return_value = "NULL,'ca'"
+        partition.create()
+        statements = [call[0][0] for call in partition.database.execute.call_args_list]
+        self.assertEqual(statements[0], "DO GET_LOCK(MD5('foo.foo_default'), 3600);")
+        self.assertIn("PARTITION foo_default VALUES IN (NULL,'ca', 'us')", statements[1])
+        self.assertEqual(statements[2], "DO RELEASE_LOCK(MD5('foo.foo_default'));")
+
+    def test_create_list_skips_value_added_concurrently(self):
+        partition = MysqlListPartition(mock.Mock(__name__='Foo'), table='foo', column_value='us', column='bar',
+                                       pk='id', values={'eu': ['de', 'fr']})
+        partition.database = mock.Mock()
+        partition.database.select_one.return_value = "NULL,'us'"
+        self.assertEqual(partition.create(), [])
+        self.assertNotIn('REORGANIZE', ''.join(call[0][0] for call in partition.database.execute.call_args_list))
+
+    def test_create_missing_list_adds_every_value(self):
+        partition = MysqlListPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar',
+                                       pk='id', values={'eu': ['de', 'fr']})
+        partition.database = mock.Mock()
+        partition.database.select_one.side_effect = [False, False, "NULL"]
+        self.assertEqual(partition.create_missing(['us', 'de', 'ca', 'us']), ['foo_default'])
+        self.assertEqual(partition.database.execute.call_count, 3)
+        self.assertIn("VALUES IN (NULL, 'us', 'ca')", partition.database.execute.call_args_list[1][0][0])
+
+    def test_migrate_hash_native(self):
+        partition = HashPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id',
+                                  constraint='4', mode='native')
+        partition.database = mock.Mock()
+        self.assertEqual(partition.migrate_ranges(4), [[None, None]])
+        self.assertEqual(partition.migrate(), 0)
+        self.assertFalse(partition.database.method_calls)
+
+    def test_migrate_list_native(self):
+        partition = ListPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id',
+                                  values={'eu': ['de', 'fr']}, mode='native')
+        partition.database = mock.Mock()
+        self.assertEqual(partition.migrate_ranges(4), [[None, None]])
+        self.assertEqual(partition.migrate(), 0)
+        self.assertFalse(partition.database.method_calls)
+
+    def test_prepare_hash_native(self):
+        partition = HashPartition(mock.Mock(__name__='Foo'), table='foo', column_value=1, column='bar', pk='id',
+                                  constraint='4', mode='native')
+        partition.database = mock.Mock()
+        partition.prepare()
+        self.assertEqual(partition.database.execute.call_count, 1)
+        self.assertIn('PARTITION BY HASH ("bar")', partition.database.execute.call_args[0][0])
+        self.assertIn('MODULUS 4, REMAINDER %s', partition.database.execute.call_args[0][0])
+        self.assertIn('(LIKE "foo_unpartitioned" INCLUDING DEFAULTS', partition.database.execute.call_args[0][0])
+        self.assertIn('INCLUDING INDEXES', partition.database.execute.call_args[0][0])
+        self.assertNotIn('ADD PRIMARY KEY', partition.database.execute.call_args[0][0])
+
+    def test_prepare_hash_raises_partition_constraint_error(self):
+        partition = HashPartition(mock.Mock(__name__='Foo'), table='foo', column_value=1, column='bar', pk='id',
+                                  constraint='foo')
+        partition.database = mock.Mock()
+        self.assertRaises(PartitionConstraintError, lambda: partition.prepare())
+
+    def test_prepare_list_creates_all_partitions(self):
+        partition = ListPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id',
+                                  values={'eu': ['de', "f'r"], 'num': [1]})
+        partition.database = mock.Mock()
+        partition.prepare()
+        statements = [c[0][0] for c in partition.database.execute.call_args_list]
+        self.assertEqual(len(statements), 4)
+        self.assertIn("""WHEN NEW."bar" IN ('de', 'f''r') THEN""", statements[0])
+        self.assertIn("""tablename := 'foo_eu';""", statements[0])
+        self.assertIn("""CHECK ("bar" IN ('de', 'f''r'))""", statements[1])
+        self.assertIn("""CHECK ("bar" NOT IN ('de', 'f''r', 1))""", statements[3])
+        self.assertTrue(partition.exists())
+
+    def test_prepare_list_native(self):
+        partition = ListPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id',
+                                  values={'eu': ['de', 'fr']}, mode='native')
+        partition.database = mock.Mock()
+        partition.prepare()
+        statements = [c[0][0] for c in partition.database.execute.call_args_list]
+        self.assertEqual(len(statements), 2)
+        self.assertIn('PARTITION BY LIST ("bar")', statements[0])
+        self.assertIn('LIKE "foo_default" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING INDEXES', statements[1])
+        self.assertIn("""DELETE FROM "foo_default" WHERE "bar" IN ('de', 'fr')""", statements[1])
+        self.assertIn("""ATTACH PARTITION foo_eu FOR VALUES IN ('de', 'fr')""", statements[1])
+
+    def test__get_name_list(self):
+        partition = ListPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id',
+                                  values={'eu': ['de', 'fr'], 'Asia': ['cn']})
+
+        for value, name in ((None, 'foo_null'), ('fr', 'foo_eu'), ('cn', '"foo_Asia"'), ('us', 'foo_default')):
+            partition.column_value = value
+            self.assertEqual(partition._get_name(), name)
+
+    def test_prepare_list_raises_option_value_error(self):
+        partition = ListPartition(mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id',
+                                  values={'eu': []})
+        partition.database = mock.Mock()
+        self.assertRaises(OptionValueError, lambda: partition.prepare())
+
 
 @unittest.skipUnless(os.environ.get('DB') in ('mysql', 'all'), 'Not a MySQL build')
 class MysqlPartitionTestCase(BasePartitionTestCase, unittest.TestCase):
-    pass
+    def test_exists_uses_cache(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=datetime.datetime(2014, 12, 29), column='bar',
+            pk='id', constraint='month', subtype='date', cache=PartitionCache())
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [('foo_y2014m12',)]
+
+        for _ in range(3):
+            self.assertTrue(partition.exists())
+
+        self.assertEqual(partition.database.select_all.call_count, 1)
+        self.assertFalse(partition.database.select_one.called)
+
+        partition.column_value = datetime.datetime(2015, 1, 1)
+        partition.database.select_one.return_value = 0
+        self.assertFalse(partition.exists())
+        self.assertEqual(partition.database.select_one.call_count, 1)
+
+    def test_precreate_date(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date')
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [('foo_y2014m12',)]
+        partition.database.select_one.return_value = 'datetime'
+
+        with mock.patch('architect.databases.mysql.partition.datetime') as dt:
+            dt.datetime.now.return_value = datetime.datetime(2014, 12, 29)
+            self.assertEqual(partition.precreate(periods=1), ['foo_y2015m01'])
+
+        self.assertEqual(partition.database.execute.call_count, 1)
+        self.assertIn("TO_DAYS('2015-01-31 23:59:59') + 1", partition.database.execute.call_args[0][0])
+
+    def test_create_missing_single_statement(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', cache=PartitionCache())
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [('foo_y2014m12',)]
+        partition.database.select_one.return_value = 'datetime'
+        values = [datetime.datetime(2015, 2, 3), datetime.datetime(2014, 12, 1), datetime.datetime(2015, 1, 5),
+                  datetime.datetime(2015, 2, 7)]
+
+        self.assertEqual(partition.create_missing(values), ['foo_y2015m01', 'foo_y2015m02'])
+        self.assertEqual(partition.database.execute.call_count, 1)
+        sql = partition.database.execute.call_args[0][0]
+        self.assertEqual(sql.count('ADD PARTITION'), 1)
+        self.assertLess(sql.index('foo_y2015m01'), sql.index('foo_y2015m02'))
+        self.assertIn('foo_y2015m02', partition.cache)
+
+    def test_create_missing_cached(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', cache=PartitionCache())
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [('foo_y2014m12',)]
+
+        for _ in range(3):
+            self.assertEqual(partition.create_missing([datetime.datetime(2014, 12, 1)]), [])
+
+        # Catalog is queried only once to fill the cache
+        self.assertEqual(partition.database.select_all.call_count, 1)
+        self.assertFalse(partition.database.execute.called)
+
+    def test_prepare_maxvalue(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', mode='maxvalue')
+        partition.database = mock.Mock()
+        partition.database.select_one.return_value = 'datetime'
+        partition.prepare()
+        self.assertIn('PARTITION foo_max VALUES LESS THAN MAXVALUE', partition.database.execute.call_args[0][0])
+        partition.column_value = datetime.datetime(2014, 12, 29)
+        self.assertTrue(partition.exists())
+        self.assertIsNone(partition.create())
+
+    def test_precreate_maxvalue_splits_catch_all_partition(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', mode='maxvalue')
+        partition.database = mock.Mock()
+        partition.database.select_one.return_value = 'datetime'
+        partition.database.select_all.side_effect = [
+            [(datetime.datetime(2014, 10, 3), datetime.datetime(2014, 11, 5))],
+            [('foo_y0000m00',), ('foo_y2014m09',), ('foo_max',)],
+        ]
+
+        with mock.patch('architect.databases.mysql.partition.datetime') as dt:
+            dt.datetime.now.return_value = datetime.datetime(2014, 12, 29)
+            names = partition.precreate(periods=1)
+
+        self.assertEqual(names, ['foo_y2014m10', 'foo_y2014m11', 'foo_y2014m12', 'foo_y2015m01'])
+        statement = partition.database.execute.call_args[0][0]
+        self.assertIn('REORGANIZE PARTITION foo_max INTO', statement)
+        self.assertIn("PARTITION foo_y2014m10 VALUES LESS THAN (TO_DAYS('2014-10-31 23:59:59') + 1),", statement)
+        self.assertIn("PARTITION foo_y2015m01 VALUES LESS THAN (TO_DAYS('2015-01-31 23:59:59') + 1),", statement)
+
+    def test_create_missing_maxvalue(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', mode='maxvalue')
+        partition.database = mock.Mock()
+
+        self.assertEqual(partition.create_missing([datetime.datetime(2015, 1, 3)]), [])
+        self.assertFalse(partition.database.execute.called)
+
+    def test_range_columns(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', range_columns=True)
+        partition.database = mock.Mock()
+        partition.prepare()
+        statement = partition.database.execute.call_args[0][0]
+        self.assertIn('PARTITION BY RANGE COLUMNS (bar)', statement)
+        self.assertIn("PARTITION foo_y0000m00 VALUES LESS THAN ('1000-01-01')", statement)
+
+        partition.database.select_all.return_value = [('foo_y0000m00',)]
+        partition.column_value = datetime.datetime(2014, 12, 29, 10, 30)
+        partition.create()
+        statement = partition.database.execute.call_args[0][0]
+        self.assertIn("PARTITION foo_y2014m12 VALUES LESS THAN ('2015-01-01')", statement)
+        self.assertFalse(partition.database.select_one.called)
+
+    def test_prepare_integer(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='100',
+            subtype='integer')
+        partition.database = mock.Mock()
+        partition.prepare()
+        self.assertIn('PARTITION BY RANGE (bar)', partition.database.execute.call_args[0][0])
+        self.assertIn('PARTITION foo_0 VALUES LESS THAN (1)', partition.database.execute.call_args[0][0])
+        self.assertFalse(partition.database.select_one.called)
+
+    def test_get_name_integer(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='100',
+            subtype='integer')
+
+        for value, name in ((-5, 'foo_0'), (0, 'foo_0'), (1, 'foo_1_100'), (100, 'foo_1_100'), (101, 'foo_101_200')):
+            partition.column_value = value
+            self.assertEqual(partition._get_name(), name)
+
+        partition.constraint = 'foo'
+        self.assertRaises(PartitionConstraintError, lambda: partition._get_name())
+
+    def test_precreate_integer(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='100',
+            subtype='integer')
+        partition.database = mock.Mock()
+        partition.database.select_one.return_value = 950
+        partition.database.select_all.return_value = [('foo_0',), ('foo_1_100',), ('foo_901_1000',)]
+
+        self.assertEqual(partition.precreate(until=1150), ['foo_1001_1100', 'foo_1101_1200'])
+        statement = partition.database.execute.call_args[0][0]
+        self.assertIn('PARTITION foo_1001_1100 VALUES LESS THAN (1101),', statement)
+        self.assertIn('PARTITION foo_1101_1200 VALUES LESS THAN (1201)', statement)
+        self.assertRaises(PartitionRangeSubtypeError, lambda: partition.precreate(until=datetime.datetime(2014, 1, 1)))
+
+    def test_precreate_integer_maxvalue(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='100',
+            subtype='integer', mode='maxvalue')
+        partition.database = mock.Mock()
+        partition.database.select_one.return_value = None
+        partition.database.select_all.side_effect = [[(250, 320)], [('foo_0',), ('foo_1_100',), ('foo_max',)]]
+
+        self.assertEqual(partition.precreate(periods=1), ['foo_201_300', 'foo_301_400'])
+        self.assertIn('REORGANIZE PARTITION foo_max INTO', partition.database.execute.call_args[0][0])
+
+    def test_prune(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', mode='maxvalue', retention='90 days', retention_action='truncate')
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [
+            ('foo_y0000m00',), ('foo_y2014m08',), ('foo_y2014m09',), ('foo_y2014m10',), ('foo_max',)]
+
+        with mock.patch('architect.databases.mysql.partition.datetime') as dt:
+            dt.datetime.now.return_value = datetime.datetime(2014, 12, 29)
+            self.assertEqual(partition.prune(), ['foo_y2014m08'])
+
+        self.assertEqual(partition.database.execute.call_args[0][0],
+                         'ALTER TABLE foo TRUNCATE PARTITION foo_y2014m08;')
+        partition.retention_action = 'detach'
+        self.assertRaises(OptionValueError, lambda: partition.prune())
+
+    def test_children_query(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='100',
+            subtype='integer', mode='maxvalue')
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [('foo_0',), ('foo_1_100',), ('foo_101_200',), ('foo_max',)]
+
+        self.assertEqual(partition.children_query(start=150),
+                         'SELECT * FROM foo PARTITION (foo_101_200, foo_max) WHERE bar >= 150')
+        partition.mode = 'add'
+        self.assertEqual(partition.children_query(end=0), 'SELECT * FROM foo PARTITION (foo_0) WHERE bar <= 0')
+        self.assertEqual(partition.children_query(start=250), 'SELECT * FROM foo WHERE bar >= 250 AND FALSE')
+
+    def test_children_gap(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date')
+        partition.database = mock.Mock()
+        partition.database.select_all.return_value = [('foo_y2014m01',), ('foo_y2014m03',)]
+
+        # February rows are stored in the March partition, because there is no February partition
+        self.assertEqual(partition.children(start=datetime.datetime(2014, 2, 1), end=datetime.datetime(2014, 2, 28)),
+                         ['foo_y2014m03'])
+        self.assertEqual(partition.children(end=datetime.datetime(2014, 2, 28)), ['foo_y2014m01', 'foo_y2014m03'])
+        self.assertEqual(partition.children(end=datetime.datetime(2014, 3, 5)), ['foo_y2014m01', 'foo_y2014m03'])
+
+    def test_prepare_raises_partition_mode_error(self):
+        partition = MysqlRangePartition(
+            mock.Mock(__name__='Foo'), table='foo', column_value=None, column='bar', pk='id', constraint='month',
+            subtype='date', mode='foo')
+        partition.database = mock.Mock()
+        self.assertRaises(PartitionModeError, lambda: partition.prepare())
+
+    def test_prepare_hash(self):
+        partition = MysqlHashPartition(mock.Mock(__name__='Foo'), table='foo', column_value=1, column='bar', pk='id',
+                                       constraint='4')
+        partition.database = mock.Mock()
+
+        for column_type, function in (('int', 'HASH'), ('varchar', 'KEY')):
+            partition.database.select_one.return_value = column_type
+            partition.prepare()
+            self.assertIn('PARTITION BY {0} (bar) PARTITIONS 4;'.format(function),
+                          partition.database.execute.call_args[0][0])
+
+        self.assertTrue(partition.exists())
+
+    def test_create_missing_hash(self):
+        partition = MysqlHashPartition(mock.Mock(__name__='Foo'), table='foo', column_value=1, column='bar', pk='id',
+                                       constraint='4')
+        partition.database = mock.Mock()
+        self.assertEqual(partition.create_missing([1, 2, 3]), [])
+        self.assertFalse(partition.database.execute.called)
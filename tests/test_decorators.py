@@ -6,6 +6,7 @@ from . import unittest, mock
 
 from architect import install, uninstall
 from architect.orms.bases import BaseFeature
+from architect.orms.registry import registry
 
 
 class BaseDecoratorTestCase(object):
@@ -50,12 +51,25 @@ class InstallDecoratorTestCase(BaseDecoratorTestCase, unittest.TestCase):
         self.model = install('foo', orm='foo')(self.model)
         self.assertEqual(self.model.foo, 'foo')
 
-    def test_dynamically_changes_model_object(self):
+    def test_binds_features_to_model_object(self):
         self.model = install('foo', orm='foo')(self.model)
-        obj1 = self.model().architect.foo.model_obj
-        self.assertEqual(self.model.__dict__['architect'].map[self.model]['features']['foo'].model_obj, obj1)
-        obj2 = self.model().architect.foo.model_obj
-        self.assertEqual(self.model.__dict__['architect'].map[self.model]['features']['foo'].model_obj, obj2)
+        obj1, obj2 = self.model(), self.model()
+        feature1, feature2 = obj1.architect.foo, obj2.architect.foo
+        self.assertIs(feature1.model_obj, obj1)
+        self.assertIs(feature2.model_obj, obj2)
+        self.assertIsInstance(feature1, self.foo_feature)
+        self.assertIsNone(self.model.architect.foo.model_obj)
+        self.assertIsNone(self.model.__dict__['architect'].map[self.model]['features']['foo'].model_obj)
+
+    def test_bound_features_share_state(self):
+        self.model = install('foo', orm='foo')(self.model)
+        feature = self.model().architect.foo
+        feature.options['bar'] = 'baz'
+        feature.cache = 'cache'
+        self.assertEqual(self.model.architect.foo.options, {'bar': 'baz'})
+        self.assertEqual(self.model.architect.foo.cache, 'cache')
+        self.assertIs(type(feature), type(self.model().architect.foo))
+        self.assertNotIn(type(feature), registry['foo'].values())
 
     def test_raises_orm_error(self):
         from architect.exceptions import ORMError
@@ -46,6 +46,17 @@ class SQLiteDjangoPartitionTestCase(unittest.TestCase):
 
         self.assertTrue(object1.name, object2.name)
 
+    def test_connection_per_thread(self):
+        import threading
+        feature = SqliteRangeDateDay.architect.partition
+        cursors = []
+        thread = threading.Thread(target=lambda: cursors.append(feature.connection))
+        thread.start()
+        thread.join()
+
+        self.assertIs(feature.connection, feature.connection)
+        self.assertIsNot(feature.connection, cursors[0])
+
 
 @unittest.skipUnless(os.environ['DB'] in ('pgsql', 'all'), 'Not a PostgreSQL build')
 class PostgresqlDjangoPartitionTestCase(unittest.TestCase):
@@ -74,6 +85,46 @@ class PostgresqlDjangoPartitionTestCase(unittest.TestCase):
 
         self.assertTrue(object1.name, object2.name)
 
+    def test_range_date_day_partition_manager(self):
+        object1 = PgsqlRangeDateDay.objects.create(name='foo', created=datetime.datetime(2014, 4, 16, 18, 44, 23))
+        queryset = PgsqlRangeDateDay.objects.filter(
+            created__gte=datetime.datetime(2014, 4, 16), created__lt=datetime.datetime(2014, 4, 17))
+
+        self.assertIn('FROM ONLY test_rangedateday_y2014d106', str(queryset.query))
+        self.assertNotIn('test_rangedateday_y2014d105', str(queryset.query))
+        self.assertIn(object1.id, [obj.id for obj in queryset])
+        self.assertEqual(queryset.filter(name='foo').get(id=object1.id).name, 'foo')
+
+    def test_range_date_day_partition_manager_converts_values(self):
+        queryset = PgsqlRangeDateDay.objects.filter(created__gte='2014-04-16', created__lt=datetime.date(2014, 4, 17))
+
+        self.assertIn('FROM ONLY test_rangedateday_y2014d106', str(queryset.query))
+        self.assertNotIn('test_rangedateday_y2014d105', str(queryset.query))
+
+    def test_range_date_day_bulk_create_direct_insert(self):
+        PgsqlRangeDateDay.architect.partition.options['direct_insert'] = True
+        PgsqlRangeDateDay.objects.bulk_create([
+            PgsqlRangeDateDay(name='bulk', created=datetime.datetime(2014, 4, 20, 18, 44, 23)),
+            PgsqlRangeDateDay(name='bulk', created=datetime.datetime(2014, 4, 21, 18, 44, 23))])
+        del PgsqlRangeDateDay.architect.partition.options['direct_insert']
+
+        for name in ('test_rangedateday_y2014d110', 'test_rangedateday_y2014d111'):
+            objects = list(PgsqlRangeDateDay.objects.raw('SELECT * FROM {0} WHERE name = %s'.format(name), ['bulk']))
+            self.assertEqual(len(objects), 1)
+
+    def test_range_date_native_prune_detach(self):
+        PgsqlRangeDateNative.objects.create(name='old', created=datetime.datetime(2014, 4, 15, 18, 44, 23))
+        PgsqlRangeDateNative.objects.create(name='new', created=datetime.datetime.now())
+        names = PgsqlRangeDateNative.architect.partition.prune()
+        operation = PgsqlRangeDateNative.architect.operation
+
+        self.assertEqual([name.lower() for name in names], ['test_rangedatenative_y2014m04'])
+        self.assertFalse(operation.select_one(
+            "SELECT EXISTS(SELECT 1 FROM pg_inherits WHERE inhrelid = 'test_rangedatenative_y2014m04'::regclass);"))
+        self.assertEqual(operation.select_one('SELECT COUNT(*) FROM test_rangedatenative_y2014m04;'), 1)
+        self.assertEqual(PgsqlRangeDateNative.objects.filter(name='old').count(), 0)
+        self.assertEqual(PgsqlRangeDateNative.objects.filter(name='new').count(), 1)
+
     def test_range_date_day_null(self):
         object1 = PgsqlRangeDateDay.objects.create(name='foo')
         object2 = PgsqlRangeDateDay.objects.raw('SELECT * FROM TEST_rangedateday_null WHERE id = %s', [object1.id])[0]
@@ -253,6 +304,31 @@ class MysqlDjangoPartitionTestCase(unittest.TestCase):
 
         self.assertTrue(object1.name, object2.name)
 
+    def test_range_date_day_bulk_create(self):
+        MysqlRangeDateDay.objects.bulk_create([
+            MysqlRangeDateDay(name='bulk', created=datetime.datetime(2014, 5, 20, 18, 44, 23)),
+            MysqlRangeDateDay(name='bulk', created=datetime.datetime(2014, 5, 21, 18, 44, 23))])
+        objects = list(MysqlRangeDateDay.objects.raw(
+            'SELECT * FROM TEST_rangedateday PARTITION (TEST_rangedateday_y2014d140) WHERE name = %s', ['bulk']))
+
+        self.assertEqual(len(objects), 1)
+
+    def test_hash_bulk_create(self):
+        objects = [MysqlHash(name='bulk', num=num) for num in range(1, 9)]
+        MysqlHash.objects.bulk_create(objects)
+
+        self.assertEqual(MysqlHash.objects.filter(name='bulk').count(), 8)
+
+    def test_hash_bulk_update(self):
+        MysqlHash.objects.bulk_create([MysqlHash(name='update', num=num) for num in range(11, 15)])
+        objects = list(MysqlHash.objects.filter(name='update'))
+
+        for obj in objects:
+            obj.num += 100
+
+        MysqlHash.objects.bulk_update(objects, ['num'])
+        self.assertEqual(MysqlHash.objects.filter(name='update', num__gt=100).count(), 4)
+
     def test_range_date_week(self):
         object1 = MysqlRangeDateWeek.objects.create(name='foo', created=datetime.datetime(2014, 4, 15, 18, 44, 23))
         object2 = MysqlRangeDateWeek.objects.raw('SELECT * FROM TEST_rangedateweek WHERE id = %s', [object1.id])[0]
@@ -192,6 +192,29 @@ class MysqlPeeweePartitionTestCase(unittest.TestCase):
 
         self.assertTrue(object1.name, object2.name)
 
+    def test_range_date_day_insert_many(self):
+        rows = ({'name': 'many', 'created': datetime.datetime(2014, 7, day, 18, 44, 23)} for day in range(1, 4))
+        count = MysqlRangeDateDay.architect.partition.insert_many(rows, chunk_size=2)
+        objects = list(MysqlRangeDateDay.raw(
+            'SELECT * FROM TEST_rangedateday PARTITION (TEST_rangedateday_y2014d184) WHERE name = %s', 'many'))
+
+        self.assertEqual(count, 3)
+        self.assertEqual(len(objects), 1)
+
+    def test_hash_insert_many(self):
+        count = MysqlHash.architect.partition.insert_many(
+            ({'name': 'many', 'num': num} for num in range(1, 9)), chunk_size=3)
+
+        self.assertEqual(count, 8)
+        self.assertEqual(MysqlHash.select().where(MysqlHash.name == 'many').count(), 8)
+
+    def test_hash_insert_from(self):
+        MysqlHash.architect.partition.insert_many({'name': 'source', 'num': num} for num in range(1, 5))
+        query = MysqlHash.select(MysqlHash.name, MysqlHash.num + 100).where(MysqlHash.name == 'source')
+        MysqlHash.architect.partition.insert_from(query, [MysqlHash.name, MysqlHash.num])
+
+        self.assertEqual(MysqlHash.select().where(MysqlHash.num > 100).count(), 4)
+
     def test_range_date_week(self):
         object1 = MysqlRangeDateWeek.create(name='foo', created=datetime.datetime(2014, 4, 15, 18, 44, 23))
         object2 = list(MysqlRangeDateWeek.raw('SELECT * FROM TEST_rangedateweek WHERE id = %s', object1.id))[0]
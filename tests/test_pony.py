@@ -240,6 +240,25 @@ class MysqlPonyPartitionTestCase(unittest.TestCase):
 
         self.assertTrue(object1.name, object2.name)
 
+    def test_range_date_day_create_many(self):
+        with db_session:
+            objects = MysqlRangeDateDay.architect.partition.create_many(
+                {'name': 'many', 'created': datetime.datetime(2014, 8, day, 18, 44, 23)} for day in range(1, 3))
+            commit()
+            object2 = objects[1]
+            object1 = MysqlRangeDateDay.get_by_sql(
+                'SELECT * FROM TEST_rangedateday PARTITION (TEST_rangedateday_y2014d214) WHERE id = $object2.id')
+
+        self.assertEqual(object1.name, 'many')
+
+    def test_hash_create_many(self):
+        with db_session:
+            objects = MysqlHash.architect.partition.create_many({'name': 'many', 'num': num} for num in range(1, 9))
+            commit()
+
+        self.assertEqual(len(objects), 8)
+        self.assertTrue(all(obj.id is not None for obj in objects))
+
     def test_range_date_week(self):
         with db_session:
             object1 = MysqlRangeDateWeek(name='foo', created=datetime.datetime(2014, 4, 15, 18, 44, 23))
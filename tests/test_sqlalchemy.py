@@ -6,7 +6,7 @@ import os
 import sys
 import datetime
 
-from . import unittest, capture
+from . import unittest, mock, capture
 
 if not os.environ.get('SQLALCHEMY') or not os.environ.get('DB'):
     raise unittest.SkipTest('Not a SQLAlchemy build')
@@ -38,6 +38,11 @@ class SQLiteSqlAlchemyPartitionTestCase(unittest.TestCase):
         SqliteRangeDateDay.metadata.bind = None
         SqliteRangeDateDay.architect.partition.options['db'] = url
 
+    def test_engine_is_created_once(self):
+        connection = SqliteRangeDateDay.architect.partition.connection
+        self.assertIs(connection, SqliteRangeDateDay.architect.partition.connection)
+        self.assertIs(connection, SqliteRangeDateDay.architect.operation.connection)
+
     def test_raises_db_not_provided_error(self):
         from architect.exceptions import OptionNotSetError
 
@@ -415,6 +420,60 @@ class MysqlSqlAlchemyPartitionTestCase(unittest.TestCase):
 
         self.assertTrue(object1.name, object2.name)
 
+    def test_range_date_day_flush(self):
+        self.session.add_all([
+            MysqlRangeDateDay(name='flush', created=datetime.datetime(2014, 6, 1, 18, 44, 23)),
+            MysqlRangeDateDay(name='flush', created=datetime.datetime(2014, 6, 2, 18, 44, 23))])
+        self.session.commit()
+
+        objects = self.session.query(MysqlRangeDateDay).from_statement(
+            text('SELECT * FROM TEST_rangedateday PARTITION (TEST_rangedateday_y2014d153) WHERE name = :name')
+        ).params(name='flush').all()
+
+        self.assertEqual(len(objects), 1)
+
+    def test_range_date_day_flush_uses_cache(self):
+        from architect.databases.mysql.partition import Partition
+        self.session.add(MysqlRangeDateDay(name='cached', created=datetime.datetime(2014, 6, 5, 18, 44, 23)))
+        self.session.commit()
+
+        with mock.patch.object(Partition, 'names', autospec=True, side_effect=Partition.names) as catalog:
+            for hour in range(3):
+                self.session.add(MysqlRangeDateDay(name='cached', created=datetime.datetime(2014, 6, 5, hour)))
+                self.session.commit()
+
+        # Partition is already known, so repeated flushes don't query the catalog
+        self.assertEqual(catalog.call_count, 0)
+
+    def test_range_date_day_insert(self):
+        self.session.execute(MysqlRangeDateDay.architect.partition.insert([
+            {'name': 'insert', 'created': datetime.datetime(2014, 6, 10, 18, 44, 23)},
+            {'name': 'insert', 'created': datetime.datetime(2014, 6, 11, 18, 44, 23)}]))
+        MysqlRangeDateDay.architect.partition.bulk_insert_mappings(self.session, [
+            {'name': 'mappings', 'created': datetime.datetime(2014, 6, 12, 18, 44, 23)}])
+        self.session.commit()
+
+        objects = self.session.query(MysqlRangeDateDay).from_statement(
+            text('SELECT * FROM TEST_rangedateday PARTITION (TEST_rangedateday_y2014d163) WHERE name = :name')
+        ).params(name='mappings').all()
+
+        self.assertEqual(len(objects), 1)
+
+    def test_hash_flush(self):
+        self.session.add_all([MysqlHash(name='flush', num=num) for num in range(1, 9)])
+        self.session.commit()
+
+        self.assertEqual(self.session.query(MysqlHash).filter_by(name='flush').count(), 8)
+
+    def test_hash_insert(self):
+        self.session.execute(MysqlHash.architect.partition.insert([
+            {'name': 'insert', 'num': num} for num in range(1, 5)]))
+        MysqlHash.architect.partition.bulk_insert_mappings(self.session, [
+            {'name': 'insert', 'num': num} for num in range(5, 9)])
+        self.session.commit()
+
+        self.assertEqual(self.session.query(MysqlHash).filter_by(name='insert').count(), 8)
+
     def test_range_date_week(self):
         object1 = MysqlRangeDateWeek(name='foo', created=datetime.datetime(2014, 4, 15, 18, 44, 23))
         self.session.add(object1)
@@ -208,6 +208,20 @@ class MysqlSqlObjectPartitionTestCase(unittest.TestCase):
 
         self.assertTrue(object1.name, object2[1])
 
+    def test_range_date_day_create_many(self):
+        objects = MysqlRangeDateDay.architect.partition.create_many(
+            {'name': 'many', 'created': datetime.datetime(2014, 8, day, 18, 44, 23)} for day in range(1, 3))
+        object1 = MysqlRangeDateDay._connection.queryOne(
+            'SELECT * FROM test_rangedateday PARTITION (test_rangedateday_y2014d214) WHERE id = %s' % objects[1].id)
+
+        self.assertEqual(object1[1], 'many')
+
+    def test_hash_create_many(self):
+        objects = MysqlHash.architect.partition.create_many({'name': 'many', 'num': num} for num in range(1, 9))
+
+        self.assertEqual(len(objects), 8)
+        self.assertEqual(MysqlHash.select(MysqlHash.q.name == 'many').count(), 8)
+
     def test_range_date_week(self):
         object1 = MysqlRangeDateWeek(name='foo', created=datetime.datetime(2014, 4, 15, 18, 44, 23))
         object2 = MysqlRangeDateWeek._connection.queryOne(